@@ -0,0 +1,52 @@
+"""Micro-benchmarks for UPath construction and derivation
+
+Reports paths/sec for constructing paths from strings, joining via `/`,
+and deriving paths via `.parent` and `.with_name()` for a local, an
+in-memory and an s3 path. No filesystem access is performed.
+
+Usage:
+    python dev/benchmarks/bench_construction.py [--number N] [--repeat R]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import timeit
+from collections.abc import Callable
+
+from upath import UPath
+
+URLPATHS = {
+    "local": os.path.join(tempfile.gettempdir(), "a", "b", "c", "file.txt"),
+    "memory": "memory:///a/b/c/file.txt",
+    "s3": "s3://bucket/a/b/c/file.txt",
+}
+
+
+def benchmarks(urlpath: str) -> dict[str, Callable[[], object]]:
+    pth = UPath(urlpath)
+    return {
+        "UPath(str)": lambda: UPath(urlpath),
+        "/": lambda: pth / "other.txt",
+        ".parent": lambda: pth.parent,
+        ".with_name": lambda: pth.with_name("other.txt"),
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    print(f"{'protocol':<10} {'operation':<12} {'paths/sec':>12}")
+    for name, urlpath in URLPATHS.items():
+        for op, func in benchmarks(urlpath).items():
+            best = min(timeit.repeat(func, number=args.number, repeat=args.repeat))
+            print(f"{name:<10} {op:<12} {args.number / best:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
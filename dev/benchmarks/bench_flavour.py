@@ -0,0 +1,75 @@
+"""Benchmark the specialised flavours against the generic wrapped flavour
+
+Runs a parse-heavy workload (stripping, splitting, joining and splitting
+off drives and roots, and walking up to the anchor via repeated splits)
+over a set of paths for a posix-like, a netloc-anchored and a local
+protocol, and reports the time per workload iteration for both the
+flavour returned by `WrappedFileSystemFlavour.from_protocol` and a
+generic `WrappedFileSystemFlavour` with the same configuration.
+
+Usage:
+    python dev/benchmarks/bench_flavour.py [--number N] [--repeat R]
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+from collections.abc import Callable
+
+from upath._flavour import WrappedFileSystemFlavour
+
+PATHS = {
+    "memory": [f"/dir{i % 10}/sub{i % 7}/file{i}.txt" for i in range(200)],
+    "s3": [f"bucket/dir{i % 10}/sub{i % 7}/file{i}.txt" for i in range(200)],
+    "https": [f"https://example.com/dir{i % 10}/file{i}.txt" for i in range(200)],
+    "file": [f"/tmp/dir{i % 10}/sub{i % 7}/file{i}.txt" for i in range(200)],
+}
+
+
+def generic_flavour(flavour: WrappedFileSystemFlavour) -> WrappedFileSystemFlavour:
+    return WrappedFileSystemFlavour(
+        flavour._spec,
+        netloc_is_anchor=flavour.netloc_is_anchor,
+        supports_empty_parts=flavour.supports_empty_parts,
+        meaningful_trailing_slash=flavour.has_meaningful_trailing_slash,
+        root_marker_override=flavour.root_marker_override,
+    )
+
+
+def workload(flavour: WrappedFileSystemFlavour, paths: list[str]) -> Callable[[], None]:
+    def run() -> None:
+        for path in paths:
+            flavour.isabs(path)
+            flavour.splitroot(path)
+            flavour.join(path, "other.txt")
+            head, tail = flavour.split(path)
+            while tail:
+                head, tail = flavour.split(head)
+
+    return run
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    print(f"{'protocol':<10} {'generic ms':>12} {'specialised ms':>16} {'speedup':>8}")
+    for protocol, paths in PATHS.items():
+        specialised = WrappedFileSystemFlavour.from_protocol(protocol)
+        timings = []
+        for flavour in (generic_flavour(specialised), specialised):
+            func = workload(flavour, paths)
+            best = min(timeit.repeat(func, number=args.number, repeat=args.repeat))
+            timings.append(best / args.number * 1000)
+        generic_ms, specialised_ms = timings
+        print(
+            f"{protocol:<10} {generic_ms:>12.2f} {specialised_ms:>16.2f}"
+            f" {generic_ms / specialised_ms:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
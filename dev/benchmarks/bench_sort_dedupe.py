@@ -0,0 +1,67 @@
+"""Benchmark sorting and deduplicating a large number of UPaths
+
+Builds N paths (with every path occurring twice) below a local, an
+in-memory and an s3 base path, then reports the time it takes to sort
+them and to deduplicate them via a set. Both operations are dominated
+by `__hash__`, `__eq__` and `__lt__`, which rely on the derived string
+representations of the paths. No filesystem access is performed.
+
+Usage:
+    python dev/benchmarks/bench_sort_dedupe.py [--number N] [--repeat R]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from collections.abc import Callable
+
+from upath import UPath
+
+BASE_URLPATHS = {
+    "local": os.path.join(tempfile.gettempdir(), "bench"),
+    "memory": "memory:///bench",
+    "s3": "s3://bucket/bench",
+}
+
+
+def make_paths(urlpath: str, number: int) -> list[UPath]:
+    base = UPath(urlpath)
+    unique = [base / f"dir{i % 1000}" / f"file{i}.txt" for i in range(number // 2)]
+    paths = unique + [base / p.parent.name / p.name for p in unique]
+    random.Random(0).shuffle(paths)
+    return paths
+
+
+def timed(func: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    print(f"{'protocol':<10} {'operation':<12} {'seconds':>10}")
+    for name, urlpath in BASE_URLPATHS.items():
+        paths = make_paths(urlpath, args.number)
+        operations = {
+            "sorted": lambda paths=paths: sorted(paths),
+            "set": lambda paths=paths: set(paths),
+        }
+        for op, func in operations.items():
+            best = timed(func, args.repeat)
+            print(f"{name:<10} {op:<12} {best:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Generator
+from collections.abc import Iterable
+from collections.abc import Sequence
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import Future
+from concurrent.futures import wait
+from contextlib import closing
+from typing import Any
+
+from fsspec import AbstractFileSystem
+
+__all__ = [
+    "call_concurrently",
+    "cat_concurrently",
+    "cat_ranges_concurrently",
+    "coalesce_ranges",
+    "rm_batched",
+    "run_concurrently",
+    "split_ranges",
+]
+
+# a call of `fs.<method>(*args, **kwargs)`
+_Call = tuple[AbstractFileSystem, str, tuple[Any, ...], dict[str, Any]]
+
+
+def run_concurrently(
+    calls: Iterable[_Call],
+    max_concurrency: int,
+) -> Generator[tuple[int, Any], None, None]:
+    """call `fs.<method>(*args, **kwargs)` concurrently, yielding (index, result)
+
+    On async filesystems the `_<method>` coroutine is scheduled on the
+    filesystem's event loop, so that at most `max_concurrency` calls are
+    in flight at any time. On sync filesystems the calls are made one by
+    one in the calling thread, as most of them are not safe to use from
+    multiple threads. Results are yielded as the calls complete, and
+    exceptions are yielded as results. Closing the iterator cancels all
+    pending calls.
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be >= 1")
+
+    def submit(
+        fs: AbstractFileSystem,
+        method: str,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> Future[Any]:
+        if getattr(fs, "async_impl", False) and not fs.asynchronous:
+            coro = getattr(fs, f"_{method}")(*args, **kwargs)
+            return asyncio.run_coroutine_threadsafe(coro, fs.loop)
+        future: Future[Any] = Future()
+        try:
+            future.set_result(getattr(fs, method)(*args, **kwargs))
+        except Exception as err:
+            future.set_exception(err)
+        return future
+
+    todo = enumerate(calls)
+    pending: dict[Future[Any], int] = {}
+    try:
+        while True:
+            for index, (fs, method, args, kwargs) in todo:
+                pending[submit(fs, method, args, kwargs)] = index
+                if len(pending) >= max_concurrency:
+                    break
+            if not pending:
+                return
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = pending.pop(future)
+                try:
+                    result = future.result()
+                except Exception as err:
+                    result = err
+                yield index, result
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def call_concurrently(
+    method: str,
+    items: Iterable[tuple[AbstractFileSystem, str]],
+    max_concurrency: int,
+) -> Generator[tuple[int, Any], None, None]:
+    """call `fs.<method>(path)` concurrently, yielding (index, result)"""
+    calls: Iterable[_Call] = ((fs, method, (path,), {}) for fs, path in items)
+    return run_concurrently(calls, max_concurrency)
+
+
+def cat_concurrently(
+    items: Iterable[tuple[AbstractFileSystem, str]],
+    max_concurrency: int,
+) -> Generator[tuple[int, Any], None, None]:
+    """read files concurrently, yielding (index, contents) as they complete"""
+    return call_concurrently("cat_file", items, max_concurrency)
+
+
+def split_ranges(size: int, range_size: int) -> list[tuple[int, int]]:
+    """split `size` bytes into (start, end) ranges of `range_size` bytes"""
+    if range_size < 1:
+        raise ValueError("range_size must be >= 1")
+    return [
+        (start, min(start + range_size, size)) for start in range(0, size, range_size)
+    ]
+
+
+def coalesce_ranges(
+    ranges: Sequence[tuple[int, int]],
+    max_gap: int,
+) -> list[tuple[int, int, list[int]]]:
+    """merge (start, end) ranges that are at most `max_gap` bytes apart
+
+    Returns (start, end, indices) blocks, where `indices` are the indices
+    of the ranges covered by the block. Empty ranges are skipped.
+    """
+    blocks: list[tuple[int, int, list[int]]] = []
+    for index in sorted(range(len(ranges)), key=ranges.__getitem__):
+        start, end = ranges[index]
+        if end <= start:
+            continue
+        elif blocks and start <= blocks[-1][1] + max_gap:
+            block_start, block_end, indices = blocks[-1]
+            blocks[-1] = (block_start, max(block_end, end), indices)
+            indices.append(index)
+        else:
+            blocks.append((start, end, [index]))
+    return blocks
+
+
+def cat_ranges_concurrently(
+    fs: AbstractFileSystem,
+    path: str,
+    ranges: Sequence[tuple[int, int]],
+    max_concurrency: int,
+    exact: bool = True,
+) -> Generator[tuple[int, bytes], None, None]:
+    """read byte ranges of a file concurrently, yielding (index, data)
+
+    Raises the first error. If `exact` is True, an OSError is raised if a
+    range could not be read completely, i.e. because the file was
+    truncated in the meantime. Servers that ignore range requests return
+    the whole file, in which case the range is sliced from it.
+    """
+    calls = (
+        (fs, "cat_file", (path,), {"start": start, "end": end}) for start, end in ranges
+    )
+    with closing(run_concurrently(calls, max_concurrency)) as completed:
+        for index, result in completed:
+            if isinstance(result, Exception):
+                raise result
+            start, end = ranges[index]
+            if len(result) > end - start:
+                result = result[start:end]
+            if exact and len(result) != end - start:
+                raise OSError(
+                    f"expected {end - start} bytes at offset {start} of {path!r},"
+                    f" got {len(result)}"
+                )
+            yield index, result
+
+
+def rm_batched(
+    fs: AbstractFileSystem,
+    paths: Sequence[str],
+    batch_size: int,
+) -> list[Exception | None]:
+    """remove files in batches of `batch_size` paths per `fs.rm` call
+
+    Backends like s3fs and gcsfs map a list of paths to a single bulk
+    delete request. If a batch fails, its paths are removed one by one
+    to report the error for each path.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be >= 1")
+    results: list[Exception | None] = []
+    for start in range(0, len(paths), batch_size):
+        batch = list(paths[start : start + batch_size])
+        try:
+            fs.rm(batch, recursive=False)
+        except Exception:
+            for path in batch:
+                try:
+                    fs.rm(path, recursive=False)
+                except Exception as err:
+                    results.append(err)
+                else:
+                    results.append(None)
+        else:
+            results.extend([None] * len(batch))
+    return results
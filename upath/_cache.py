@@ -0,0 +1,313 @@
+from __future__ import annotations
+
+import threading
+import weakref
+from collections import OrderedDict
+from collections.abc import Iterator
+from collections.abc import Mapping
+from collections.abc import Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import monotonic
+from typing import Any
+from typing import NamedTuple
+
+from fsspec import AbstractFileSystem
+
+from upath._pool import _freeze
+
+__all__ = [
+    "CacheInfo",
+    "ListingCache",
+    "DEFAULT_LISTING_CACHE",
+    "get_listing_cache",
+    "invalidate_listing_caches",
+    "use_listing_cache",
+]
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+def _fs_key(fs: AbstractFileSystem) -> Any:
+    """return the key for entries of fs or None if they can't be cached
+
+    Like the filesystem pool, entries are keyed on the filesystem class
+    and its storage_options, but they are shared across threads.
+    """
+    try:
+        return type(fs), _freeze(fs.storage_options)
+    except TypeError:
+        return None
+
+
+def _normalize(fs: AbstractFileSystem, path: str) -> str:
+    # note: the root "/" is normalized to "", the parent of "/name"
+    return path.rstrip(fs.sep)
+
+
+# entry kinds and the marker for paths known to be missing
+_KINDS = ("info", "listing", "missing")
+_MISSING = object()
+
+# all listing caches, so that writes invalidate caches of other contexts too
+_LISTING_CACHES: weakref.WeakSet[ListingCache] = weakref.WeakSet()
+
+
+class ListingCache:
+    """a bounded, thread-safe cache of fsspec info dicts and listings
+
+    Entries expire `ttl` seconds after they were stored, or never if
+    `ttl` is None. When more than `maxsize` entries are stored, the least
+    recently used entries are evicted. The info of a path is also served
+    from the cached listing of its parent directory.
+
+    If `negative_ttl` is not None, failed lookups are cached as well, and
+    a path missing from the cached listing of its parent is reported as
+    missing, for `negative_ttl` seconds after they were stored.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 4096,
+        ttl: float | None = 30.0,
+        negative_ttl: float | None = None,
+    ) -> None:
+        if maxsize < 0:
+            raise ValueError("maxsize must be >= 0")
+        if ttl is not None and ttl < 0:
+            raise ValueError("ttl must be >= 0")
+        if negative_ttl is not None and negative_ttl < 0:
+            raise ValueError("negative_ttl must be >= 0")
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._negative_ttl = negative_ttl
+        self._entries: OrderedDict[tuple[Any, str, str], tuple[float, Any]]
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        _LISTING_CACHES.add(self)
+
+    @property
+    def negative_ttl(self) -> float | None:
+        return self._negative_ttl
+
+    def _get(self, key: tuple[Any, str, str]) -> Any:
+        # must be called with the lock held
+        try:
+            stored, value = self._entries[key]
+        except KeyError:
+            return None
+        ttl = self._negative_ttl if key[1] == "missing" else self._ttl
+        if ttl is not None and stored + ttl < monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def _lookup(self, fs_key: Any, sep: str, path: str) -> Any:
+        # must be called with the lock held, returns _MISSING for paths
+        # known to be missing and None for unknown paths
+        info = self._get((fs_key, "info", path))
+        if info is not None:
+            return info
+        if self._negative_ttl is None:
+            missing = False
+        else:
+            missing = self._get((fs_key, "missing", path)) is not None
+        if missing:
+            return _MISSING
+        parent = path.rpartition(sep)[0]
+        key = (fs_key, "listing", parent)
+        listing = self._get(key)
+        if listing is None:
+            return None
+        info = listing.get(path)
+        if info is not None:
+            return info
+        if self._negative_ttl is None:
+            return None
+        elif self._entries[key][0] + self._negative_ttl < monotonic():
+            return None
+        return _MISSING
+
+    def _put(self, key: tuple[Any, str, str], value: Any) -> None:
+        if not self._maxsize:
+            return
+        with self._lock:
+            self._entries[key] = (monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def get_info(
+        self,
+        fs: AbstractFileSystem,
+        path: str,
+    ) -> Mapping[str, Any] | None:
+        """return the cached info of path or None"""
+        fs_key = _fs_key(fs)
+        if fs_key is None:
+            return None
+        with self._lock:
+            info = self._lookup(fs_key, fs.sep, _normalize(fs, path))
+            if info is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            return None if info is _MISSING else info
+
+    def get_listing(
+        self,
+        fs: AbstractFileSystem,
+        path: str,
+    ) -> list[Mapping[str, Any]] | None:
+        """return the cached detailed listing of directory path or None"""
+        fs_key = _fs_key(fs)
+        if fs_key is None:
+            return None
+        path = _normalize(fs, path)
+        with self._lock:
+            listing = self._get((fs_key, "listing", path))
+            if listing is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            return list(listing.values())
+
+    def put_info(
+        self,
+        fs: AbstractFileSystem,
+        path: str,
+        info: Mapping[str, Any],
+    ) -> None:
+        """store the info of path"""
+        fs_key = _fs_key(fs)
+        if fs_key is not None:
+            self._put((fs_key, "info", _normalize(fs, path)), info)
+
+    def put_missing(self, fs: AbstractFileSystem, path: str) -> None:
+        """store that path does not exist, if negative caching is enabled"""
+        fs_key = _fs_key(fs)
+        if fs_key is not None and self._negative_ttl is not None:
+            self._put((fs_key, "missing", _normalize(fs, path)), True)
+
+    def put_listing(
+        self,
+        fs: AbstractFileSystem,
+        path: str,
+        listing: Sequence[Mapping[str, Any]],
+    ) -> None:
+        """store the detailed listing of directory path"""
+        fs_key = _fs_key(fs)
+        if fs_key is not None:
+            entries = {_normalize(fs, info["name"]): info for info in listing}
+            self._put((fs_key, "listing", _normalize(fs, path)), entries)
+
+    def info(self, fs: AbstractFileSystem, path: str) -> Mapping[str, Any]:
+        """return the info of path, calling fs.info on a cache miss"""
+        fs_key = _fs_key(fs)
+        if fs_key is None:
+            return fs.info(path)
+        with self._lock:
+            info = self._lookup(fs_key, fs.sep, _normalize(fs, path))
+            if info is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        if info is _MISSING:
+            raise FileNotFoundError(path)
+        elif info is None:
+            try:
+                info = fs.info(path)
+            except FileNotFoundError:
+                self.put_missing(fs, path)
+                raise
+            self.put_info(fs, path, info)
+        return info
+
+    def invalidate(
+        self,
+        fs: AbstractFileSystem,
+        path: str,
+        *,
+        recursive: bool = False,
+    ) -> None:
+        """drop the entries of path, its ancestors and optionally its subtree"""
+        if not self._entries:
+            return
+        fs_key = _fs_key(fs)
+        if fs_key is None:
+            return
+        sep = fs.sep
+        path = _normalize(fs, path)
+        with self._lock:
+            ancestor = path
+            while True:
+                for kind in _KINDS:
+                    self._entries.pop((fs_key, kind, ancestor), None)
+                if sep not in ancestor:
+                    break
+                ancestor = ancestor.rpartition(sep)[0]
+            for kind in _KINDS:
+                self._entries.pop((fs_key, kind, ""), None)
+            if recursive:
+                prefix = f"{path}{sep}"
+                stale = [
+                    key
+                    for key in self._entries
+                    if key[0] == fs_key and key[2].startswith(prefix)
+                ]
+                for key in stale:
+                    del self._entries[key]
+
+    def cache_info(self) -> CacheInfo:
+        """report cache statistics"""
+        with self._lock:
+            return CacheInfo(
+                self._hits, self._misses, self._maxsize, len(self._entries)
+            )
+
+    def clear(self) -> None:
+        """remove all entries and reset the statistics"""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = 0
+
+
+DEFAULT_LISTING_CACHE = ListingCache()
+
+_ACTIVE_LISTING_CACHE: ContextVar[ListingCache | None] = ContextVar(
+    "upath_listing_cache", default=None
+)
+
+
+def get_listing_cache() -> ListingCache | None:
+    """return the listing cache enabled in the current context"""
+    return _ACTIVE_LISTING_CACHE.get()
+
+
+@contextmanager
+def use_listing_cache(cache: ListingCache | None) -> Iterator[ListingCache | None]:
+    """enable cache, or disable caching if None, in the current context"""
+    token = _ACTIVE_LISTING_CACHE.set(cache)
+    try:
+        yield cache
+    finally:
+        _ACTIVE_LISTING_CACHE.reset(token)
+
+
+def invalidate_listing_caches(
+    fs: AbstractFileSystem,
+    path: str,
+    *,
+    recursive: bool = False,
+) -> None:
+    """drop the entries of path from all listing caches"""
+    for cache in list(_LISTING_CACHES):
+        cache.invalidate(fs, path, recursive=recursive)
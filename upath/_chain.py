@@ -34,6 +34,10 @@ __all__ = [
 ]
 
 
+# filesystems that pass through the path to their target filesystem
+_PASSTHROUGH_PROTOCOLS = frozenset({"blockcache", "filecache", "simplecache"})
+
+
 class ChainSegment(NamedTuple):
     path: str | None  # support for path passthrough (i.e. simplecache)
     protocol: str
@@ -46,6 +50,7 @@ class Chain:
     __slots__ = (
         "_segments",
         "_index",
+        "_path_index_cached",
     )
 
     def __init__(
@@ -57,6 +62,10 @@ class Chain:
             raise ValueError("index must be between 0 and len(segments)")
         self._segments = segments
         self._index = index
+        self._path_index_cached: int | None = None
+
+    def __len__(self) -> int:
+        return len(self._segments)
 
     def __repr__(self) -> str:
         args = ", ".join(map(repr, self._segments))
@@ -70,8 +79,12 @@ class Chain:
 
     @property
     def _path_index(self) -> int:
+        # chains are immutable, so the index can be cached
+        if self._path_index_cached is not None:
+            return self._path_index_cached
         for idx, segment in enumerate(self._segments[self._index :], start=self._index):
             if segment.path is not None:
+                self._path_index_cached = idx
                 return idx
         raise IndexError("No target path found")
 
@@ -190,6 +203,7 @@ class FSSpecChainParser:
         *,
         protocol: str | None = None,
         storage_options: dict[str, Any] | None = None,
+        url_parsed: bool = False,
     ) -> list[ChainSegment]:
         """implements same behavior as fsspec.core._un_chain
 
@@ -197,6 +211,9 @@ class FSSpecChainParser:
         1. it sets the urlpath to None for upstream filesystems that passthrough
         2. it checks against the known protocols for exact matches
 
+        If `url_parsed` is True, `protocol` is the already detected protocol
+        of `path` and `storage_options` already include the options encoded
+        in the url, so that they are not parsed again for single segments.
         """
         if _deprecated_storage_options is not UNSET_DEFAULT:
             warnings.warn(
@@ -214,38 +231,16 @@ class FSSpecChainParser:
         if storage_options is None:
             storage_options = {}
 
+        single = self._unchain_single(path, protocol, storage_options, url_parsed)
+        if single is not None:
+            return [single]
+
         segments: list[ChainSegment] = []
         path_bit: str | None
         next_path_overwrite: str | None = None
         for proto0, bit in zip_longest([protocol], path.split(self.link)):
-            # get protocol and path_bit
-            if (
-                "://" in bit  # uri-like, fast-path (redundant)
-                or "/" in bit  # path-like, fast-path
-            ):
-                proto = get_upath_protocol(bit, protocol=proto0)
-                flavour = WrappedFileSystemFlavour.from_protocol(proto)
-                path_bit = flavour.strip_protocol(bit)
-                extra_so = flavour.get_kwargs_from_url(bit)
-            elif bit in self.known_protocols and (
-                proto0 is None or bit == proto0
-            ):  # exact match a fsspec protocol
-                proto = bit
-                path_bit = None
-                extra_so = {}
-            elif bit in (m := set(available_implementations(fallback=True))) and (
-                proto0 is None or bit == proto0
-            ):
-                self.known_protocols = m
-                proto = bit
-                path_bit = None
-                extra_so = {}
-            else:
-                proto = get_upath_protocol(bit, protocol=proto0)
-                flavour = WrappedFileSystemFlavour.from_protocol(proto)
-                path_bit = flavour.strip_protocol(bit)
-                extra_so = flavour.get_kwargs_from_url(bit)
-            if proto in {"blockcache", "filecache", "simplecache"}:
+            proto, path_bit, extra_so = self._parse_bit(bit, proto0)
+            if proto in _PASSTHROUGH_PROTOCOLS:
                 if path_bit is not None:
                     next_path_overwrite = path_bit or "/"
                 path_bit = None
@@ -282,6 +277,52 @@ class FSSpecChainParser:
 
         return segments
 
+    def _parse_bit(
+        self,
+        bit: str,
+        proto0: str | None,
+    ) -> tuple[str, str | None, dict[str, Any]]:
+        """get protocol, path_bit and storage_options of a chain link"""
+        # uri-like and path-like bits can't be a bare protocol (fast-path)
+        if "://" not in bit and "/" not in bit and (proto0 is None or bit == proto0):
+            if bit in self.known_protocols:
+                # exact match a fsspec protocol
+                return bit, None, {}
+            if bit in (m := set(available_implementations(fallback=True))):
+                self.known_protocols = m
+                return bit, None, {}
+        proto = get_upath_protocol(bit, protocol=proto0)
+        flavour = WrappedFileSystemFlavour.from_protocol(proto)
+        return proto, flavour.strip_protocol(bit), flavour.get_kwargs_from_url(bit)
+
+    def _unchain_single(
+        self,
+        path: str,
+        protocol: str | None,
+        storage_options: dict[str, Any],
+        url_parsed: bool,
+    ) -> ChainSegment | None:
+        """fast-path: a single path-like segment without target_* options
+
+        Returns None if the path needs to be parsed by `unchain`.
+        """
+        if self.link in path or "/" not in path or "target_protocol" in storage_options:
+            return None
+        if url_parsed and protocol:
+            proto = protocol
+        else:
+            proto = get_upath_protocol(path, protocol=protocol)
+        if proto in _PASSTHROUGH_PROTOCOLS:
+            return None
+        flavour = WrappedFileSystemFlavour.from_protocol(proto)
+        if url_parsed and proto not in storage_options:
+            so = dict(storage_options)
+        else:
+            so = flavour.get_kwargs_from_url(path)
+            so.update(so.pop(proto, {}))
+            so.update(storage_options)
+        return ChainSegment(flavour.strip_protocol(path), proto, so)
+
     def chain(self, segments: Sequence[ChainSegment]) -> tuple[str, dict[str, Any]]:
         """returns a chained urlpath from the segments"""
         urlpaths = []
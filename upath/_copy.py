@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import os
+import shutil
+import sys
+from collections.abc import Callable
+from collections.abc import Sequence
+from contextlib import closing
+from errno import EBADF
+from errno import EINVAL
+from errno import ENOSYS
+from errno import ENOTSUP
+from errno import EOPNOTSUPP
+from errno import ETXTBSY
+from errno import EXDEV
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+
+from fsspec import AbstractFileSystem
+from fsspec.callbacks import DEFAULT_CALLBACK
+from fsspec.callbacks import Callback
+from fsspec.implementations.local import LocalFileSystem
+
+from upath._bulk import run_concurrently
+
+if TYPE_CHECKING:
+    from pathlib_abc import ReadablePath
+    from pathlib_abc import WritablePath
+
+__all__ = [
+    "copy_files",
+    "copy_local_file",
+    "stream_file",
+]
+
+# storage options that do not change which objects a filesystem accesses
+_CACHE_OPTIONS = frozenset(
+    {
+        "use_listings_cache",
+        "listings_expiry_time",
+        "max_paths",
+        "skip_instance_cache",
+    }
+)
+
+
+def _same_filesystem(fs0: AbstractFileSystem, fs1: AbstractFileSystem) -> bool:
+    if fs0 is fs1:
+        return True
+    elif type(fs0) is not type(fs1):
+        return False
+    so0 = {k: v for k, v in fs0.storage_options.items() if k not in _CACHE_OPTIONS}
+    so1 = {k: v for k, v in fs1.storage_options.items() if k not in _CACHE_OPTIONS}
+    return so0 == so1
+
+
+def _transfer_call(
+    source: ReadablePath,
+    target: WritablePath,
+) -> tuple[AbstractFileSystem, str, tuple[Any, ...], dict[str, Any]] | None:
+    """return the filesystem call that transfers source to target
+
+    Files on the same filesystem are copied server side, files between
+    the local and a remote filesystem are uploaded or downloaded. Returns
+    None if the file has to be streamed through the client.
+    """
+    src_fs = getattr(source, "fs", None)
+    dst_fs = getattr(target, "fs", None)
+    if not isinstance(src_fs, AbstractFileSystem):
+        return None
+    elif not isinstance(dst_fs, AbstractFileSystem):
+        return None
+    src_path = source.path  # type: ignore[attr-defined]
+    dst_path = target.path  # type: ignore[attr-defined]
+    src_local = isinstance(src_fs, LocalFileSystem)
+    dst_local = isinstance(dst_fs, LocalFileSystem)
+    if src_local and dst_local:
+        return None
+    elif _same_filesystem(src_fs, dst_fs):
+        return dst_fs, "cp_file", (src_path, dst_path), {}
+    elif src_local:
+        return dst_fs, "put_file", (src_path, dst_path), {}
+    elif dst_local and os.path.isdir(os.path.dirname(dst_path)):
+        # fs.get_file creates missing parent directories, stream instead
+        # to raise FileNotFoundError like for any other local target
+        return src_fs, "get_file", (src_path, dst_path), {}
+    else:
+        return None
+
+
+def _local_os_path(pth: ReadablePath | WritablePath) -> str | None:
+    if isinstance(pth, Path):
+        return os.fspath(pth)
+    elif isinstance(getattr(pth, "fs", None), LocalFileSystem):
+        return pth.path  # type: ignore[attr-defined]
+    else:
+        return None
+
+
+# errors raised by the kernel copy functions if they are not supported for
+# the given files, i.e. across filesystems or on filesystems without reflinks
+_KERNEL_COPY_UNSUPPORTED = frozenset(
+    {EBADF, EINVAL, ENOSYS, ENOTSUP, EOPNOTSUPP, ETXTBSY, EXDEV}
+)
+
+
+def _blocksize(fd: int) -> int:
+    try:
+        size = os.fstat(fd).st_size
+    except OSError:
+        size = 0
+    return min(max(size, 2**23), 2**30)
+
+
+def _ficlone(source_fd: int, target_fd: int) -> None:
+    fcntl.ioctl(target_fd, fcntl.FICLONE, source_fd)  # type: ignore[attr-defined]
+
+
+def _copy_file_range(source_fd: int, target_fd: int) -> None:
+    blocksize = _blocksize(source_fd)
+    while os.copy_file_range(source_fd, target_fd, blocksize):
+        pass
+
+
+def _sendfile(source_fd: int, target_fd: int) -> None:
+    blocksize = _blocksize(source_fd)
+    while os.sendfile(target_fd, source_fd, None, blocksize):
+        pass
+
+
+_KERNEL_COPIES: list[Callable[[int, int], None]] = []
+if sys.platform == "linux":
+    import fcntl
+
+    if hasattr(fcntl, "FICLONE"):
+        _KERNEL_COPIES.append(_ficlone)
+    if hasattr(os, "copy_file_range"):
+        _KERNEL_COPIES.append(_copy_file_range)
+    if hasattr(os, "sendfile"):
+        _KERNEL_COPIES.append(_sendfile)
+
+
+def copy_local_file(source: str, target: str) -> None:
+    """copy a local file, letting the kernel copy the data if possible
+
+    Tries a reflink (FICLONE), then `os.copy_file_range`, then
+    `os.sendfile`, and falls back to a buffered copy. Every method
+    continues from the file offsets the previous one stopped at.
+    """
+    with open(source, "rb") as source_f, open(target, "wb") as target_f:
+        source_fd = source_f.fileno()
+        target_fd = target_f.fileno()
+        for kernel_copy in _KERNEL_COPIES:
+            try:
+                kernel_copy(source_fd, target_fd)
+                return
+            except OSError as err:
+                if err.errno not in _KERNEL_COPY_UNSUPPORTED:
+                    err.filename = source
+                    err.filename2 = target
+                    raise err
+        shutil.copyfileobj(source_f, target_f)
+
+
+def stream_file(source: ReadablePath, target: WritablePath) -> None:
+    """copy a file by streaming its contents through the client"""
+    source_path = _local_os_path(source)
+    target_path = _local_os_path(target)
+    if source_path is not None and target_path is not None:
+        return copy_local_file(source_path, target_path)
+
+    from pathlib_abc import vfsopen
+    from pathlib_abc._os import copyfileobj
+
+    with vfsopen(source, "rb") as source_f:
+        with vfsopen(target, "wb") as target_f:
+            copyfileobj(source_f, target_f)
+
+
+def copy_files(
+    files: Sequence[tuple[ReadablePath, WritablePath]],
+    max_concurrency: int,
+    callback: Callback = DEFAULT_CALLBACK,
+) -> None:
+    """copy (source, target) file pairs
+
+    Server side copies, uploads and downloads run concurrently on async
+    filesystems, with at most `max_concurrency` transfers in flight.
+    Files that can't be transferred by the filesystems are streamed
+    through the client. `callback` is advanced by one for every copied
+    file.
+    """
+    callback.set_size(len(files))
+    transfers = []
+    for source, target in files:
+        call = _transfer_call(source, target)
+        if call is None:
+            stream_file(source, target)
+            callback.relative_update(1)
+        else:
+            transfers.append((source, target, call))
+
+    calls = (call for _, _, call in transfers)
+    with closing(run_concurrently(calls, max_concurrency)) as completed:
+        for index, result in completed:
+            if isinstance(result, NotImplementedError):
+                source, target, _ = transfers[index]
+                stream_file(source, target)
+            elif isinstance(result, Exception):
+                raise result
+            callback.relative_update(1)
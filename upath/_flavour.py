@@ -4,11 +4,13 @@ import os.path
 import posixpath
 import sys
 import warnings
+from collections.abc import Callable
 from collections.abc import Mapping
 from functools import lru_cache
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import TypedDict
+from typing import TypeVar
 from urllib.parse import SplitResult
 from urllib.parse import urlsplit
 
@@ -42,6 +44,8 @@ __all__ = [
 
 class_registry: Mapping[str, type[AbstractFileSystem]] = _class_registry
 
+_T = TypeVar("_T")
+
 
 class AnyProtocolFileSystemFlavour(FileSystemFlavourBase):
     sep = "/"
@@ -189,13 +193,13 @@ class WrappedFileSystemFlavour(UPathParser):  # (pathlib_abc.FlavourBase)
 
         # first try to get an already imported fsspec filesystem class
         try:
-            return cls(class_registry[protocol], **config)
+            return cls._from_spec(class_registry[protocol], config)
         except KeyError:
             pass
         # next try to get the flavour from the generated flavour registry
         # to avoid imports
         try:
-            return cls(flavour_registry[protocol], **config)
+            return cls._from_spec(flavour_registry[protocol], config)
         except KeyError:
             pass
         # finally fallback to a default flavour for the protocol
@@ -207,7 +211,23 @@ class WrappedFileSystemFlavour(UPathParser):  # (pathlib_abc.FlavourBase)
                 UserWarning,
                 stacklevel=2,
             )
-        return cls(AnyProtocolFileSystemFlavour, **config)
+        return cls._from_spec(AnyProtocolFileSystemFlavour, config)
+
+    @classmethod
+    def _from_spec(
+        cls,
+        spec: type[AbstractFileSystem | FileSystemFlavourBase],
+        config: dict[str, Any],
+    ) -> WrappedFileSystemFlavour:
+        """return a flavour specialised for the protocol family of spec"""
+        if cls is not WrappedFileSystemFlavour:
+            return cls(spec, **config)
+        elif getattr(spec, "local_file", False):
+            return LocalFileSystemFlavour(spec, **config)
+        elif config["netloc_is_anchor"]:
+            return NetlocAnchoredFileSystemFlavour(spec, **config)
+        else:
+            return PosixLikeFileSystemFlavour(spec, **config)
 
     def __repr__(self):
         if isinstance(self._spec, type):
@@ -387,6 +407,183 @@ class WrappedFileSystemFlavour(UPathParser):  # (pathlib_abc.FlavourBase)
         return drive, root_marker, tail.removeprefix(self.sep)
 
 
+class _SpecializedFileSystemFlavour(WrappedFileSystemFlavour):
+    """base class for flavours specialised for a family of protocols
+
+    The specialised flavours skip the per call dispatch on the protocol
+    family and memoize protocol stripping and splitting of str paths, so
+    that lexical operations on already stripped paths (i.e. when walking
+    up the parents of a path) don't repeatedly parse them again.
+    """
+
+    _memo_maxsize = 4096
+
+    def __init__(
+        self,
+        spec: type[AbstractFileSystem | FileSystemFlavourBase] | AbstractFileSystem,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(spec, **kwargs)
+        self._strip_protocol_str = self._memoize(super().strip_protocol)
+        self._split_str = self._memoize(self._split)
+
+    def _memoize(self, func: Callable[[str], _T]) -> Callable[[str], _T]:
+        """return a bounded memo of func for str arguments"""
+        if self.local_file:
+            # relative local paths are resolved against the current
+            # working directory, so the results can't be reused
+            return func
+        return lru_cache(maxsize=self._memo_maxsize)(func)
+
+    def strip_protocol(self, pth: JoinablePathLike) -> str:
+        if type(pth) is not str:
+            return super().strip_protocol(pth)
+        return self._strip_protocol_str(pth)
+
+    def split(self, path: JoinablePathLike) -> tuple[str, str]:
+        if type(path) is not str:
+            return self._split(path)
+        return self._split_str(path)
+
+    def _split(self, path: JoinablePathLike) -> tuple[str, str]:
+        raise NotImplementedError
+
+
+class LocalFileSystemFlavour(_SpecializedFileSystemFlavour):
+    """flavour for filesystems operating on local files"""
+
+    def isabs(self, path: JoinablePathLike) -> bool:
+        return os.path.isabs(self.strip_protocol(path))
+
+    def join(self, path: JoinablePathLike, *paths: JoinablePathLike) -> str:
+        if not paths:
+            return self.strip_protocol(path) or self.root_marker
+        p = os.path.join(
+            self.strip_protocol(path),
+            *map(self.stringify_path, paths),
+        )
+        return p if os.name != "nt" else p.replace("\\", "/")
+
+    def _split(self, path: JoinablePathLike) -> tuple[str, str]:
+        return os.path.split(self.strip_protocol(path))
+
+    def splitdrive(self, path: JoinablePathLike) -> tuple[str, str]:
+        return os.path.splitdrive(self.strip_protocol(path))
+
+    def normcase(self, path: JoinablePathLike) -> str:
+        return os.path.normcase(self.stringify_path(path))
+
+    def splitext(self, path: JoinablePathLike) -> tuple[str, str]:
+        return os.path.splitext(self.stringify_path(path))
+
+    def splitroot(self, path: JoinablePathLike) -> tuple[str, str, str]:
+        drive, tail = self.splitdrive(path)
+        return drive, self.root_marker, tail.removeprefix(self.sep)
+
+
+class PosixLikeFileSystemFlavour(_SpecializedFileSystemFlavour):
+    """flavour for filesystems with posix-like paths without a drive"""
+
+    def isabs(self, path: JoinablePathLike) -> bool:
+        return self.strip_protocol(path).startswith(self.root_marker)
+
+    def join(self, path: JoinablePathLike, *paths: JoinablePathLike) -> str:
+        if not paths:
+            return self.strip_protocol(path) or self.root_marker
+        p0 = self.strip_protocol(path) or self.root_marker
+        pN = list(map(self.stringify_path, paths))
+        if self.supports_empty_parts:
+            return self.sep.join([p0.removesuffix(self.sep), *pN])
+        else:
+            return posixpath.join(p0, *pN)
+
+    def _split(self, path: JoinablePathLike) -> tuple[str, str]:
+        stripped_path = self.strip_protocol(path)
+        root_marker = self.root_marker
+        head = self.parent(stripped_path) or root_marker
+        if head == self.sep:
+            tail = stripped_path[1:]
+        elif head:
+            tail = stripped_path[len(head) + 1 :]
+        else:
+            tail = stripped_path
+        if (
+            not tail
+            and not self.has_meaningful_trailing_slash
+            and self.strip_protocol(head) != stripped_path
+        ):
+            return self.split(head)
+        return head, tail
+
+    def splitdrive(self, path: JoinablePathLike) -> tuple[str, str]:
+        return "", self.strip_protocol(path)
+
+    def splitroot(self, path: JoinablePathLike) -> tuple[str, str, str]:
+        tail = self.strip_protocol(path)
+        return "", self.root_marker, tail.removeprefix(self.sep)
+
+
+class NetlocAnchoredFileSystemFlavour(_SpecializedFileSystemFlavour):
+    """flavour for filesystems using the netloc (i.e. a bucket) as drive"""
+
+    def isabs(self, path: JoinablePathLike) -> bool:
+        return self.strip_protocol(path).startswith(self.root_marker)
+
+    def join(self, path: JoinablePathLike, *paths: JoinablePathLike) -> str:
+        if not paths:
+            return self.strip_protocol(path) or self.root_marker
+        drv, p0 = self.splitdrive(path)
+        pN = list(map(self.stringify_path, paths))
+        if not drv and not p0:
+            path, *pN = pN
+            drv, p0 = self.splitdrive(path)
+        p0 = p0 or self.sep
+        if self.supports_empty_parts:
+            return drv + self.sep.join([p0.removesuffix(self.sep), *pN])
+        else:
+            return drv + posixpath.join(p0, *pN)
+
+    def _split(self, path: JoinablePathLike) -> tuple[str, str]:
+        stripped_path = self.strip_protocol(path)
+        head = self.parent(stripped_path) or self.root_marker
+        if head == self.sep:
+            tail = stripped_path[1:]
+        elif head:
+            tail = stripped_path[len(head) + 1 :]
+        else:
+            head = stripped_path
+            tail = ""
+        if (
+            not tail
+            and not self.has_meaningful_trailing_slash
+            and self.strip_protocol(head) != stripped_path
+        ):
+            return self.split(head)
+        return head, tail
+
+    def splitdrive(self, path: JoinablePathLike) -> tuple[str, str]:
+        path = self.strip_protocol(path)
+        u = urlsplit(path) if ":" in path else None
+        if u is None or not u.scheme:
+            # cases like: "bucket/some/special/key
+            drive, root, tail = path.partition(self.sep)
+            return drive, root + tail
+        # cases like: "http://example.com/foo/bar"
+        drive = SplitResult(u.scheme, u.netloc, "", "", "").geturl()
+        rest = SplitResult("", "", u.path, u.query, u.fragment).geturl()
+        if u.path.startswith("//") and _EMPTY_NETLOC_ROUNDTRIP == "////":
+            # see: fsspec/universal_pathlib#233
+            rest = rest[2:]
+        return drive, rest or self.root_marker or self.sep
+
+    def splitroot(self, path: JoinablePathLike) -> tuple[str, str, str]:
+        drive, tail = self.splitdrive(path)
+        root_marker = self.root_marker or self.sep
+        return drive, root_marker, tail.removeprefix(self.sep)
+
+
+_EMPTY_NETLOC_ROUNDTRIP = SplitResult("", "", "//", "", "").geturl()
+
 default_flavour = WrappedFileSystemFlavour(AnyProtocolFileSystemFlavour)
 
 
@@ -0,0 +1,459 @@
+from __future__ import annotations
+
+import inspect
+import re
+from collections.abc import AsyncIterator
+from collections.abc import Iterator
+from functools import lru_cache
+from typing import Any
+from typing import Callable
+
+from fsspec import AbstractFileSystem
+from fsspec.asyn import sync
+
+__all__ = [
+    "expand_prefixes",
+    "compile_pattern",
+    "has_magic",
+    "iter_listing",
+    "iter_tree",
+    "plan_glob",
+    "translate",
+]
+
+_MAGIC = re.compile(r"[*?[]")
+
+# maximum number of literal prefixes a segment is expanded into
+MAX_PREFIXES = 64
+
+# number of entries fetched per round trip when streaming listings
+PAGE_SIZE = 1000
+
+
+def has_magic(segment: str) -> bool:
+    """return True if the pattern segment contains wildcards"""
+    return _MAGIC.search(segment) is not None
+
+
+def _parse_class(segment: str, start: int) -> tuple[list[str], int] | None:
+    """parse the character class at segment[start]
+
+    Returns the characters in the class and the index after the class,
+    or None if the class can't be expanded (i.e. it is negated or
+    unterminated).
+    """
+    index = start + 1
+    if index < len(segment) and segment[index] == "!":
+        return None
+    end = segment.find("]", index + 1)
+    if end == -1:
+        return None
+    body = segment[index:end]
+    chars: list[str] = []
+    i = 0
+    while i < len(body):
+        if i + 2 < len(body) and body[i + 1] == "-":
+            lo, hi = ord(body[i]), ord(body[i + 2])
+            if lo > hi or hi - lo >= MAX_PREFIXES:
+                return None
+            chars.extend(map(chr, range(lo, hi + 1)))
+            i += 3
+        else:
+            chars.append(body[i])
+            i += 1
+    return list(dict.fromkeys(chars)), end + 1
+
+
+def expand_prefixes(segment: str) -> list[str]:
+    """return literal prefixes that all names matching segment start with
+
+    Character classes at the start of the segment are expanded into
+    alternatives, i.e. `month=0[12]*` gives `month=01` and `month=02`.
+    Expansion stops at the first `*` or `?`, or when it would exceed
+    MAX_PREFIXES alternatives.
+    """
+    prefixes = [""]
+    index = 0
+    while index < len(segment):
+        char = segment[index]
+        if char in "*?":
+            break
+        elif char == "[":
+            parsed = _parse_class(segment, index)
+            if parsed is None:
+                break
+            chars, index = parsed
+            if len(prefixes) * len(chars) > MAX_PREFIXES:
+                break
+            prefixes = [p + c for p in prefixes for c in chars]
+        else:
+            prefixes = [p + char for p in prefixes]
+            index += 1
+    return prefixes
+
+
+def _translate_segment(segment: str, sep: str) -> str:
+    """translate a pattern segment into a regex not matching sep"""
+    not_sep = f"[^{re.escape(sep)}]" if sep else "."
+    if segment == "*":
+        return f"{not_sep}+"
+    out = []
+    index = 0
+    while index < len(segment):
+        char = segment[index]
+        index += 1
+        if char == "*":
+            while index < len(segment) and segment[index] == "*":
+                index += 1
+            out.append(f"{not_sep}*")
+        elif char == "?":
+            out.append(not_sep)
+        elif char == "[":
+            end = index
+            if end < len(segment) and segment[end] == "!":
+                end += 1
+            if end < len(segment) and segment[end] == "]":
+                end += 1
+            end = segment.find("]", end)
+            if end == -1:
+                out.append(re.escape(char))
+                continue
+            body = segment[index:end].replace("\\", "\\\\")
+            index = end + 1
+            if body.startswith("!"):
+                body = f"^{re.escape(sep)}{body[1:]}"
+            elif body.startswith(("^", "[")):
+                body = f"\\{body}"
+            out.append(f"[{body}]")
+        else:
+            out.append(re.escape(char))
+    return "".join(out)
+
+
+def translate(pattern: str, sep: str, *, match_parent: bool = False) -> str:
+    """translate a glob pattern into a regex
+
+    `*`, `?` and character classes never match sep, a `**` segment
+    matches any number of segments. With `match_parent`, a trailing `**`
+    also matches its parent like in glob results, i.e. `a/**` matches
+    `a` and everything below it.
+    """
+    parts = pattern.split(sep) if sep else [pattern]
+    last = len(parts) - 1
+    esep = re.escape(sep)
+    out = []
+    for idx, part in enumerate(parts):
+        if part == "**":
+            if idx < last and parts[idx + 1] == "**":
+                continue
+            elif idx < last:
+                out.append(f"(?:.+{esep})?")
+            elif match_parent and out:
+                # replace the preceding separator to also match the parent
+                out[-1] = f"(?:{esep}.*)?"
+            else:
+                out.append(".*")
+            continue
+        out.append(_translate_segment(part, sep))
+        if idx < last:
+            out.append(esep)
+    return f"(?s:{''.join(out)})\\Z"
+
+
+@lru_cache(maxsize=256)
+def _compile_segment(
+    segment: str,
+    sep: str,
+    case_sensitive: bool,
+) -> Callable[[str], Any]:
+    flags = 0 if case_sensitive else re.IGNORECASE
+    regex = f"(?s:{_translate_segment(segment, sep)})\\Z"
+    return re.compile(regex, flags).match
+
+
+@lru_cache(maxsize=1024)
+def compile_pattern(
+    pattern: str,
+    sep: str,
+    case_sensitive: bool = True,
+    *,
+    match_parent: bool = False,
+) -> Callable[[str], re.Match[str] | None]:
+    """return the match function of the regex the glob pattern translates to
+
+    Patterns are translated and compiled once per (pattern, sep,
+    case_sensitive), so matching many paths against the same pattern
+    only runs the regex.
+    """
+    flags = 0 if case_sensitive else re.IGNORECASE
+    regex = translate(pattern, sep, match_parent=match_parent)
+    return re.compile(regex, flags).match
+
+
+@lru_cache(maxsize=None)
+def _supports_paged_listing(fs_cls: type[AbstractFileSystem]) -> bool:
+    """return True if the filesystem can stream key listings page by page"""
+    iterdir = getattr(fs_cls, "_iterdir", None)
+    if not fs_cls.async_impl or iterdir is None:
+        return False
+    elif not hasattr(fs_cls, "split_path"):
+        return False
+    try:
+        parameters = inspect.signature(iterdir).parameters
+    except (TypeError, ValueError):
+        return False
+    return "delimiter" in parameters and "prefix" in parameters
+
+
+async def _next_page(
+    entries: AsyncIterator[dict[str, Any]],
+    size: int,
+) -> list[dict[str, Any]]:
+    page: list[dict[str, Any]] = []
+    while len(page) < size:
+        try:
+            page.append(await entries.__anext__())
+        except StopAsyncIteration:
+            break
+    return page
+
+
+def _iter_pages(
+    fs: Any,
+    path: str,
+    prefix: str,
+    delimiter: str,
+) -> Iterator[dict[str, Any]]:
+    """stream the entries of the listing of key prefix path/prefix
+
+    The listing is fetched lazily, one page at a time, and stops when
+    the iterator is closed.
+    """
+    bucket, key, _ = fs.split_path(path)
+    key = f"{key}{fs.sep}{prefix}" if key else prefix
+    entries = fs._iterdir(bucket, delimiter=delimiter, prefix=key)
+    try:
+        while True:
+            page = sync(fs.loop, _next_page, entries, PAGE_SIZE)
+            yield from page
+            if len(page) < PAGE_SIZE:
+                return
+    finally:
+        if not fs.loop.is_closed():
+            sync(fs.loop, entries.aclose)
+
+
+def _paged(fs: AbstractFileSystem, path: str) -> bool:
+    if not _supports_paged_listing(fs.__class__) or fs.asynchronous:
+        return False
+    return bool(fs.split_path(path)[0])  # type: ignore[attr-defined]
+
+
+def _list_prefixes(
+    fs: AbstractFileSystem,
+    path: str,
+    prefixes: list[str],
+) -> Iterator[dict[str, Any]]:
+    """list the entries of directory path that may start with prefixes
+
+    Filesystems that can stream their key listings are listed with one
+    delimited listing per prefix, filtered server side. All other
+    filesystems are listed once, so the caller has to filter the names.
+    """
+    try:
+        if _paged(fs, path):
+            for prefix in prefixes:
+                yield from _iter_pages(fs, path.rstrip(fs.sep), prefix, fs.sep)
+        else:
+            yield from fs.ls(path, detail=True)
+    except (FileNotFoundError, NotADirectoryError):
+        return
+
+
+def iter_listing(
+    fs: AbstractFileSystem,
+    path: str,
+    *,
+    recursive: bool = False,
+) -> Iterator[dict[str, Any]]:
+    """stream the info dicts of the entries of directory path
+
+    If recursive, the info dicts of all files below path are streamed
+    instead. Filesystems that can stream their key listings are listed
+    page by page.
+    """
+    base = path.rstrip(fs.sep)
+    if _paged(fs, path):
+        delimiter = "" if recursive else fs.sep
+        yield from _iter_pages(fs, base, "", delimiter)
+        return
+    elif recursive:
+        entries = fs.find(path, detail=True).values()
+    else:
+        entries = fs.ls(path, detail=True)
+    for entry in entries:
+        # some filesystems list the directory itself, i.e. tar and zip
+        if entry["name"].rstrip(fs.sep) != base:
+            yield entry
+
+
+def _iter_tree_paged(
+    fs: AbstractFileSystem,
+    base: str,
+    sep: str,
+) -> Iterator[tuple[str, bool]]:
+    # keys are listed in lexicographic order, so all keys below a directory
+    # arrive in one run and only the directories of the previous key have
+    # been yielded already
+    found = False
+    previous: list[str] = []
+    for entry in _iter_pages(fs, base, "", delimiter=""):
+        name = entry["name"]
+        is_dir = name.endswith(sep) or entry["type"] == "directory"
+        name = name.rstrip(sep)
+        if not found:
+            found = True
+            yield base, True
+        if not name.startswith(f"{base}{sep}"):
+            continue
+        parts = name[len(base) + 1 :].split(sep)
+        dirs = parts if is_dir else parts[:-1]
+        common = 0
+        for part, previous_part in zip(dirs, previous):
+            if part != previous_part:
+                break
+            common += 1
+        for idx in range(common, len(dirs)):
+            yield sep.join([base, *dirs[: idx + 1]]), True
+        if not is_dir:
+            yield name, False
+        previous = dirs
+
+
+def _iter_tree_walk(
+    fs: AbstractFileSystem,
+    base: str,
+    sep: str,
+) -> Iterator[tuple[str, bool]]:
+    top = True
+    for _, dirs, files in fs.walk(base, detail=True):
+        if top:
+            # walk lists the entry of base itself as a file without a name
+            if files.get("", {}).get("type", "directory") != "directory":
+                return
+            top = False
+            yield base, True
+        for info in dirs.values():
+            yield info["name"].rstrip(sep), True
+        for name, info in files.items():
+            if name:
+                yield info["name"].rstrip(sep), False
+
+
+def iter_tree(
+    fs: AbstractFileSystem,
+    path: str,
+    sep: str,
+) -> Iterator[tuple[str, bool]]:
+    """yield (path, is_dir) for directory path and everything below it
+
+    Filesystems that can stream their key listings are listed with a
+    single recursive listing, page by page. All other filesystems are
+    walked one directory at a time. Nothing is yielded if path is not
+    a directory.
+    """
+    base = path.rstrip(sep)
+    try:
+        if _paged(fs, base):
+            yield from _iter_tree_paged(fs, base, sep)
+        else:
+            yield from _iter_tree_walk(fs, base, sep)
+    except (FileNotFoundError, NotADirectoryError):
+        return
+
+
+def _match_tree(
+    fs: AbstractFileSystem,
+    path: str,
+    segments: list[str],
+    sep: str,
+    case_sensitive: bool,
+) -> Iterator[str]:
+    dir_only = not segments[-1]
+    pattern = sep.join(segments[:-1] if dir_only else segments)
+    match = compile_pattern(pattern, sep, case_sensitive, match_parent=True)
+    base = path.rstrip(sep)
+    for entry_path, is_dir in iter_tree(fs, base, sep):
+        if dir_only and not is_dir:
+            continue
+        elif entry_path == base:
+            relative = ""
+        elif not base or entry_path.startswith(f"{base}{sep}"):
+            # names below the root may or may not start with sep
+            relative = entry_path[len(base) :].removeprefix(sep)
+        else:
+            continue
+        if match(relative):
+            yield entry_path
+
+
+def plan_glob(
+    fs: AbstractFileSystem,
+    path: str,
+    segments: list[str],
+    sep: str,
+    case_sensitive: bool = True,
+) -> Iterator[str]:
+    """yield the paths below path matching the pattern segments
+
+    Literal segments are joined without touching the filesystem, wildcard
+    segments list the parent directory once. Filesystems that can stream
+    their key listings restrict them to the literal prefixes of the
+    segment, so that only keys that can possibly match are listed. From the first
+    recursive (`**`) segment on, the subtree is listed lazily and matched
+    against the remaining pattern. Matches are yielded as soon as the
+    listing page they were found in arrives, so the listing stops early
+    when the iterator is closed.
+
+    Case insensitive patterns can't be resolved by joining or prefix
+    listing, so all their segments list the parent directory.
+
+    `segments` must not contain empty segments, except for the last
+    segment which may be empty to only match directories.
+    """
+    if not segments:
+        yield path
+        return
+    segment, rest = segments[0], segments[1:]
+    base = path.rstrip(sep)
+
+    if segment == "**":
+        yield from _match_tree(fs, path, segments, sep, case_sensitive)
+        return
+
+    if not segment:
+        # trailing separator: only match directories
+        if fs.isdir(path):
+            yield path
+        return
+
+    if case_sensitive and not has_magic(segment):
+        child = f"{base}{sep}{segment}"
+        if rest:
+            yield from plan_glob(fs, child, rest, sep)
+        elif fs.exists(child):
+            yield child
+        return
+
+    match = _compile_segment(segment, sep, case_sensitive)
+    prefixes = expand_prefixes(segment) if case_sensitive else [""]
+    for entry in _list_prefixes(fs, path, prefixes):
+        entry_path = entry["name"].rstrip(sep)
+        parent, _, name = entry_path.rpartition(sep)
+        # some filesystems list the directory itself or nested entries
+        if parent != base or not match(name):
+            continue
+        if not rest:
+            yield entry_path
+        elif entry["type"] == "directory":
+            yield from plan_glob(fs, entry_path, rest, sep, case_sensitive)
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import TYPE_CHECKING
+from typing import Any
 
 from upath.types import PathInfo
 
@@ -12,22 +15,57 @@ __all__ = [
     "UPathInfo",
 ]
 
+# marker for paths that were looked up and don't exist
+_NOT_FOUND: Mapping[str, Any] = MappingProxyType({})
+
 
 class UPathInfo(PathInfo):
-    """Path info for UPath objects."""
+    """Path info for UPath objects.
+
+    If an fsspec info dict is provided, for example from a directory
+    listing, all type queries are answered from the cached dict without
+    accessing the filesystem. Otherwise each query is delegated to the
+    filesystem until `refresh()` is called.
+    """
+
+    __slots__ = ("_path", "_fs", "_info")
 
-    def __init__(self, path: UPath) -> None:
+    def __init__(
+        self,
+        path: UPath,
+        info: Mapping[str, Any] | None = None,
+    ) -> None:
         self._path = path.path
         self._fs = path.fs
+        self._info = info
+
+    def refresh(self) -> None:
+        """Fetch and cache the fsspec info dict for the path.
+
+        This requires a single `fs.info()` call. Subsequent queries are
+        answered from the cached info dict until `refresh()` is called again.
+        """
+        try:
+            self._info = self._fs.info(self._path)
+        except FileNotFoundError:
+            self._info = _NOT_FOUND
 
     def exists(self, *, follow_symlinks=True) -> bool:
-        return self._fs.exists(self._path)
+        if self._info is None:
+            return self._fs.exists(self._path)
+        return self._info is not _NOT_FOUND
 
     def is_dir(self, *, follow_symlinks=True) -> bool:
-        return self._fs.isdir(self._path)
+        if self._info is None:
+            return self._fs.isdir(self._path)
+        return self._info.get("type") == "directory"
 
     def is_file(self, *, follow_symlinks=True) -> bool:
-        return self._fs.isfile(self._path)
+        if self._info is None:
+            return self._fs.isfile(self._path)
+        return self._info.get("type") == "file"
 
     def is_symlink(self) -> bool:
-        return False
+        if self._info is None:
+            return False
+        return bool(self._info.get("islink", False))
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from inspect import signature
+
+from fsspec import AbstractFileSystem
+
+__all__ = [
+    "is_optimistic",
+    "supports_conditional_create",
+    "use_optimistic",
+]
+
+_OPTIMISTIC: ContextVar[bool] = ContextVar("upath_optimistic", default=False)
+
+
+def is_optimistic() -> bool:
+    """return if optimistic writes are enabled in the current context"""
+    return _OPTIMISTIC.get()
+
+
+@contextmanager
+def use_optimistic(enabled: bool) -> Iterator[None]:
+    """enable or disable optimistic writes in the current context"""
+    token = _OPTIMISTIC.set(enabled)
+    try:
+        yield
+    finally:
+        _OPTIMISTIC.reset(token)
+
+
+@lru_cache
+def supports_conditional_create(fs_cls: type[AbstractFileSystem]) -> bool:
+    """return if fs_cls.pipe_file supports mode="create"
+
+    Older fsspec versions forward unknown keyword arguments to the backend,
+    which would silently overwrite existing files.
+    """
+    try:
+        return "mode" in signature(fs_cls.pipe_file).parameters
+    except (TypeError, ValueError):
+        return False
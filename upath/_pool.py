@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Any
+from typing import NamedTuple
+
+from fsspec import AbstractFileSystem
+from fsspec.utils import tokenize
+
+__all__ = [
+    "FileSystemPool",
+    "PoolInfo",
+    "DEFAULT_FILESYSTEM_POOL",
+]
+
+_PLAIN_TYPES = (str, bytes, int, float, bool, type(None))
+
+
+def _freeze(value: Any) -> Any:
+    """return a hashable, order-independent version of storage_options
+
+    Raises a TypeError for values that can't be tokenized reliably.
+    """
+    if isinstance(value, _PLAIN_TYPES):
+        return value
+    elif isinstance(value, Mapping):
+        return tuple(sorted((str(k), _freeze(v)) for k, v in value.items()))
+    elif isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    else:
+        raise TypeError(f"can't tokenize {type(value).__name__!r}")
+
+
+def _close_async_instance(
+    fs: AbstractFileSystem, loop: asyncio.AbstractEventLoop
+) -> None:
+    """close the session of an async instance after its event loop closed
+
+    fsspec only registers this cleanup for instances which are not created
+    for use in an event loop. The http, s3 and gcs filesystems provide a
+    `close_session(loop, session)` that can close sessions of dead loops.
+    """
+    close_session = getattr(fs, "close_session", None)
+    session = getattr(fs, "_session", None) or getattr(fs, "_s3", None)
+    if close_session is None or session is None:
+        return
+    try:
+        close_session(loop, session)
+    except Exception:  # nosec B110
+        pass
+
+
+class PoolInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class FileSystemPool:
+    """a bounded, thread-safe pool of filesystem instances
+
+    Instances are keyed on the filesystem class and the storage_options.
+    Like fsspec's instance cache, the key includes the process and thread
+    id, so instances are never shared across forks or threads.
+
+    Filesystem classes that opt out of fsspec's instance cache via
+    `cachable = False` and storage_options containing objects which can't
+    be tokenized reliably (i.e. file objects) bypass the pool.
+
+    Instances of async filesystems for use in an event loop are requested
+    by passing the loop, and are pooled per event loop separately from the
+    other instances. They are evicted and their sessions are closed once
+    the event loop is closed.
+    """
+
+    def __init__(self, maxsize: int = 128) -> None:
+        if maxsize < 0:
+            raise ValueError("maxsize must be >= 0")
+        self._maxsize = maxsize
+        self._instances: OrderedDict[str, AbstractFileSystem] = OrderedDict()
+        self._async_instances: OrderedDict[str, AbstractFileSystem] = OrderedDict()
+        self._loops: dict[str, asyncio.AbstractEventLoop] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(
+        self,
+        fs_cls: type[AbstractFileSystem],
+        storage_options: Mapping[str, Any],
+        *,
+        loop: asyncio.AbstractEventLoop | None = None,
+    ) -> AbstractFileSystem:
+        """return a pooled filesystem instance or create a new one"""
+        loop_id = None
+        frozen_options: Mapping[str, Any]
+        if loop is not None:
+            # fsspec's instance cache can't distinguish event loops
+            loop_id = id(loop)
+            storage_options = {
+                **storage_options,
+                "asynchronous": True,
+                "loop": loop,
+                "skip_instance_cache": True,
+            }
+            frozen_options = {k: v for k, v in storage_options.items() if k != "loop"}
+        else:
+            frozen_options = storage_options
+
+        if not self._maxsize or not getattr(fs_cls, "cachable", True):
+            return fs_cls(**storage_options)
+        try:
+            frozen = _freeze(frozen_options)
+        except TypeError:
+            return fs_cls(**storage_options)
+
+        # note: pooled async instances keep a reference to their loop, so
+        #   the id of the loop can't be reused while the instance is pooled
+        key = tokenize(fs_cls, os.getpid(), threading.get_ident(), loop_id, frozen)
+        if loop is None:
+            instances = self._instances
+        else:
+            self._evict_closed_loops()
+            instances = self._async_instances
+        with self._lock:
+            try:
+                fs = instances[key]
+            except KeyError:
+                self._misses += 1
+            else:
+                self._hits += 1
+                instances.move_to_end(key)
+                return fs
+
+        # instantiate outside the lock, as this might do I/O
+        fs = fs_cls(**storage_options)
+        with self._lock:
+            fs = instances.setdefault(key, fs)
+            instances.move_to_end(key)
+            if loop is not None:
+                self._loops[key] = loop
+            while len(instances) > self._maxsize:
+                evicted, _ = instances.popitem(last=False)
+                self._loops.pop(evicted, None)
+        return fs
+
+    def _evict_closed_loops(self) -> None:
+        """remove the async instances of closed event loops"""
+        with self._lock:
+            closed = [(k, lp) for k, lp in self._loops.items() if lp.is_closed()]
+            evicted = []
+            for key, loop in closed:
+                del self._loops[key]
+                evicted.append((self._async_instances.pop(key), loop))
+        for fs, loop in evicted:
+            _close_async_instance(fs, loop)
+
+    def cache_info(self) -> PoolInfo:
+        """report pool statistics"""
+        self._evict_closed_loops()
+        with self._lock:
+            return PoolInfo(
+                self._hits,
+                self._misses,
+                self._maxsize,
+                len(self._instances) + len(self._async_instances),
+            )
+
+    def clear(self) -> None:
+        """remove all filesystem instances and reset the statistics"""
+        self._evict_closed_loops()
+        with self._lock:
+            self._instances.clear()
+            self._async_instances.clear()
+            self._loops.clear()
+            self._hits = self._misses = 0
+
+
+DEFAULT_FILESYSTEM_POOL = FileSystemPool()
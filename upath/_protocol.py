@@ -76,6 +76,21 @@ def _fsspec_protocol_equals(p0: str, p1: str) -> bool:
     return o0 == o1
 
 
+def _get_protocol(pth: JoinablePathLike) -> str:
+    from upath.core import UPath
+
+    if isinstance(pth, UPath):
+        return pth.protocol
+    elif isinstance(pth, PurePath):
+        return getattr(pth, "protocol", "")
+    elif hasattr(pth, "__vfspath__"):
+        return _match_protocol(pth.__vfspath__())
+    elif hasattr(pth, "__fspath__"):
+        return _match_protocol(pth.__fspath__())
+    else:
+        return _match_protocol(str(pth))
+
+
 def get_upath_protocol(
     pth: JoinablePathLike,
     *,
@@ -83,20 +98,10 @@ def get_upath_protocol(
     storage_options: dict[str, Any] | None = None,
 ) -> str:
     """return the filesystem spec protocol"""
-    from upath.core import UPath
-
     if isinstance(pth, str):
         pth_protocol = _match_protocol(pth)
-    elif isinstance(pth, UPath):
-        pth_protocol = pth.protocol
-    elif isinstance(pth, PurePath):
-        pth_protocol = getattr(pth, "protocol", "")
-    elif hasattr(pth, "__vfspath__"):
-        pth_protocol = _match_protocol(pth.__vfspath__())
-    elif hasattr(pth, "__fspath__"):
-        pth_protocol = _match_protocol(pth.__fspath__())
     else:
-        pth_protocol = _match_protocol(str(pth))
+        pth_protocol = _get_protocol(pth)
     # if storage_options and not protocol and not pth_protocol:
     #     protocol = "file"
     if protocol is None:
@@ -135,10 +140,13 @@ def compatible_protocol(
     from upath.core import UPath
 
     for arg in args:
-        if isinstance(arg, UPath) and not arg.is_absolute():
+        if isinstance(arg, str):
+            other_protocol = _match_protocol(arg)
+        elif isinstance(arg, UPath) and not arg.is_absolute():
             # relative UPath are always compatible
             continue
-        other_protocol = get_upath_protocol(arg)
+        else:
+            other_protocol = get_upath_protocol(arg)
         # consider protocols equivalent if they match up to the first "+"
         other_protocol = other_protocol.partition("+")[0]
         # protocols: only identical (or empty "") protocols can combine
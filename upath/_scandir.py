@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import sys
+from collections.abc import Iterator
+from typing import TYPE_CHECKING
+from typing import Generic
+from typing import Protocol
+from typing import TypeVar
+
+from upath._info import UPathInfo
+from upath._stat import UPathStatResult
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    if sys.version_info >= (3, 11):
+        from typing import Self
+    else:
+        from typing_extensions import Self
+
+    from upath.types import PathInfo
+    from upath.types import StatResultType
+
+__all__ = [
+    "UPathDirEntry",
+    "UPathScandirIterator",
+]
+
+
+class _ScandirPath(Protocol):
+    """the path interface required by `UPathDirEntry`"""
+
+    @property
+    def name(self) -> str: ...
+    @property
+    def info(self) -> PathInfo: ...
+    def stat(self, *, follow_symlinks: bool = ...) -> StatResultType: ...
+
+
+_P = TypeVar("_P", bound=_ScandirPath)
+
+
+class UPathDirEntry(Generic[_P]):
+    """An os.DirEntry compatible object yielded by `UPath.scandir()`.
+
+    Type queries and `stat()` are answered from the info dict returned by
+    the directory listing, so they don't require additional filesystem
+    calls, unless the listing doesn't provide the required information.
+    The full path object is available via `entry.upath`.
+    """
+
+    __slots__ = ("_upath", "_stat")
+
+    def __init__(self, upath: _P) -> None:
+        self._upath = upath
+        self._stat: StatResultType | None = None
+
+    @property
+    def name(self) -> str:
+        """The entry's base filename, relative to the scandir() path."""
+        return self._upath.name
+
+    @property
+    def path(self) -> str:
+        """The entry's full path as a string."""
+        return str(self._upath)
+
+    @property
+    def upath(self) -> _P:
+        """The entry's full path as a UPath instance."""
+        return self._upath
+
+    def is_dir(self, *, follow_symlinks: bool = True) -> bool:
+        return self._upath.info.is_dir(follow_symlinks=follow_symlinks)
+
+    def is_file(self, *, follow_symlinks: bool = True) -> bool:
+        return self._upath.info.is_file(follow_symlinks=follow_symlinks)
+
+    def is_symlink(self) -> bool:
+        return self._upath.info.is_symlink()
+
+    def stat(self, *, follow_symlinks: bool = True) -> StatResultType:
+        if self._stat is None:
+            info = self._upath.info
+            listing = info._info if isinstance(info, UPathInfo) else None
+            # some listings (i.e. http) don't report sizes, in which case
+            # we fall back to requesting the info for the entry
+            if listing and listing.get("size") is not None:
+                self._stat = UPathStatResult.from_info(listing)
+            else:
+                self._stat = self._upath.stat(follow_symlinks=follow_symlinks)
+        return self._stat
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.name!r}>"
+
+
+class UPathScandirIterator(Generic[_P]):
+    """Iterator of `UPathDirEntry` objects returned by `UPath.scandir()`.
+
+    Like the iterator returned by `os.scandir()`, it can be used as a
+    context manager.
+    """
+
+    __slots__ = ("_it",)
+
+    def __init__(self, paths: Iterator[_P]) -> None:
+        self._it: Iterator[_P] | None = paths
+
+    def __iter__(self) -> Self:
+        return self
+
+    def __next__(self) -> UPathDirEntry[_P]:
+        if self._it is None:
+            raise StopIteration
+        return UPathDirEntry(next(self._it))
+
+    def close(self) -> None:
+        it, self._it = self._it, None
+        close = getattr(it, "close", None)
+        if close is not None:
+            close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.close()
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import sys
+from collections.abc import Iterator
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+from typing import overload
+
+if TYPE_CHECKING:
+    if sys.version_info >= (3, 11):
+        from typing import Self
+    else:
+        from typing_extensions import Self
+
+    from upath.core import UPath
+
+__all__ = [
+    "UPathSequence",
+]
+
+
+class UPathSequence(Sequence["UPath"]):
+    """A compact, read-only sequence of paths returned by `UPath.from_strings()`.
+
+    Only the stripped path strings are stored. UPath instances are
+    created from a template path when they are accessed. Items that
+    could not be derived from the template are stored as UPath
+    instances.
+    """
+
+    __slots__ = ("_template", "_items")
+
+    def __init__(
+        self,
+        template: UPath | None,
+        items: Sequence[str | UPath],
+    ) -> None:
+        self._template = template
+        self._items = items
+
+    def _materialize(self, item: str | UPath) -> UPath:
+        if not isinstance(item, str):
+            return item
+        template = self._template
+        assert template is not None
+        chain = type(template._chain)(template._chain.current._replace(path=item))
+        return template._from_chain(chain, (item,))
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @overload
+    def __getitem__(self, index: int) -> UPath: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Self: ...
+
+    def __getitem__(self, index: int | slice) -> UPath | Self:
+        if isinstance(index, slice):
+            return type(self)(self._template, self._items[index])
+        return self._materialize(self._items[index])
+
+    def __iter__(self) -> Iterator[UPath]:
+        return map(self._materialize, self._items)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} of {len(self)} paths>"
@@ -2,26 +2,49 @@ from __future__ import annotations
 
 import os
 import warnings
+from array import array
+from collections.abc import Iterable
 from collections.abc import Iterator
 from collections.abc import Mapping
 from collections.abc import Sequence
 from datetime import datetime
+from enum import IntEnum
+from itertools import islice
 from stat import S_IFDIR
 from stat import S_IFLNK
 from stat import S_IFREG
 from typing import Any
+from typing import Callable
+from typing import NamedTuple
 
 __all__ = [
+    "UPathStatColumns",
     "UPathStatResult",
+    "UPathStatType",
 ]
 
+# info dict keys of the modification time, in order of preference
+_MTIME_KEYS = (
+    "mtime",
+    "LastModified",
+    "last_modified",
+    "timeModified",
+    "modificationTime",
+    "modified_at",
+    "modify",
+)
+_ETAG_KEYS = ("ETag", "etag")
+
+# length of the YYYYMMDDHHMMSS modification times reported by FTP servers
+_FTP_MTIME_LENGTH = 14
+
 
 def _convert_value_to_timestamp(value: Any) -> int | float:
     """Try to convert a datetime-like value to a timestamp."""
     if isinstance(value, (int, float)):
         return value
     elif isinstance(value, str):
-        if len(value) == 14:
+        if len(value) == _FTP_MTIME_LENGTH:
             return datetime.strptime(value, r"%Y%m%d%H%M%S").timestamp()
         if value.endswith("Z"):
             value = value[:-1] + "+00:00"
@@ -257,15 +280,7 @@ class UPathStatResult:
     @property
     def st_mtime(self) -> int | float:
         """time of last modification"""
-        for key in [
-            "mtime",
-            "LastModified",
-            "last_modified",
-            "timeModified",
-            "modificationTime",
-            "modified_at",
-            "modify",
-        ]:
+        for key in _MTIME_KEYS:
             try:
                 raw_value = self._info[key]
             except KeyError:
@@ -434,3 +449,159 @@ class UPathStatResult:
             stacklevel=2,
         )
         return self._info.copy()
+
+
+def _column(infos: Sequence[Mapping[str, Any] | None], keys: Sequence[str]) -> list:
+    """return the values of the first of keys in every info dict or None
+
+    The key is looked up once per batch, assuming that the info dicts of
+    a batch come from the same filesystem. Only rows without that key are
+    looked up individually.
+    """
+    key = next((k for info in infos if info for k in keys if k in info), None)
+    if key is None:
+        return [None] * len(infos)
+    values = [None if info is None else info.get(key) for info in infos]
+    for index, value in enumerate(values):
+        info = infos[index]
+        if value is None and info:
+            values[index] = next((info[k] for k in keys if k in info), None)
+    return values
+
+
+def _parse_isoformat(value: str) -> float:
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    return datetime.fromisoformat(value).timestamp()
+
+
+def _timestamp_or_zero(value: Any) -> float:
+    if value is None:
+        return 0.0
+    try:
+        return float(_convert_value_to_timestamp(value))
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _timestamps(values: list[Any]) -> array[float]:
+    """convert a column of datetime-like values to timestamps
+
+    The conversion is picked once per column from the first value, and
+    only mixed columns are converted value by value. Missing and invalid
+    values are converted to 0.
+    """
+    first = next((v for v in values if v is not None), None)
+    convert: Callable[[Any], float]
+    try:
+        if first is None or isinstance(first, (int, float)):
+            return array("d", [0.0 if v is None else v for v in values])
+        elif isinstance(first, datetime):
+            convert = datetime.timestamp
+        elif isinstance(first, str) and len(first) != _FTP_MTIME_LENGTH:
+            convert = _parse_isoformat
+        else:
+            raise TypeError
+        return array("d", [0.0 if v is None else convert(v) for v in values])
+    except (TypeError, ValueError):
+        return array("d", map(_timestamp_or_zero, values))
+
+
+class UPathStatType(IntEnum):
+    """The type of a path in the `types` column of UPathStatColumns."""
+
+    MISSING = -1
+    OTHER = 0
+    FILE = 1
+    DIRECTORY = 2
+
+
+class UPathStatColumns(NamedTuple):
+    """Columnar stat results of many paths.
+
+    Returned by `UPath.stat_many()` and `UPath.stat_children()`. Every
+    column holds one value per path. The numeric columns are compact
+    `array.array` instances, and `as_numpy()` exposes them as numpy
+    arrays without copying.
+
+    Attributes
+    ----------
+    names :
+        The paths, without protocol.
+    sizes :
+        The sizes in bytes, 0 if unknown.
+    mtimes :
+        The modification times as POSIX timestamps, 0 if unknown.
+    types :
+        One `UPathStatType` value per path.
+    etags :
+        The entity tags reported by object stores, or None.
+    """
+
+    names: list[str]
+    sizes: array[int]
+    mtimes: array[float]
+    types: array[int]
+    etags: list[str | None]
+
+    @classmethod
+    def from_infos(
+        cls,
+        infos: Iterable[Mapping[str, Any] | None],
+        names: Iterable[str] | None = None,
+        *,
+        batch_size: int = 1000,
+    ) -> UPathStatColumns:
+        """Create UPathStatColumns from fsspec info dicts.
+
+        The info dicts are consumed in batches of `batch_size`, so that
+        they can be streamed from a listing. None marks a missing path,
+        which requires its name to be provided via `names`.
+        """
+        columns = cls([], array("q"), array("d"), array("b"), [])
+        it = iter(infos)
+        name_it = None if names is None else iter(names)
+        types: dict[str | None, UPathStatType] = {
+            "file": UPathStatType.FILE,
+            "directory": UPathStatType.DIRECTORY,
+        }
+        while batch := list(islice(it, batch_size)):
+            if name_it is None:
+                columns.names.extend(
+                    [info["name"] for info in batch]  # type: ignore[index]
+                )
+            else:
+                columns.names.extend(islice(name_it, len(batch)))
+            columns.sizes.extend(
+                [int(info.get("size") or 0) if info else 0 for info in batch]
+            )
+            columns.mtimes.extend(_timestamps(_column(batch, _MTIME_KEYS)))
+            columns.types.extend(
+                [
+                    (
+                        types.get(info.get("type"), UPathStatType.OTHER)
+                        if info
+                        else UPathStatType.MISSING
+                    )
+                    for info in batch
+                ]
+            )
+            columns.etags.extend(_column(batch, _ETAG_KEYS))
+        return columns
+
+    def as_numpy(self) -> dict[str, Any]:
+        """Return the columns as a dict of numpy arrays.
+
+        The numeric columns share the memory of the arrays. The names and
+        etags are returned as lists, so the dict can be passed to i.e.
+        `pandas.DataFrame`.
+        """
+        import numpy as np
+
+        return {
+            "names": self.names,
+            "sizes": np.frombuffer(self.sizes, dtype=np.int64),
+            "mtimes": np.frombuffer(self.mtimes, dtype=np.float64),
+            "types": np.frombuffer(self.types, dtype=np.int8),
+            "etags": self.etags,
+        }
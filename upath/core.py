@@ -2,41 +2,76 @@
 
 from __future__ import annotations
 
+import asyncio
+import os
 import sys
 import warnings
 from abc import ABCMeta
 from abc import abstractmethod
+from collections import Counter
+from collections.abc import AsyncIterator
+from collections.abc import Iterable
 from collections.abc import Iterator
 from collections.abc import Mapping
 from collections.abc import Sequence
+from contextlib import closing
+from contextlib import contextmanager
 from copy import copy
+from functools import lru_cache
 from pathlib import PurePath
 from types import MappingProxyType
 from typing import IO
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import BinaryIO
+from typing import Callable
 from typing import Literal
 from typing import NoReturn
+from typing import Protocol
 from typing import TextIO
 from typing import TypeVar
 from typing import overload
 from urllib.parse import SplitResult
 from urllib.parse import urlsplit
 
+from fsspec.callbacks import DEFAULT_CALLBACK
+from fsspec.callbacks import Callback
 from fsspec.registry import get_filesystem_class
 from fsspec.spec import AbstractFileSystem
 
+from upath._bulk import call_concurrently
+from upath._bulk import cat_concurrently
+from upath._bulk import cat_ranges_concurrently
+from upath._bulk import coalesce_ranges
+from upath._bulk import rm_batched
+from upath._bulk import split_ranges
+from upath._cache import DEFAULT_LISTING_CACHE
+from upath._cache import ListingCache
+from upath._cache import get_listing_cache
+from upath._cache import invalidate_listing_caches
+from upath._cache import use_listing_cache
 from upath._chain import DEFAULT_CHAIN_PARSER
 from upath._chain import Chain
 from upath._chain import FSSpecChainParser
+from upath._copy import copy_files
 from upath._flavour import LazyFlavourDescriptor
 from upath._flavour import WrappedFileSystemFlavour
 from upath._flavour import upath_get_kwargs_from_url
 from upath._flavour import upath_urijoin
+from upath._glob import compile_pattern
+from upath._glob import iter_listing
+from upath._glob import plan_glob
 from upath._info import UPathInfo
+from upath._optimistic import is_optimistic
+from upath._optimistic import supports_conditional_create
+from upath._optimistic import use_optimistic
+from upath._pool import DEFAULT_FILESYSTEM_POOL
+from upath._protocol import _match_protocol
 from upath._protocol import compatible_protocol
 from upath._protocol import get_upath_protocol
+from upath._scandir import UPathScandirIterator
+from upath._sequence import UPathSequence
+from upath._stat import UPathStatColumns
 from upath._stat import UPathStatResult
 from upath.registry import _get_implementation_protocols
 from upath.registry import available_implementations
@@ -66,30 +101,153 @@ if TYPE_CHECKING:
         from typing import Self
     else:
         from typing_extensions import Self
+    if sys.version_info >= (3, 12):
+        from collections.abc import Buffer
+    else:
+        from typing_extensions import Buffer
 
+    from fsspec.asyn import AsyncFileSystem
     from pydantic import GetCoreSchemaHandler
     from pydantic_core.core_schema import CoreSchema
 
     _MT = TypeVar("_MT")
     _WT = TypeVar("_WT", bound="WritablePath")
+    _IOT = TypeVar("_IOT", bound=IO[Any])
+
+    class _BlockingPath(Protocol):
+        """the blocking methods used by the asynchronous fallbacks"""
+
+        def read_bytes(self) -> bytes: ...
+        def write_bytes(self, data: bytes) -> int: ...
+        def exists(self) -> bool: ...
+        def stat(self) -> StatResultType: ...
+        def iterdir(self) -> Iterator[Self]: ...
+        def unlink(self, missing_ok: bool = False) -> None: ...
+
+        def glob(
+            self, pattern: str, *, case_sensitive: bool | None = None
+        ) -> Iterator[Self]: ...
+
+        @property
+        def copy(self) -> Callable[..., Any]: ...
+
+    _BP = TypeVar("_BP", bound=_BlockingPath)
 
 __all__ = [
     "UPath",
     "UnsupportedOperation",
 ]
 
-_FSSPEC_HAS_WORKING_GLOB = None
 
+@lru_cache(maxsize=None)
+def _supports_lexical_join(cls: type[UPath]) -> bool:
+    """check if with_segments can skip the constructor for this class
+
+    Only the classes shipped with universal_pathlib are known to not require
+    any additional initialization in their constructor for joined paths.
+    """
+    return all(
+        c.__module__ == __name__ or c.__module__.startswith("upath.implementations.")
+        for c in cls.__mro__
+        if issubclass(c, UPath)
+    )
+
+
+def _is_plain_relative_segment(segment: str, parser: UPathParser) -> bool:
+    """check if segment is a relative path segment without protocol"""
+    return bool(
+        segment
+        and not segment.startswith(parser.sep)
+        and (not parser.altsep or parser.altsep not in segment)
+        and "::" not in segment
+        and ":" not in segment
+    )
+
+
+def _entry_name(entry: Mapping[str, Any] | str) -> str:
+    """helper for extracting the name from fsspec listing entries"""
+    if isinstance(entry, str):
+        return entry
+    return entry.get("name", "")
 
-def _check_fsspec_has_working_glob():
-    global _FSSPEC_HAS_WORKING_GLOB
-    from fsspec.implementations.memory import MemoryFileSystem
 
-    m = type("_M", (MemoryFileSystem,), {"store": {}, "pseudo_dirs": [""]})()
-    m.touch("a.txt")
-    m.touch("f/b.txt")
-    g = _FSSPEC_HAS_WORKING_GLOB = len(m.glob("**/*.txt")) == 2
-    return g
+def _is_ambiguous_listing(
+    listing: Sequence[Mapping[str, Any] | str],
+    name: str,
+    sep: str,
+) -> bool:
+    """check if a listing requires probing whether the path is a directory
+
+    An empty listing, or a single entry named like the path itself (some
+    filesystems list a file as its own content) is ambiguous.
+    """
+    return not listing or (
+        len(listing) == 1
+        and _entry_name(listing[0]).rstrip(sep).rpartition(sep)[2] == name
+    )
+
+
+def _select_existing(
+    fs: AbstractFileSystem,
+    upaths: Sequence[UPath],
+    indices: list[int],
+    results: list[Exception | None],
+    missing_ok: bool,
+    max_concurrency: int,
+) -> list[int]:
+    """helper for checking which of the paths at indices exist on fs
+
+    Errors and, unless missing_ok, missing files are stored in results.
+    """
+    items = ((fs, upaths[index].path) for index in indices)
+    exists = [False] * len(indices)
+    with closing(call_concurrently("exists", items, max_concurrency)) as completed:
+        for idx, result in completed:
+            if isinstance(result, Exception):
+                results[indices[idx]] = result
+            else:
+                exists[idx] = result
+    for idx, index in enumerate(indices):
+        if not exists[idx] and results[index] is None and not missing_ok:
+            results[index] = FileNotFoundError(str(upaths[index]))
+    return [index for idx, index in enumerate(indices) if exists[idx]]
+
+
+def _readinto_view(f: BinaryIO, view: memoryview) -> int:
+    """helper for reading a file object into view until it is full or exhausted
+
+    File objects without `readinto()` are read in chunks instead.
+    """
+    readinto = getattr(f, "readinto", None)
+    num_bytes = 0
+    while num_bytes < view.nbytes:
+        if readinto is not None:
+            n = readinto(view[num_bytes:])
+        else:
+            data = f.read(view.nbytes - num_bytes)
+            n = len(data)
+            view[num_bytes : num_bytes + n] = data
+        if not n:
+            break
+        num_bytes += n
+    return num_bytes
+
+
+def _invalidate_on_close(f: _IOT, path: UPath) -> _IOT:
+    """helper for invalidating the listing caches of path when f is closed
+
+    Entries listed while the file was written are stale once it is closed.
+    """
+    close = f.close
+
+    def _close() -> None:
+        try:
+            close()
+        finally:
+            path._invalidate_listing_caches()
+
+    f.close = _close  # type: ignore[method-assign]
+    return f
 
 
 def _make_instance(cls, args, kwargs):
@@ -242,6 +400,56 @@ class _UPathMixin(metaclass=_UPathMeta):
     def _relative_base(self, value: str | None) -> None:
         raise NotImplementedError
 
+    # storage backing `_chain` and `_relative_base`, which `__init__` sets
+    # directly to clear the cached attributes only once
+    @property
+    def _chain_value(self) -> Chain:
+        raise NotImplementedError
+
+    @_chain_value.setter
+    def _chain_value(self, value: Chain) -> None:
+        raise NotImplementedError
+
+    @property
+    def _relative_base_value(self) -> str | None:
+        raise NotImplementedError
+
+    @_relative_base_value.setter
+    def _relative_base_value(self, value: str | None) -> None:
+        raise NotImplementedError
+
+    # the (first arg, protocol arg, detected protocol) of __new__, which
+    # __init__ reuses instead of detecting the protocol again. Not stored
+    # by LocalPath, which is initialized by pathlib
+    @property
+    def _detected_protocol(self) -> tuple[Any, str | None, str] | None:
+        return None
+
+    @_detected_protocol.setter
+    def _detected_protocol(self, value: tuple[Any, str | None, str] | None) -> None:
+        pass
+
+    def _clear_cached_attributes(self) -> None:
+        """reset the lazily computed attributes derived from the chain"""
+
+    def _pop_detected_protocol(
+        self,
+        args: tuple[JoinablePathLike, ...],
+        protocol: str | None,
+    ) -> str:
+        """return the protocol of args, as detected by __new__ if possible"""
+        arg0 = args[0] if args else ""
+        try:
+            detected = self._detected_protocol
+        except AttributeError:
+            detected = None
+        else:
+            self._detected_protocol = None
+        # __init__ can be called with other args, i.e. by subclasses
+        if detected is not None and detected[0] is arg0 and detected[1] == protocol:
+            return detected[2]
+        return get_upath_protocol(arg0, protocol=protocol)
+
     # === upath.UPath PUBLIC ADDITIONAL API ===========================
 
     @property
@@ -353,6 +561,9 @@ class _UPathMixin(metaclass=_UPathMeta):
             return self.parser.strip_protocol(path)
         return self._chain.active_path
 
+    def _invalidate_listing_caches(self, *, recursive: bool = False) -> None:
+        invalidate_listing_caches(self.fs, self.path, recursive=recursive)
+
     def joinuri(self, uri: JoinablePathLike) -> UPath:
         """Join with urljoin behavior for UPath instances.
 
@@ -378,6 +589,143 @@ class _UPathMixin(metaclass=_UPathMeta):
             **self.storage_options,
         )
 
+    def read_ranges(
+        self,
+        ranges: Sequence[tuple[int, int]],
+        *,
+        max_gap: int = 2**16,
+        max_concurrency: int = 8,
+    ) -> list[memoryview]:
+        """Read many (start, end) byte ranges of the file.
+
+        Ranges that are at most `max_gap` bytes apart are coalesced into
+        one request, and the requests run concurrently on async
+        filesystems (up to `max_concurrency` at a time). Negative offsets
+        count from the end of the file.
+
+        Returns
+        -------
+        : list of memoryview
+            Read-only, zero-copy views of the requested ranges into the
+            fetched buffers, in the order of `ranges`. Ranges reaching
+            past the end of the file are truncated.
+
+        Examples
+        --------
+        >>> from upath import UPath
+        >>> p = UPath("memory:///file.txt")
+        >>> p.write_bytes(b"hello world")
+        11
+        >>> [bytes(view) for view in p.read_ranges([(0, 5), (6, 11)])]
+        [b'hello', b'world']
+
+        """
+        ranges = list(ranges)
+        if any(start < 0 or end < 0 for start, end in ranges):
+            size = self.fs.size(self.path)
+            ranges = [
+                (
+                    max(start + size, 0) if start < 0 else start,
+                    max(end + size, 0) if end < 0 else end,
+                )
+                for start, end in ranges
+            ]
+        views = [memoryview(b"")] * len(ranges)
+        blocks = coalesce_ranges(ranges, max_gap)
+        with closing(
+            cat_ranges_concurrently(
+                self.fs,
+                self.path,
+                [(start, end) for start, end, _ in blocks],
+                max_concurrency,
+                exact=False,
+            )
+        ) as completed:
+            for block_index, data in completed:
+                block_start, _, indices = blocks[block_index]
+                block = memoryview(data).toreadonly()
+                for index in indices:
+                    start, end = ranges[index]
+                    views[index] = block[start - block_start : end - block_start]
+        return views
+
+    def stat_children(self, *, recursive: bool = False) -> UPathStatColumns:
+        """Return the sizes, mtimes, types and etags of the children of
+        this directory as columns.
+
+        The columns are collected from the directory listing, without
+        requesting the info of every child. Listings of s3 and gcs are
+        streamed page by page.
+
+        Parameters
+        ----------
+        recursive :
+            If True, return the columns of all files below this directory
+            instead. Directories are not included.
+
+        Returns
+        -------
+        : UPathStatColumns
+            The columns of the children, in the order they are listed.
+
+        """
+        return UPathStatColumns.from_infos(
+            iter_listing(self.fs, self.path, recursive=recursive)
+        )
+
+    # --- asynchronous API --------------------------------------------
+    #
+    # These methods run the blocking methods in a worker thread. UPath
+    # overrides them to await the coroutines of async filesystems
+    # directly.
+
+    async def aread_bytes(self: _BlockingPath) -> bytes:
+        """Asynchronously read the contents of the file as bytes."""
+        return await asyncio.to_thread(self.read_bytes)
+
+    async def awrite_bytes(self: _BlockingPath, data: bytes) -> int:
+        """Asynchronously write bytes to the file."""
+        return await asyncio.to_thread(self.write_bytes, data)
+
+    async def aexists(self: _BlockingPath) -> bool:
+        """Asynchronously check whether this path exists."""
+        return await asyncio.to_thread(self.exists)
+
+    async def astat(self: _BlockingPath) -> StatResultType:
+        """Asynchronously return the stat result for this path."""
+        return await asyncio.to_thread(self.stat)
+
+    async def aiterdir(self: _BP) -> AsyncIterator[_BP]:
+        """Asynchronously yield path objects of the directory contents."""
+        children = await asyncio.to_thread(lambda: list(self.iterdir()))
+        for child in children:
+            yield child
+
+    async def aglob(
+        self: _BP,
+        pattern: str,
+        *,
+        case_sensitive: bool | None = None,
+    ) -> AsyncIterator[_BP]:
+        """Asynchronously yield all existing paths matching the pattern.
+
+        The matches are collected by `glob()` in a worker thread, for all
+        filesystems, so that the results of both methods are the same.
+        """
+        matches = await asyncio.to_thread(
+            lambda: list(self.glob(pattern, case_sensitive=case_sensitive))
+        )
+        for match in matches:
+            yield match
+
+    async def aunlink(self: _BlockingPath, missing_ok: bool = False) -> None:
+        """Asynchronously remove this file."""
+        await asyncio.to_thread(self.unlink, missing_ok=missing_ok)
+
+    async def acopy(self: _BlockingPath, target: Any, **kwargs: Any) -> Any:
+        """Asynchronously copy this file or directory tree to target."""
+        return await asyncio.to_thread(self.copy, target, **kwargs)
+
     # === upath.UPath CUSTOMIZABLE API ================================
 
     @classmethod
@@ -398,7 +746,12 @@ class _UPathMixin(metaclass=_UPathMeta):
         storage_options: Mapping[str, Any],
     ) -> dict[str, Any]:
         """Parse storage_options from the urlpath"""
-        pth_storage_options = upath_get_kwargs_from_url(urlpath)
+        if protocol:
+            # the protocol has already been detected, avoid doing it again
+            flavour = WrappedFileSystemFlavour.from_protocol(protocol)
+            pth_storage_options = flavour.get_kwargs_from_url(urlpath)
+        else:
+            pth_storage_options = upath_get_kwargs_from_url(urlpath)
         return {**pth_storage_options, **storage_options}
 
     @classmethod
@@ -408,9 +761,13 @@ class _UPathMixin(metaclass=_UPathMeta):
         protocol: str,
         storage_options: Mapping[str, Any],
     ) -> AbstractFileSystem:
-        """Instantiate the filesystem_spec filesystem class"""
+        """Instantiate the filesystem_spec filesystem class
+
+        Instances are shared via the process-wide filesystem pool, so that
+        independently constructed paths reuse clients and sessions.
+        """
         fs_cls = get_filesystem_class(protocol)
-        return fs_cls(**storage_options)
+        return DEFAULT_FILESYSTEM_POOL.get(fs_cls, storage_options)
 
     # === upath.UPath constructor =====================================
 
@@ -447,6 +804,7 @@ class _UPathMixin(metaclass=_UPathMeta):
             if "incompatible with" in str(e):
                 raise _IncompatibleProtocolError(str(e)) from e
             raise
+        detected = (args[0] if args else "", protocol, pth_protocol)
 
         # subclasses should default to their own protocol
         if protocol is None and cls is not UPath:
@@ -520,7 +878,9 @@ class _UPathMixin(metaclass=_UPathMeta):
                 )
             raise _IncompatibleProtocolError(msg)
 
-        return object.__new__(upath_cls)
+        obj = object.__new__(upath_cls)
+        obj._detected_protocol = detected
+        return obj
 
     def __init__(
         self,
@@ -551,12 +911,7 @@ class _UPathMixin(metaclass=_UPathMeta):
             Additional storage options for the path.
 
         """
-        # todo: avoid duplicating this call from __new__
-        protocol = get_upath_protocol(
-            args[0] if args else "",
-            protocol=protocol,
-            storage_options=storage_options,
-        )
+        protocol = self._pop_detected_protocol(args, protocol)
         args, protocol, storage_options = type(self)._transform_init_args(
             args, protocol, storage_options
         )
@@ -575,6 +930,7 @@ class _UPathMixin(metaclass=_UPathMeta):
             if impl_protocols:
                 protocol = impl_protocols[0]
 
+        url_parsed = False
         if args:
             args0 = args[0]
             if isinstance(args0, UPath):
@@ -599,6 +955,7 @@ class _UPathMixin(metaclass=_UPathMeta):
                 storage_options = type(self)._parse_storage_options(
                     str_args0, protocol, storage_options
                 )
+                url_parsed = True
         else:
             str_args0 = "."
 
@@ -606,18 +963,23 @@ class _UPathMixin(metaclass=_UPathMeta):
             str_args0,
             protocol=protocol,
             storage_options=storage_options,
+            url_parsed=url_parsed,
         )
-        # FIXME: normalization needs to happen in unchain already...
-        chain = Chain.from_list(Chain.from_list(segments).to_list())
+        if len(segments) == 1 and "target_protocol" not in segments[0].storage_options:
+            chain = Chain(*segments)
+        else:
+            # FIXME: normalization needs to happen in unchain already...
+            chain = Chain.from_list(Chain.from_list(segments).to_list())
         if len(args) > 1:
             flavour = WrappedFileSystemFlavour.from_protocol(chain.active_path_protocol)
             joined = flavour.join(chain.active_path, *args[1:])
             stripped = flavour.strip_protocol(joined)
             chain = chain.replace(path=stripped)
-        self._chain = chain
+        self._chain_value = chain
         self._chain_parser = chain_parser
         self._raw_urlpaths = args
-        self._relative_base = None
+        self._relative_base_value = None
+        self._clear_cached_attributes()
 
     # --- deprecated attributes ---------------------------------------
 
@@ -812,19 +1174,35 @@ class UPath(_UPathMixin, WritablePath, ReadablePath):
     """
 
     __slots__ = (
-        "_chain",
+        "_chain_value",
         "_chain_parser",
+        "_detected_protocol",
         "_fs_cached",
+        "_hash_cached",
+        "_info_cached",
+        "_name_cached",
+        "_parent_cached",
+        "_parts_cached",
         "_raw_urlpaths",
-        "_relative_base",
+        "_relative_base_value",
+        "_str_cached",
+        "_vfspath_cached",
     )
 
     if TYPE_CHECKING:  # noqa: C901
-        _chain: Chain
+        _chain_value: Chain
         _chain_parser: FSSpecChainParser
+        _detected_protocol: tuple[Any, str | None, str] | None
         _fs_cached: AbstractFileSystem
+        _hash_cached: int | None
+        _info_cached: UPathInfo | None
+        _name_cached: str | None
+        _parent_cached: Self | None
+        _parts_cached: Sequence[str] | None
         _raw_urlpaths: Sequence[JoinablePathLike]
-        _relative_base: str | None
+        _relative_base_value: str | None
+        _str_cached: str | None
+        _vfspath_cached: str | None
 
         @overload
         def __new__(
@@ -986,12 +1364,68 @@ class UPath(_UPathMixin, WritablePath, ReadablePath):
             **storage_options: Any,
         ) -> Self: ...
 
+    # === cached attributes ===========================================
+
+    @property
+    def _chain(self) -> Chain:
+        return self._chain_value
+
+    @_chain.setter
+    def _chain(self, value: Chain) -> None:
+        self._chain_value = value
+        self._clear_cached_attributes()
+
+    @property
+    def _relative_base(self) -> str | None:
+        return self._relative_base_value
+
+    @_relative_base.setter
+    def _relative_base(self, value: str | None) -> None:
+        self._relative_base_value = value
+        self._clear_cached_attributes()
+
+    def _clear_cached_attributes(self) -> None:
+        """reset the lazily computed attributes derived from the chain"""
+        self._hash_cached = None
+        self._info_cached = None
+        self._name_cached = None
+        self._parent_cached = None
+        self._parts_cached = None
+        self._str_cached = None
+        self._vfspath_cached = None
+
+    def _invalidate_listing_caches(self, *, recursive: bool = False) -> None:
+        # the info attached by iterdir() is outdated after writing
+        self._info_cached = None
+        super()._invalidate_listing_caches(recursive=recursive)
+
     # === JoinablePath attributes =====================================
 
     parser: UPathParser = LazyFlavourDescriptor()  # type: ignore[assignment]
 
     def with_segments(self, *pathsegments: JoinablePathLike) -> Self:
         """Construct a new path object from any number of path-like objects."""
+        # fast-path: joining a plain relative str segment to this path
+        # can be done lexically without re-parsing the chain
+        if (
+            len(pathsegments) == 2
+            and self._relative_base is None
+            and len(self._chain) == 1
+            and _supports_lexical_join(type(self))
+        ):
+            base, segment = pathsegments
+            if (
+                type(base) is str
+                and type(segment) is str
+                and _is_plain_relative_segment(segment, self.parser)
+                and base == self.__vfspath__()
+            ):
+                flavour = self.parser
+                path = flavour.strip_protocol(
+                    flavour.join(self._chain.active_path, segment)
+                )
+                return self._from_chain(self._chain.replace(path=path), pathsegments)
+
         # we change joinpath behavior if called from a relative path
         # this is not fully ideal, but currently the best way to move forward
         if is_relative := self._relative_base is not None:
@@ -1009,7 +1443,25 @@ class UPath(_UPathMixin, WritablePath, ReadablePath):
             new_instance._relative_base = self._relative_base
         return new_instance
 
+    def _from_chain(
+        self,
+        chain: Chain,
+        raw_urlpaths: Sequence[JoinablePathLike],
+    ) -> Self:
+        """create a new instance of this class from a chain, skipping parsing"""
+        obj = object.__new__(type(self))
+        obj._chain_value = chain
+        obj._chain_parser = self._chain_parser
+        obj._raw_urlpaths = raw_urlpaths
+        obj._relative_base_value = None
+        obj._clear_cached_attributes()
+        if hasattr(self, "_fs_cached"):
+            obj._fs_cached = self._fs_cached
+        return obj
+
     def __str__(self) -> str:
+        if self._str_cached is not None:
+            return self._str_cached
         if self._relative_base is not None:
             active_path = self._chain.active_path
             stripped_base = self.parser.strip_protocol(
@@ -1020,18 +1472,24 @@ class UPath(_UPathMixin, WritablePath, ReadablePath):
                     f"{active_path!r} is not a subpath of {stripped_base!r}"
                 )
 
-            return (
+            s = (
                 active_path.removeprefix(stripped_base).removeprefix(self.parser.sep)
                 or "."
             )
         else:
-            return self._chain_parser.chain(self._chain.to_list())[0]
+            s = self._chain_parser.chain(self._chain.to_list())[0]
+        self._str_cached = s
+        return s
 
     def __vfspath__(self) -> str:
+        if self._vfspath_cached is not None:
+            return self._vfspath_cached
         if self._relative_base is not None:
-            return self.__str__()
+            vfspath = self.__str__()
         else:
-            return self.path
+            vfspath = self.path
+        self._vfspath_cached = vfspath
+        return vfspath
 
     def __repr__(self) -> str:
         cls_name = type(self).__name__
@@ -1058,6 +1516,11 @@ class UPath(_UPathMixin, WritablePath, ReadablePath):
         ('/', 'foo', 'bar', 'baz.txt')
 
         """
+        if self._parts_cached is None:
+            self._parts_cached = self._parse_parts()
+        return self._parts_cached
+
+    def _parse_parts(self) -> tuple[str, ...]:
         # For relative paths, return parts of the relative path only
         if self._relative_base is not None:
             rel_str = str(self)
@@ -1118,6 +1581,8 @@ class UPath(_UPathMixin, WritablePath, ReadablePath):
         S3Path('s3://my-bucket/path/to')
 
         """
+        if self._parent_cached is not None:
+            return self._parent_cached
         if self._relative_base is not None:
             if str(self) == ".":
                 return self
@@ -1131,8 +1596,19 @@ class UPath(_UPathMixin, WritablePath, ReadablePath):
                 )
                 parent = pth.parent
                 parent._relative_base = self._relative_base
-                return parent
-        return super().parent
+        else:
+            parent = super().parent
+        # don't cache the anchor's parent to avoid a reference cycle
+        if parent is not self:
+            self._parent_cached = parent
+        return parent
+
+    @property
+    def name(self) -> str:
+        """The final path component, if any."""
+        if self._name_cached is None:
+            self._name_cached = super().name
+        return self._name_cached
 
     @property
     def parents(self) -> Sequence[Self]:
@@ -1190,6 +1666,13 @@ class UPath(_UPathMixin, WritablePath, ReadablePath):
 
     # === ReadablePath attributes =====================================
 
+    # list the directory before checking if the path is a directory, and
+    # only probe the path type if the listing is empty or ambiguous
+    _iterdir_list_first: bool = True
+
+    # walk the directory tree via a single recursive listing
+    _walk_recursive_listing: bool = False
+
     @property
     def info(self) -> PathInfo:
         """
@@ -1200,8 +1683,18 @@ class UPath(_UPathMixin, WritablePath, ReadablePath):
         -------
         : UPathInfo
             The UPathInfo object for this path.
+
+        Notes
+        -----
+        Paths yielded by `iterdir()` carry the info returned by the directory
+        listing, so type queries on them don't require additional filesystem
+        calls. The listing info is dropped when writing through the path.
+        Call `info.refresh()` to fetch up-to-date information.
         """
-        return UPathInfo(self)
+        info = self._info_cached
+        if info is None:
+            return UPathInfo(self)
+        return info
 
     def iterdir(self) -> Iterator[Self]:
         """Yield path objects of the directory contents.
@@ -1224,22 +1717,297 @@ class UPath(_UPathMixin, WritablePath, ReadablePath):
             base = self.parent
         fs = base.fs
         base_path = base.path
-        if not fs.isdir(base_path):
-            raise NotADirectoryError(str(self))
-        for name in fs.listdir(base_path):
+        cache = get_listing_cache()
+        if cache is not None:
+            listing = cache.get_listing(fs, base_path)
+            if listing is not None:
+                yield from base._iterdir_children(base_path, listing)
+                return
+        if self._iterdir_list_first:
+            try:
+                listing = fs.ls(base_path, detail=True)
+            except (FileNotFoundError, NotADirectoryError):
+                listing = []
+            if _is_ambiguous_listing(listing, base.name, sep):
+                if not fs.isdir(base_path):
+                    raise NotADirectoryError(str(self))
+        else:
+            if not fs.isdir(base_path):
+                raise NotADirectoryError(str(self))
+            listing = fs.ls(base_path, detail=True)
+        if cache is not None and listing:
+            cache.put_listing(fs, base_path, listing)
+        yield from base._iterdir_children(base_path, listing)
+
+    def _iterdir_children(
+        self,
+        base_path: str,
+        listing: Sequence[Mapping[str, Any] | str],
+    ) -> Iterator[Self]:
+        """yield the child paths for a directory listing of this path"""
+        sep = self.parser.sep
+        entries: list[tuple[str, Mapping[str, Any] | None]] = []
+        for item in listing:
             # fsspec returns dictionaries
-            if isinstance(name, dict):
-                name = name.get("name")
+            entry: Mapping[str, Any] | None
+            if isinstance(item, str):
+                name, entry = item, None
+            else:
+                name, entry = item["name"], item
             if name in {".", ".."}:
                 # Yielding a path object for these makes little sense
                 continue
             # only want the path name with iterdir
-            _, _, name = name.removesuffix(sep).rpartition(self.parser.sep)
-            yield base.with_segments(base_path, name)
+            _, _, name = name.removesuffix(sep).rpartition(sep)
+            entries.append((name, entry))
+        # some filesystems list a name twice (i.e. an object key colliding
+        # with a directory prefix), in which case the info is ambiguous
+        names = Counter(name for name, _ in entries)
+        for name, entry in entries:
+            child = self.with_segments(base_path, name)
+            if entry is not None and names[name] == 1:
+                child._info_cached = UPathInfo(child, entry)
+            yield child
+
+    def scandir(self) -> UPathScandirIterator[Self]:
+        """Return an iterator of `os.DirEntry`-like objects for the
+        directory contents.
+
+        The entries are populated from the directory listing, so calling
+        `is_dir()`, `is_file()` or `stat()` on them requires no additional
+        filesystem calls.
+
+        Examples
+        --------
+        >>> from upath import UPath
+        >>> p = UPath("memory:///foo/")
+        >>> p.joinpath("bar.txt").write_text("hello")
+        5
+        >>> with p.scandir() as entries:
+        ...     for entry in entries:
+        ...         print(entry.name, entry.is_file(), entry.stat().st_size)
+        bar.txt True 5
+
+        """
+        return UPathScandirIterator(iter(list(self.iterdir())))
+
+    def walk(
+        self,
+        top_down: bool = True,
+        on_error: Callable[[Exception], Any] | None = None,
+        follow_symlinks: bool = False,
+    ) -> Iterator[tuple[Self, list[str], list[str]]]:
+        """Walk the directory tree from this directory, similar to os.walk().
+
+        On filesystems with flat namespaces (i.e. object stores) the entire
+        tree is retrieved via a single recursive listing. Otherwise the tree
+        is walked by listing each directory.
+
+        Info
+        ----
+        For fsspec filesystems follow_symlinks is currently ignored.
+
+        Examples
+        --------
+        >>> from upath import UPath
+        >>> p = UPath("memory:///foo")
+        >>> p.joinpath("bar/baz.txt").touch()
+        >>> for dirpath, dirnames, filenames in p.walk():
+        ...     print(dirpath, dirnames, filenames)
+        memory://foo ['bar'] []
+        memory://foo/bar [] ['baz.txt']
+
+        """
+        if not self._walk_recursive_listing:
+            yield from super().walk(top_down, on_error, follow_symlinks)
+            return
+
+        try:
+            tree = self._walk_tree()
+        except OSError as error:
+            if on_error is not None:
+                on_error(error)
+            return
+
+        paths: list[Any] = [(self, "")]
+        while paths:
+            item = paths.pop()
+            if len(item) == 3:
+                yield item
+                continue
+            path, key = item
+            dirnames, filenames = tree[key]
+            dirnames, filenames = list(dirnames), list(filenames)
+            if top_down:
+                yield path, dirnames, filenames
+            else:
+                paths.append((path, dirnames, filenames))
+            prefix = f"{key}{self.parser.sep}" if key else ""
+            paths.extend(
+                (path.joinpath(name), f"{prefix}{name}")
+                for name in reversed(dirnames)
+                if f"{prefix}{name}" in tree
+            )
+
+    def _walk_tree(self) -> dict[str, tuple[list[str], list[str]]]:
+        """map relative directory paths to their dirnames and filenames"""
+        sep = self.parser.sep
+        fs = self.fs
+        base_path = self.path.rstrip(sep)
+        prefix = f"{base_path}{sep}"
+
+        tree: dict[str, tuple[list[str], list[str]]] = {"": ([], [])}
+        found = fs.find(self.path, withdirs=True, detail=True)
+        for name, info in sorted(found.items()):
+            name = name.rstrip(sep)
+            if name == base_path:
+                if info.get("type") != "directory":
+                    raise NotADirectoryError(str(self))
+                continue
+            elif not name.startswith(prefix):
+                continue
+            *parents, basename = name[len(prefix) :].split(sep)
+            key = ""
+            for parent in parents:
+                child_key = f"{key}{sep}{parent}" if key else parent
+                if child_key not in tree:
+                    tree[key][0].append(parent)
+                    tree[child_key] = ([], [])
+                key = child_key
+            child_key = f"{key}{sep}{basename}" if key else basename
+            if info.get("type") == "directory":
+                if child_key not in tree:
+                    tree[key][0].append(basename)
+                    tree[child_key] = ([], [])
+            else:
+                tree[key][1].append(basename)
+
+        if not found and not fs.isdir(self.path):
+            raise NotADirectoryError(str(self))
+        return tree
 
     def __open_reader__(self) -> BinaryIO:
         return self.fs.open(self.path, mode="rb")
 
+    def _fetch_ranges(
+        self,
+        size: int,
+        range_size: int,
+        max_concurrency: int,
+    ) -> Iterator[tuple[int, bytes]]:
+        """yield (offset, data) for all ranges of the file as they arrive"""
+        ranges = split_ranges(size, range_size)
+        with closing(
+            cat_ranges_concurrently(self.fs, self.path, ranges, max_concurrency)
+        ) as completed:
+            for index, data in completed:
+                yield ranges[index][0], data
+
+    def _fetch_ranges_into(
+        self,
+        view: memoryview,
+        range_size: int,
+        max_concurrency: int,
+    ) -> None:
+        """fill view with the first len(view) bytes of the file"""
+        for offset, data in self._fetch_ranges(
+            view.nbytes, range_size, max_concurrency
+        ):
+            view[offset : offset + len(data)] = data
+
+    def read_bytes(
+        self,
+        *,
+        range_size: int | None = None,
+        max_concurrency: int = 8,
+    ) -> bytes:
+        """
+        Open the file in bytes mode, read it, and close the file.
+
+        If `range_size` is given, the file is split into ranges of
+        `range_size` bytes, which are fetched concurrently (up to
+        `max_concurrency` at a time on async filesystems) and assembled
+        into one preallocated buffer. This avoids the throughput limit
+        of a single stream for large objects on s3, gcs or http.
+        """
+        if range_size is None:
+            return super().read_bytes()
+        size = self.fs.size(self.path)
+        if size is None:
+            return super().read_bytes()
+        buffer = bytearray(size)
+        self._fetch_ranges_into(memoryview(buffer), range_size, max_concurrency)
+        return bytes(buffer)
+
+    def read_into(
+        self,
+        buffer: Buffer,
+        *,
+        range_size: int = 2**23,
+        max_concurrency: int = 8,
+    ) -> int:
+        """
+        Read the file into a writable buffer, i.e. a bytearray, a numpy
+        array or a mmap, and return the number of bytes read.
+
+        At most as many bytes as fit into `buffer` are read. The file is
+        fetched in ranges of `range_size` bytes, up to `max_concurrency`
+        at a time on async filesystems, directly into the buffer.
+        """
+        view = memoryview(buffer).cast("B")
+        size = self.fs.size(self.path)
+        if size is None:
+            with self.open("rb") as f:
+                return _readinto_view(f, view)
+        num_bytes = min(size, view.nbytes)
+        self._fetch_ranges_into(view[:num_bytes], range_size, max_concurrency)
+        return num_bytes
+
+    def open_buffer(
+        self,
+        *,
+        range_size: int = 2**23,
+        max_concurrency: int = 8,
+    ) -> memoryview:
+        """
+        Return the contents of the file as a read-only memoryview.
+
+        The file is fetched into a preallocated buffer in ranges of
+        `range_size` bytes, up to `max_concurrency` at a time on async
+        filesystems. Local and memory paths return views of a mmap or of
+        the stored data without copying.
+        """
+        size = self.fs.size(self.path)
+        if size is None:
+            return memoryview(self.read_bytes())
+        buffer = bytearray(size)
+        self._fetch_ranges_into(memoryview(buffer), range_size, max_concurrency)
+        return memoryview(buffer).toreadonly()
+
+    def download_to(
+        self,
+        local_path: str | os.PathLike[str],
+        *,
+        range_size: int = 2**23,
+        max_concurrency: int = 8,
+    ) -> None:
+        """
+        Download the file to `local_path`.
+
+        The file is fetched in ranges of `range_size` bytes, up to
+        `max_concurrency` at a time on async filesystems, and every range
+        is written to its offset in the local file as soon as it arrives.
+        """
+        size = self.fs.size(self.path)
+        if size is None:
+            self.fs.get_file(self.path, os.fspath(local_path))
+            return
+        with open(local_path, "wb") as f:
+            f.truncate(size)
+            for offset, data in self._fetch_ranges(size, range_size, max_concurrency):
+                f.seek(offset)
+                f.write(data)
+
     if sys.version_info >= (3, 14):
 
         def __open_rb__(self, buffering: int = UNSET_DEFAULT) -> BinaryIO:
@@ -1257,6 +2025,10 @@ class UPath(_UPathMixin, WritablePath, ReadablePath):
     def copy(self, target: _WT | SupportsPathLike | str, **kwargs: Any) -> _WT | UPath:
         """
         Recursively copy this file or directory tree to the given destination.
+
+        Files are copied server side if the destination is on the same
+        filesystem. Pass `max_concurrency` to bound the number of
+        concurrent transfers and an fsspec `callback` to track progress.
         """
         if isinstance(target, str):
             proto = get_upath_protocol(target)
@@ -1307,7 +2079,10 @@ class UPath(_UPathMixin, WritablePath, ReadablePath):
         Recursively move this file or directory tree to the given destination.
         """
         target = self.copy(target, **kwargs)
-        self.fs.rm(self.path, recursive=self.is_dir())
+        try:
+            self.fs.rm(self.path, recursive=self.is_dir())
+        finally:
+            self._invalidate_listing_caches(recursive=True)
         return target
 
     @overload
@@ -1343,17 +2118,24 @@ class UPath(_UPathMixin, WritablePath, ReadablePath):
         source: ReadablePath,
         follow_symlinks: bool = True,
         on_name_collision: OnNameCollisionFunc | None = None,
+        max_concurrency: int = 32,
+        callback: Callback = DEFAULT_CALLBACK,
         **kwargs: Any,
     ) -> None:
         """
         UPath custom:: Recursively copy the given path to this path.
+
+        The directory tree is created while walking the source, the files
+        are copied afterwards. Files on the same filesystem are copied
+        server side, and files between the local and a remote filesystem
+        are uploaded or downloaded, concurrently on async filesystems.
+        All other files are streamed through the client.
         """
         # fixme: it would be best if this would be upstreamed
-        from pathlib_abc import vfsopen
         from pathlib_abc import vfspath
-        from pathlib_abc._os import copyfileobj
         from pathlib_abc._os import ensure_different_files
 
+        files: list[tuple[ReadablePath, WritablePath]] = []
         stack: list[tuple[ReadablePath, WritablePath]] = [(source, self)]
         while stack:
             src, dst = stack.pop()
@@ -1364,9 +2146,7 @@ class UPath(_UPathMixin, WritablePath, ReadablePath):
                 dst_file, dst_dir = on_name_collision(src, dst)
                 if dst_file is not None:
                     ensure_different_files(src, dst_file)
-                    with vfsopen(src, "rb") as source_f:
-                        with vfsopen(dst_file, "wb") as target_f:
-                            copyfileobj(source_f, target_f)
+                    files.append((src, dst_file))
                 if dst_dir is not None:
                     children = src.iterdir()
                     dst_dir.mkdir()
@@ -1381,12 +2161,24 @@ class UPath(_UPathMixin, WritablePath, ReadablePath):
                     stack.append((child, dst.joinpath(child.name)))
             else:
                 ensure_different_files(src, dst)
-                with vfsopen(src, "rb") as source_f:
-                    with vfsopen(dst, "wb") as target_f:
-                        copyfileobj(source_f, target_f)
+                files.append((src, dst))
+        try:
+            copy_files(files, max_concurrency, callback)
+        finally:
+            self._invalidate_listing_caches(recursive=True)
 
     # --- WritablePath attributes -------------------------------------
 
+    # create files in touch() with a single conditional request when
+    # optimistic writes are enabled, i.e. If-None-Match on S3 and GCS
+    _touch_conditional_create: bool = False
+
+    # remove empty directories in rmdir(recursive=False) with a single
+    # fs.rmdir() request when optimistic writes are enabled. Only valid
+    # where fs.rmdir() removes directories, and fails if they are not
+    # empty, i.e. not on object stores where directories are prefixes
+    _rmdir_single_request: bool = False
+
     def symlink_to(
         self,
         target: ReadablePathLike,
@@ -1403,7 +2195,7 @@ class UPath(_UPathMixin, WritablePath, ReadablePath):
         """
         Create a new directory at this given path.
         """
-        if parents and not exist_ok and self.exists():
+        if parents and not exist_ok and not is_optimistic() and self.exists():
             raise FileExistsError(str(self))
         try:
             self.fs.mkdir(
@@ -1416,9 +2208,13 @@ class UPath(_UPathMixin, WritablePath, ReadablePath):
                 raise FileExistsError(str(self))
             if not self.is_dir():
                 raise FileExistsError(str(self))
+        finally:
+            self._invalidate_listing_caches()
 
     def __open_writer__(self, mode: Literal["a", "w", "x"]) -> BinaryIO:
-        return self.fs.open(self.path, mode=f"{mode}b")
+        self._invalidate_listing_caches()
+        f = self.fs.open(self.path, mode=f"{mode}b")
+        return _invalidate_on_close(f, self)
 
     # --- upath overrides ---------------------------------------------
 
@@ -1496,7 +2292,137 @@ class UPath(_UPathMixin, WritablePath, ReadablePath):
             fsspec_kwargs["errors"] = errors
         if newline is not UNSET_DEFAULT:
             fsspec_kwargs["newline"] = newline
-        return self.fs.open(self.path, mode=mode, **fsspec_kwargs)
+        if set(mode).isdisjoint("wax+"):
+            return self.fs.open(self.path, mode=mode, **fsspec_kwargs)
+        self._invalidate_listing_caches()
+        f = self.fs.open(self.path, mode=mode, **fsspec_kwargs)
+        return _invalidate_on_close(f, self)
+
+    # === asynchronous API ============================================
+
+    def _async_fs(self) -> AsyncFileSystem | None:
+        """return an asynchronous filesystem instance for the running loop
+
+        Returns None for filesystems without async implementation and for
+        chained paths, in which case the async methods run the blocking
+        methods in a worker thread instead.
+        """
+        if len(self._chain) != 1:
+            return None
+        fs_cls = get_filesystem_class(self.protocol)
+        if not getattr(fs_cls, "async_impl", False):
+            return None
+        return DEFAULT_FILESYSTEM_POOL.get(
+            fs_cls, self.storage_options, loop=asyncio.get_running_loop()
+        )
+
+    async def aread_bytes(self) -> bytes:
+        """Asynchronously read the contents of the file as bytes.
+
+        Examples
+        --------
+        >>> import asyncio
+        >>> from upath import UPath
+        >>> p = UPath("s3://my-bucket/path/to/file.txt")
+        >>> asyncio.run(p.aread_bytes())
+        b'hello world'
+
+        """
+        fs = self._async_fs()
+        if fs is None:
+            return await super().aread_bytes()
+        return await fs._cat_file(self.path)
+
+    async def awrite_bytes(self, data: bytes) -> int:
+        """Asynchronously write bytes to the file."""
+        fs = self._async_fs()
+        if fs is None:
+            return await super().awrite_bytes(data)
+        view = memoryview(data)
+        try:
+            await fs._pipe_file(self.path, view.tobytes())
+        finally:
+            self._invalidate_listing_caches()
+        return view.nbytes
+
+    async def aexists(self) -> bool:
+        """Asynchronously check whether this path exists."""
+        fs = self._async_fs()
+        if fs is None:
+            return await super().aexists()
+        return await fs._exists(self.path)
+
+    async def astat(self) -> StatResultType:
+        """Asynchronously return the stat result for this path."""
+        fs = self._async_fs()
+        if fs is None:
+            return await super().astat()
+        return UPathStatResult.from_info(await fs._info(self.path))
+
+    async def aiterdir(self) -> AsyncIterator[Self]:
+        """Asynchronously yield path objects of the directory contents."""
+        fs = self._async_fs()
+        if fs is None:
+            async for child in super().aiterdir():
+                yield child
+            return
+        base = self
+        if self.parts[-1:] == ("",):
+            base = self.parent
+        base_path = base.path
+        if self._iterdir_list_first:
+            try:
+                listing = await fs._ls(base_path, detail=True)
+            except (FileNotFoundError, NotADirectoryError):
+                listing = []
+            if _is_ambiguous_listing(listing, base.name, self.parser.sep):
+                if not await fs._isdir(base_path):
+                    raise NotADirectoryError(str(self))
+        else:
+            if not await fs._isdir(base_path):
+                raise NotADirectoryError(str(self))
+            listing = await fs._ls(base_path, detail=True)
+        for child in base._iterdir_children(base_path, listing):
+            yield child
+
+    async def aunlink(self, missing_ok: bool = False) -> None:
+        """Asynchronously remove this file."""
+        fs = self._async_fs()
+        if fs is None:
+            return await super().aunlink(missing_ok=missing_ok)
+        if not await fs._exists(self.path):
+            if not missing_ok:
+                raise FileNotFoundError(str(self))
+            return
+        try:
+            await fs._rm(self.path, recursive=False)
+        finally:
+            self._invalidate_listing_caches()
+
+    async def acopy(self, target: Any, **kwargs: Any) -> Any:
+        """Asynchronously copy this file or directory tree to target.
+
+        Files are copied server side if target is on the same filesystem.
+        """
+        fs = self._async_fs()
+        if isinstance(target, str) and get_upath_protocol(target) == self.protocol:
+            target = self.with_segments(target)
+        if (
+            fs is None
+            or kwargs
+            or not isinstance(target, UPath)
+            or target.protocol != self.protocol
+            or target.storage_options != self.storage_options
+            or (await fs._info(self.path))["type"] != "file"
+        ):
+            return await super().acopy(target, **kwargs)
+        if await fs._isdir(target.path):
+            raise IsADirectoryError(str(target))
+        try:
+            await fs._cp_file(self.path, target.path)
+        finally:
+            target._invalidate_listing_caches()
+        return target
 
     # === pathlib.Path ================================================
 
@@ -1526,6 +2452,9 @@ class UPath(_UPathMixin, WritablePath, ReadablePath):
                 UserWarning,
                 stacklevel=2,
             )
+        cache = get_listing_cache()
+        if cache is not None:
+            return UPathStatResult.from_info(cache.info(self.fs, self.path))
         return UPathStatResult.from_info(self.fs.info(self.path))
 
     def lstat(self) -> StatResultType:
@@ -1549,6 +2478,9 @@ class UPath(_UPathMixin, WritablePath, ReadablePath):
                 UserWarning,
                 stacklevel=2,
             )
+        cache = get_listing_cache()
+        if cache is not None:
+            return self._cached_info(cache) is not None
         return self.fs.exists(self.path)
 
     def is_dir(self, *, follow_symlinks: bool = True) -> bool:
@@ -1562,6 +2494,10 @@ class UPath(_UPathMixin, WritablePath, ReadablePath):
                 UserWarning,
                 stacklevel=2,
             )
+        cache = get_listing_cache()
+        if cache is not None:
+            info = self._cached_info(cache)
+            return info is not None and info["type"] == "directory"
         return self.fs.isdir(self.path)
 
     def is_file(self, *, follow_symlinks: bool = True) -> bool:
@@ -1575,8 +2511,19 @@ class UPath(_UPathMixin, WritablePath, ReadablePath):
                 UserWarning,
                 stacklevel=2,
             )
+        cache = get_listing_cache()
+        if cache is not None:
+            info = self._cached_info(cache)
+            return info is not None and info["type"] == "file"
         return self.fs.isfile(self.path)
 
+    def _cached_info(self, cache: ListingCache) -> Mapping[str, Any] | None:
+        """return the info of the path via the cache, or None if missing"""
+        try:
+            return cache.info(self.fs, self.path)
+        except FileNotFoundError:
+            return None
+
     def is_mount(self) -> bool:
         """
         Check if this path is a mount point
@@ -1670,37 +2617,24 @@ class UPath(_UPathMixin, WritablePath, ReadablePath):
 
     def glob(
         self,
-        pattern: str,
+        pattern: str | os.PathLike[str],
         *,
         case_sensitive: bool | None = None,
         recurse_symlinks: bool = False,
     ) -> Iterator[Self]:
         """Iterate over this subtree and yield all existing files (of any
         kind, including directories) matching the given relative pattern."""
-        if case_sensitive is not None:
-            warnings.warn(
-                "UPath.glob(): case_sensitive is currently ignored.",
-                UserWarning,
-                stacklevel=2,
-            )
         if recurse_symlinks:
             warnings.warn(
                 "UPath.glob(): recurse_symlinks=True is currently ignored.",
                 UserWarning,
                 stacklevel=2,
             )
-        if self._relative_base is not None:
-            self = self.absolute()
-        path_pattern = self.joinpath(pattern).path
-        sep = self.parser.sep
-        base = self.path
-        for name in self.fs.glob(path_pattern):
-            name = name.removeprefix(base).removeprefix(sep)
-            yield self.joinpath(name)
+        yield from self._glob(os.fspath(pattern), case_sensitive)
 
     def rglob(
         self,
-        pattern: str,
+        pattern: str | os.PathLike[str],
         *,
         case_sensitive: bool | None = None,
         recurse_symlinks: bool = False,
@@ -1709,43 +2643,40 @@ class UPath(_UPathMixin, WritablePath, ReadablePath):
         directories) matching the given relative pattern, anywhere in
         this subtree.
         """
-        if case_sensitive is not None:
-            warnings.warn(
-                "UPath.glob(): case_sensitive is currently ignored.",
-                UserWarning,
-                stacklevel=2,
-            )
         if recurse_symlinks:
             warnings.warn(
                 "UPath.glob(): recurse_symlinks=True is currently ignored.",
                 UserWarning,
                 stacklevel=2,
             )
-        if _FSSPEC_HAS_WORKING_GLOB is None:
-            _check_fsspec_has_working_glob()
-
-        if _FSSPEC_HAS_WORKING_GLOB:
-            r_path_pattern = self.joinpath("**", pattern).path
-            sep = self.parser.sep
-            base = self.path
-            for name in self.fs.glob(r_path_pattern):
-                name = name.removeprefix(base).removeprefix(sep)
-                yield self.joinpath(name)
+        pattern = os.fspath(pattern)
+        yield from self._glob(f"**{self.parser.sep}{pattern}", case_sensitive)
 
+    def _glob(self, pattern: str, case_sensitive: bool | None) -> Iterator[Self]:
+        # matches are yielded lazily while the filesystem is listed, so
+        # closing the iterator early stops listing
+        if self._relative_base is not None:
+            self = self.absolute()
+        if case_sensitive is None:
+            case_sensitive = self.parser.normcase("Aa") == "Aa"
+        sep = self.parser.sep
+        base = self.path
+        segments = pattern.split(sep)
+        if any(s in {"", ".", ".."} for s in segments[:-1]):
+            if not case_sensitive:
+                warnings.warn(
+                    f"{type(self).__name__}.glob(): case_sensitive=False is"
+                    " currently ignored for patterns with empty, '.' or '..'"
+                    " segments.",
+                    UserWarning,
+                    stacklevel=3,
+                )
+            names = iter(self.fs.glob(self.joinpath(pattern).path))
         else:
-            path_pattern = self.joinpath(pattern).path
-            r_path_pattern = self.joinpath("**", pattern).path
-            sep = self.parser.sep
-            base = self.path
-            seen = set()
-            for p in (path_pattern, r_path_pattern):
-                for name in self.fs.glob(p):
-                    name = name.removeprefix(base).removeprefix(sep)
-                    if name in seen:
-                        continue
-                    else:
-                        seen.add(name)
-                        yield self.joinpath(name)
+            names = plan_glob(self.fs, base, segments, sep, case_sensitive)
+        for name in names:
+            name = name.removeprefix(base).removeprefix(sep)
+            yield self.joinpath(name)
 
     def owner(self, *, follow_symlinks: bool = True) -> str:
         _raise_unsupported(type(self).__name__, "owner")
@@ -1804,7 +2735,9 @@ class UPath(_UPathMixin, WritablePath, ReadablePath):
         Note: in the future, if hash collisions become an issue, we
           can add `fsspec.utils.tokenize(storage_options)`
         """
-        return hash((self.protocol, self.__vfspath__()))
+        if self._hash_cached is None:
+            self._hash_cached = hash((self.protocol, self.__vfspath__()))
+        return self._hash_cached
 
     def __lt__(self, other: object) -> bool:
         if not isinstance(other, UPath) or self.parser is not other.parser:
@@ -1852,19 +2785,53 @@ class UPath(_UPathMixin, WritablePath, ReadablePath):
 
     def touch(self, mode: int = 0o666, exist_ok: bool = True) -> None:
         """Create this file with the given access mode, if it doesn't exist."""
+        if is_optimistic():
+            try:
+                self._touch_optimistic(exist_ok)
+            finally:
+                self._invalidate_listing_caches()
+            return
         exists = self.fs.exists(self.path)
         if exists and not exist_ok:
             raise FileExistsError(str(self))
-        if not exists:
+        try:
+            if not exists:
+                try:
+                    self.fs.touch(self.path, truncate=True)
+                except NotImplementedError:
+                    _raise_unsupported(type(self).__name__, "touch")
+            else:
+                try:
+                    self.fs.touch(self.path, truncate=False)
+                except (NotImplementedError, ValueError):
+                    pass  # unsupported by filesystem
+        finally:
+            self._invalidate_listing_caches()
+
+    def _touch_optimistic(self, exist_ok: bool) -> None:
+        fs = self.fs
+        if self._touch_conditional_create and supports_conditional_create(fs.__class__):
             try:
-                self.fs.touch(self.path, truncate=True)
-            except NotImplementedError:
-                _raise_unsupported(type(self).__name__, "touch")
-        else:
+                fs.pipe_file(self.path, b"", mode="create")
+            except FileExistsError:
+                if not exist_ok:
+                    raise FileExistsError(str(self)) from None
+                try:
+                    fs.touch(self.path, truncate=False)
+                except (NotImplementedError, ValueError):
+                    pass  # updating the mtime is unsupported
+        elif exist_ok:
             try:
-                self.fs.touch(self.path, truncate=False)
+                fs.touch(self.path, truncate=False)
             except (NotImplementedError, ValueError):
-                pass  # unsupported by filesystem
+                pass  # exists, and updating the mtime is unsupported
+        elif fs.exists(self.path):
+            raise FileExistsError(str(self))
+        else:
+            try:
+                fs.touch(self.path, truncate=True)
+            except NotImplementedError:
+                _raise_unsupported(type(self).__name__, "touch")
 
     def lchmod(self, mode: int) -> None:
         _raise_unsupported(type(self).__name__, "lchmod")
@@ -1874,11 +2841,26 @@ class UPath(_UPathMixin, WritablePath, ReadablePath):
         Remove this file or link.
         If the path is a directory, use rmdir() instead.
         """
+        if is_optimistic():
+            try:
+                self.fs.rm_file(self.path)
+            except FileNotFoundError:
+                # some filesystems report directories as missing files
+                if self.is_dir():
+                    raise IsADirectoryError(str(self)) from None
+                if not missing_ok:
+                    raise FileNotFoundError(str(self)) from None
+            finally:
+                self._invalidate_listing_caches()
+            return
         if not self.exists():
             if not missing_ok:
                 raise FileNotFoundError(str(self))
             return
-        self.fs.rm(self.path, recursive=False)
+        try:
+            self.fs.rm(self.path, recursive=False)
+        finally:
+            self._invalidate_listing_caches()
 
     def rmdir(self, recursive: bool = True) -> None:  # fixme: non-standard
         """
@@ -1894,11 +2876,22 @@ class UPath(_UPathMixin, WritablePath, ReadablePath):
         `.delete()` is introduced.
 
         """
+        if not recursive and self._rmdir_single_request and is_optimistic():
+            try:
+                self.fs.rmdir(self.path)
+            except (FileNotFoundError, NotADirectoryError):
+                raise NotADirectoryError(str(self)) from None
+            finally:
+                self._invalidate_listing_caches(recursive=True)
+            return
         if not self.is_dir():
             raise NotADirectoryError(str(self))
-        if not recursive and next(self.iterdir()):  # type: ignore[arg-type]
+        if not recursive and next(iter(self.iterdir()), None) is not None:
             raise OSError(f"Not recursive and directory not empty: {self}")
-        self.fs.rm(self.path, recursive=recursive)
+        try:
+            self.fs.rm(self.path, recursive=recursive)
+        finally:
+            self._invalidate_listing_caches(recursive=True)
 
     def rename(
         self,
@@ -1995,11 +2988,15 @@ class UPath(_UPathMixin, WritablePath, ReadablePath):
                 stacklevel=2,
             )
             kwargs["maxdepth"] = maxdepth
-        self.fs.mv(
-            source_abs.path,
-            target_abs.path,
-            **kwargs,
-        )
+        try:
+            self.fs.mv(
+                source_abs.path,
+                target_abs.path,
+                **kwargs,
+            )
+        finally:
+            source_abs._invalidate_listing_caches(recursive=True)
+            target_abs._invalidate_listing_caches(recursive=True)
         return target
 
     def replace(self, target: WritablePathLike) -> Self:
@@ -2060,6 +3057,435 @@ class UPath(_UPathMixin, WritablePath, ReadablePath):
     def from_uri(cls, uri: str, **storage_options: Any) -> Self:
         return cls(uri, **storage_options)
 
+    @overload
+    @classmethod
+    def from_strings(
+        cls,
+        strings: Iterable[str],
+        *,
+        protocol: str | None = ...,
+        columnar: Literal[False] = ...,
+        **storage_options: Any,
+    ) -> list[Self]: ...
+
+    @overload
+    @classmethod
+    def from_strings(
+        cls,
+        strings: Iterable[str],
+        *,
+        protocol: str | None = ...,
+        columnar: Literal[True],
+        **storage_options: Any,
+    ) -> UPathSequence: ...
+
+    @classmethod
+    def from_strings(
+        cls,
+        strings: Iterable[str],
+        *,
+        protocol: str | None = None,
+        columnar: bool = False,
+        **storage_options: Any,
+    ) -> list[Self] | UPathSequence:
+        """Create many paths from an iterable of strings.
+
+        The protocol, implementation class and storage options are resolved
+        once from the first string. All following strings of the same form
+        are derived lexically from the first path, which skips the parsing
+        done by the constructor. Strings that differ in form (i.e. that use
+        another protocol or chained urls) are passed to the constructor.
+
+        Parameters
+        ----------
+        strings :
+            The path strings.
+        protocol :
+            The protocol for all paths, detected from the first string if
+            not provided.
+        columnar :
+            If True, return a `UPathSequence` that only stores the stripped
+            path strings and creates the paths on access.
+        **storage_options :
+            Storage options for all paths.
+
+        Examples
+        --------
+        >>> from upath import UPath
+        >>> UPath.from_strings(["s3://bucket/a.txt", "s3://bucket/b.txt"])
+        [S3Path('bucket/a.txt', protocol='s3'), S3Path('bucket/b.txt', protocol='s3')]
+
+        """
+        it = iter(strings)
+        try:
+            first = next(it)
+        except StopIteration:
+            return UPathSequence(None, []) if columnar else []
+
+        template = cls(first, protocol=protocol, **storage_options)
+        template_cls = type(template)
+        items: list[Any] = [template]
+
+        if not (
+            type(first) is str
+            and "::" not in first
+            and UPath in template_cls.__mro__
+            and len(template._chain) == 1
+            and _supports_lexical_join(template_cls)
+            and template.parser.strip_protocol(first) == template._chain.active_path
+        ):
+            # paths can't be derived from the template path
+            items.extend(cls(s, protocol=protocol, **storage_options) for s in it)
+            return UPathSequence(None, items) if columnar else items
+
+        flavour = WrappedFileSystemFlavour.from_protocol(
+            template._chain.active_path_protocol
+        )
+        prefix = _match_protocol(first)
+        url_kwargs = flavour.get_kwargs_from_url(first)
+        segment = template._chain.current
+        append = items.append
+        for s in it:
+            if (
+                type(s) is str
+                and "::" not in s
+                and _match_protocol(s) == prefix
+                and flavour.get_kwargs_from_url(s) == url_kwargs
+            ):
+                path = flavour.strip_protocol(s)
+                if columnar:
+                    append(path)
+                else:
+                    chain = Chain(segment._replace(path=path))
+                    append(template._from_chain(chain, (s,)))
+            else:
+                append(cls(s, protocol=protocol, **storage_options))
+
+        if columnar:
+            items[0] = template._chain.active_path
+            return UPathSequence(template, items)
+        return items
+
+    @classmethod
+    def read_many(
+        cls,
+        paths: Iterable[UPath | str],
+        *,
+        max_concurrency: int = 32,
+        return_exceptions: bool = False,
+    ) -> list[Any]:
+        """Read the contents of many files concurrently.
+
+        Files on async filesystems (i.e. s3, gcs, azure or http) are read
+        concurrently on the filesystem's event loop. Files on other
+        filesystems are read one after the other.
+
+        Parameters
+        ----------
+        paths :
+            The files to read.
+        max_concurrency :
+            The maximum number of reads in flight at any time.
+        return_exceptions :
+            If True, exceptions are returned in place of the contents of
+            the files that could not be read. Otherwise the first
+            exception is raised and all pending reads are cancelled.
+
+        Returns
+        -------
+        : list
+            The contents of the files as bytes, in the order of `paths`.
+
+        Examples
+        --------
+        >>> from upath import UPath
+        >>> paths = [UPath("memory:///a.txt"), UPath("memory:///b.txt")]
+        >>> UPath.read_many(paths)
+        [b'hello', b'world']
+
+        """
+        upaths = [p if isinstance(p, UPath) else UPath(p) for p in paths]
+        items = ((p.fs, p.path) for p in upaths)
+        results: list[Any] = [None] * len(upaths)
+        with closing(cat_concurrently(items, max_concurrency)) as completed:
+            for index, result in completed:
+                if isinstance(result, Exception) and not return_exceptions:
+                    raise result
+                results[index] = result
+        return results
+
+    @classmethod
+    def iter_read_many(
+        cls,
+        paths: Iterable[UPath | str],
+        *,
+        max_concurrency: int = 32,
+        return_exceptions: bool = False,
+    ) -> Iterator[tuple[UPath, Any]]:
+        """Read the contents of many files concurrently, yielding
+        `(path, contents)` tuples in the order the reads complete.
+
+        See `UPath.read_many()` for a description of the parameters.
+        """
+        upaths = [p if isinstance(p, UPath) else UPath(p) for p in paths]
+        items = ((p.fs, p.path) for p in upaths)
+        with closing(cat_concurrently(items, max_concurrency)) as completed:
+            for index, result in completed:
+                if isinstance(result, Exception) and not return_exceptions:
+                    raise result
+                yield upaths[index], result
+
+    @classmethod
+    def unlink_many(
+        cls,
+        paths: Iterable[UPath | str],
+        *,
+        missing_ok: bool = False,
+        check_exists: bool = True,
+        batch_size: int = 1000,
+        max_concurrency: int = 32,
+        return_exceptions: bool = False,
+    ) -> list[Exception | None]:
+        """Remove many files, using batched deletes where supported.
+
+        Paths are grouped by filesystem and removed with one `fs.rm()`
+        call per batch of paths, which s3fs and gcsfs map to bulk delete
+        requests. Paths with a custom `unlink()` implementation are
+        removed one by one.
+
+        Parameters
+        ----------
+        paths :
+            The files to remove.
+        missing_ok :
+            If False, a FileNotFoundError is reported for missing files.
+        check_exists :
+            If True, the existence of all files is checked before they
+            are removed, concurrently on async filesystems. If False, the
+            check is skipped and missing files are only reported if the
+            backend reports them (s3 and gcs for example do not). Files
+            removed by a batch that failed on a missing file might then
+            be reported as missing, too.
+        batch_size :
+            The maximum number of paths per `fs.rm()` call.
+        max_concurrency :
+            The maximum number of existence checks in flight at any time.
+        return_exceptions :
+            If True, exceptions are returned for the files that could not
+            be removed. Otherwise the first exception is raised after all
+            files have been processed.
+
+        Returns
+        -------
+        : list
+            None for every removed file, or the exception for files that
+            could not be removed, in the order of `paths`.
+
+        """
+        upaths = [p if isinstance(p, UPath) else UPath(p) for p in paths]
+        results: list[Exception | None] = [None] * len(upaths)
+        groups: dict[int, tuple[AbstractFileSystem, list[int]]] = {}
+        individual = []
+        for index, pth in enumerate(upaths):
+            if type(pth).unlink is not UPath.unlink:
+                individual.append(index)
+            else:
+                fs = pth.fs
+                groups.setdefault(id(fs), (fs, []))[1].append(index)
+
+        for fs, indices in groups.values():
+            if check_exists:
+                indices = _select_existing(
+                    fs, upaths, indices, results, missing_ok, max_concurrency
+                )
+            removed = rm_batched(fs, [upaths[i].path for i in indices], batch_size)
+            for index, result in zip(indices, removed):
+                invalidate_listing_caches(fs, upaths[index].path)
+                if missing_ok and isinstance(result, FileNotFoundError):
+                    result = None
+                results[index] = result
+
+        for index in individual:
+            try:
+                upaths[index].unlink(missing_ok=missing_ok)
+            except Exception as err:
+                results[index] = err
+
+        if not return_exceptions:
+            for result in results:
+                if result is not None:
+                    raise result
+        return results
+
+    @classmethod
+    def stat_many(
+        cls,
+        paths: Iterable[UPath | str],
+        *,
+        max_concurrency: int = 32,
+        missing_ok: bool = False,
+    ) -> UPathStatColumns:
+        """Return the sizes, mtimes, types and etags of many paths as columns.
+
+        The info of paths on async filesystems (i.e. s3, gcs, azure or
+        http) is requested concurrently on the filesystem's event loop.
+        Paths on other filesystems are requested one after the other.
+        Info cached by `UPath.listing_cache()` is reused.
+
+        Parameters
+        ----------
+        paths :
+            The paths to stat.
+        max_concurrency :
+            The maximum number of requests in flight at any time.
+        missing_ok :
+            If True, missing paths are reported with type `MISSING`.
+            Otherwise a FileNotFoundError is raised.
+
+        Returns
+        -------
+        : UPathStatColumns
+            The columns, in the order of `paths`. Its numeric columns are
+            `array.array` instances, see `UPathStatColumns.as_numpy()`.
+
+        Examples
+        --------
+        >>> from upath import UPath
+        >>> paths = [UPath("memory:///a.txt"), UPath("memory:///b.txt")]
+        >>> UPath.stat_many(paths).sizes
+        array('q', [5, 5])
+
+        """
+        upaths = [p if isinstance(p, UPath) else UPath(p) for p in paths]
+        infos: list[Mapping[str, Any] | None] = [None] * len(upaths)
+        cache = get_listing_cache()
+        pending = []
+        for index, pth in enumerate(upaths):
+            if cache is not None:
+                infos[index] = cache.get_info(pth.fs, pth.path)
+            if infos[index] is None:
+                pending.append(index)
+
+        items = ((upaths[index].fs, upaths[index].path) for index in pending)
+        with closing(call_concurrently("info", items, max_concurrency)) as completed:
+            for idx, result in completed:
+                if isinstance(result, FileNotFoundError) and missing_ok:
+                    continue
+                elif isinstance(result, Exception):
+                    raise result
+                infos[pending[idx]] = result
+        return UPathStatColumns.from_infos(infos, [p.path for p in upaths])
+
+    @classmethod
+    @contextmanager
+    def listing_cache(
+        cls,
+        enabled: bool = True,
+        *,
+        maxsize: int | None = None,
+        ttl: float | None = None,
+        negative_ttl: float | None = None,
+    ) -> Iterator[ListingCache | None]:
+        """Cache listings and path info of UPath calls within the context.
+
+        While enabled, `exists()`, `is_dir()`, `is_file()` and `stat()`
+        are answered from cached info dicts, including the entries of
+        cached parent listings, and `iterdir()` reuses cached listings.
+        Writes through UPath drop the entries of the written path and
+        the listings of its parents from all caches, also from outside
+        the context. Changes made by other clients are picked up once
+        the entries expire.
+
+        The context is bound to the current thread or asyncio task, and
+        can be nested, i.e. to opt out for parts of the code.
+
+        Parameters
+        ----------
+        enabled :
+            If False, caching is disabled within the context.
+        maxsize :
+            The maximum number of cached entries. If any of `maxsize`,
+            `ttl` or `negative_ttl` are provided, a new cache is used for
+            the context, otherwise the cache shared by all contexts (4096
+            entries, 30 seconds, no negative lookups).
+        ttl :
+            The number of seconds after which entries expire.
+        negative_ttl :
+            If provided, also cache failed lookups, and report paths that
+            are missing from a cached parent listing as missing, for this
+            number of seconds. Keep it short, as files created by other
+            clients are not seen before the entries expire.
+
+        Returns
+        -------
+        : ListingCache
+            The cache used within the context, or None if disabled. Its
+            `cache_info()` method reports hit and miss statistics.
+
+        Examples
+        --------
+        >>> from upath import UPath
+        >>> p = UPath("memory:///foo/")
+        >>> p.joinpath("bar.txt").touch()
+        >>> with UPath.listing_cache() as cache:
+        ...     names = [child.name for child in p.iterdir()]
+        ...     p.joinpath("bar.txt").exists()  # answered from the listing
+        ...     cache.cache_info()
+        True
+        CacheInfo(hits=1, misses=1, maxsize=4096, currsize=1)
+
+        """
+        if not enabled:
+            cache = None
+        elif maxsize is None and ttl is None and negative_ttl is None:
+            cache = DEFAULT_LISTING_CACHE
+        else:
+            cache = ListingCache(
+                maxsize=4096 if maxsize is None else maxsize,
+                ttl=30.0 if ttl is None else ttl,
+                negative_ttl=negative_ttl,
+            )
+        with use_listing_cache(cache):
+            yield cache
+
+    @classmethod
+    @contextmanager
+    def optimistic_writes(cls, enabled: bool = True) -> Iterator[None]:
+        """Issue mutating calls of UPath without probing the path first.
+
+        While enabled, `touch()`, `unlink()`, `mkdir()` and
+        `rmdir(recursive=False)` skip the `exists()` and `is_dir()` calls
+        they use to emulate pathlib semantics, and map the errors raised
+        by the filesystem to the pathlib exceptions instead. On S3 and
+        GCS, `touch()` creates the file with a single conditional request.
+
+        The context is bound to the current thread or asyncio task, and
+        can be nested, i.e. to opt out for parts of the code.
+
+        Info
+        ----
+        Errors that the filesystem doesn't report go unnoticed. I.e. on
+        object stores `unlink()` of a missing key succeeds, `mkdir()` of
+        an existing prefix succeeds, and `mkdir(exist_ok=True)` succeeds
+        if a file exists at the path.
+
+        Parameters
+        ----------
+        enabled :
+            If False, optimistic writes are disabled within the context.
+
+        Examples
+        --------
+        >>> from upath import UPath
+        >>> p = UPath("memory:///foo/marker")
+        >>> with UPath.optimistic_writes():
+        ...     p.touch(exist_ok=False)
+        ...     p.unlink()
+
+        """
+        with use_optimistic(enabled):
+            yield
+
     def as_uri(self) -> str:
         """Return the string representation of the path as a URI."""
         if self._relative_base is not None:
@@ -2181,14 +3607,15 @@ class UPath(_UPathMixin, WritablePath, ReadablePath):
         """Match this path against the provided glob-style pattern.
         Return True if matching is successful, False otherwise.
         """
-        if case_sensitive is not None:
-            warnings.warn(
-                f"{type(self).__name__}.full_match(): case_sensitive"
-                " is currently ignored.",
-                UserWarning,
-                stacklevel=2,
-            )
-        return super().full_match(str(pattern))
+        if case_sensitive is None:
+            case_sensitive = self.parser.normcase("Aa") == "Aa"
+        pattern = str(pattern)
+        sep = self.parser.sep
+        altsep = getattr(self.parser, "altsep", None)
+        if altsep:
+            pattern = pattern.replace(altsep, sep)
+        match = compile_pattern(pattern, sep, case_sensitive)
+        return match(self.__vfspath__()) is not None
 
     def match(
         self,
@@ -2202,13 +3629,9 @@ class UPath(_UPathMixin, WritablePath, ReadablePath):
         path_pattern = str(path_pattern)
         if not path_pattern:
             raise ValueError("pattern cannot be empty")
-        if case_sensitive is not None:
-            warnings.warn(
-                f"{type(self).__name__}.match(): case_sensitive is currently ignored.",
-                UserWarning,
-                stacklevel=2,
-            )
-        return self.full_match(path_pattern.replace("**", "*"))
+        return self.full_match(
+            path_pattern.replace("**", "*"), case_sensitive=case_sensitive
+        )
 
     @classmethod
     def __get_pydantic_core_schema__(
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import os
 import sys
+from collections.abc import AsyncIterator
+from collections.abc import Iterable
 from collections.abc import Iterator
 from collections.abc import Mapping
 from collections.abc import Sequence
+from contextlib import AbstractContextManager
 from typing import IO
 from typing import TYPE_CHECKING
 from typing import Any
@@ -20,6 +24,7 @@ from pathlib_abc import vfspath
 
 from upath._chain import Chain
 from upath._chain import ChainSegment
+from upath._scandir import UPathScandirIterator
 from upath.core import UnsupportedOperation
 from upath.core import UPath
 from upath.types import UNSET_DEFAULT
@@ -37,10 +42,17 @@ if TYPE_CHECKING:
         from typing import Self
     else:
         from typing_extensions import Self
+    if sys.version_info >= (3, 12):
+        from collections.abc import Buffer
+    else:
+        from typing_extensions import Buffer
 
     from pydantic import GetCoreSchemaHandler
     from pydantic_core.core_schema import CoreSchema
 
+    from upath._cache import ListingCache
+    from upath._stat import UPathStatColumns
+
 __all__ = [
     "ProxyUPath",
 ]
@@ -153,6 +165,37 @@ class ProxyUPath:
         for pth in self.__wrapped__.iterdir():
             yield self._from_upath(pth)
 
+    def scandir(self) -> UPathScandirIterator[Self]:
+        return UPathScandirIterator(iter(list(self.iterdir())))
+
+    async def aread_bytes(self) -> bytes:
+        return await self.__wrapped__.aread_bytes()
+
+    async def awrite_bytes(self, data: bytes) -> int:
+        return await self.__wrapped__.awrite_bytes(data)
+
+    async def aexists(self) -> bool:
+        return await self.__wrapped__.aexists()
+
+    async def astat(self) -> StatResultType:
+        return await self.__wrapped__.astat()
+
+    async def aiterdir(self) -> AsyncIterator[Self]:
+        async for pth in self.__wrapped__.aiterdir():
+            yield self._from_upath(pth)
+
+    async def aglob(
+        self, pattern: str, *, case_sensitive: bool | None = None
+    ) -> AsyncIterator[Self]:
+        async for pth in self.__wrapped__.aglob(pattern, case_sensitive=case_sensitive):
+            yield self._from_upath(pth)
+
+    async def aunlink(self, missing_ok: bool = False) -> None:
+        await self.__wrapped__.aunlink(missing_ok=missing_ok)
+
+    async def acopy(self, target: WritablePathLike, **kwargs: Any) -> Self:
+        return self._from_upath(await self.__wrapped__.acopy(target, **kwargs))
+
     def __open_reader__(self) -> BinaryIO:
         return self.__wrapped__.__open_reader__()
 
@@ -400,6 +443,100 @@ class ProxyUPath:
     def from_uri(cls, uri: str, **storage_options: Any) -> Self:
         return cls(uri, **storage_options)
 
+    @classmethod
+    def from_strings(
+        cls,
+        strings: Iterable[str],
+        *,
+        protocol: str | None = None,
+        **storage_options: Any,
+    ) -> list[Self]:
+        paths = UPath.from_strings(strings, protocol=protocol, **storage_options)
+        return [cls._from_upath(p) for p in paths]
+
+    @classmethod
+    def read_many(
+        cls,
+        paths: Iterable[ProxyUPath | UPath | str],
+        *,
+        max_concurrency: int = 32,
+        return_exceptions: bool = False,
+    ) -> list[Any]:
+        return UPath.read_many(
+            [p.__wrapped__ if isinstance(p, ProxyUPath) else p for p in paths],
+            max_concurrency=max_concurrency,
+            return_exceptions=return_exceptions,
+        )
+
+    @classmethod
+    def iter_read_many(
+        cls,
+        paths: Iterable[ProxyUPath | UPath | str],
+        *,
+        max_concurrency: int = 32,
+        return_exceptions: bool = False,
+    ) -> Iterator[tuple[Self, Any]]:
+        for pth, result in UPath.iter_read_many(
+            [p.__wrapped__ if isinstance(p, ProxyUPath) else p for p in paths],
+            max_concurrency=max_concurrency,
+            return_exceptions=return_exceptions,
+        ):
+            yield cls._from_upath(pth), result
+
+    @classmethod
+    def unlink_many(
+        cls,
+        paths: Iterable[ProxyUPath | UPath | str],
+        *,
+        missing_ok: bool = False,
+        check_exists: bool = True,
+        batch_size: int = 1000,
+        max_concurrency: int = 32,
+        return_exceptions: bool = False,
+    ) -> list[Exception | None]:
+        return UPath.unlink_many(
+            [p.__wrapped__ if isinstance(p, ProxyUPath) else p for p in paths],
+            missing_ok=missing_ok,
+            check_exists=check_exists,
+            batch_size=batch_size,
+            max_concurrency=max_concurrency,
+            return_exceptions=return_exceptions,
+        )
+
+    @classmethod
+    def stat_many(
+        cls,
+        paths: Iterable[ProxyUPath | UPath | str],
+        *,
+        max_concurrency: int = 32,
+        missing_ok: bool = False,
+    ) -> UPathStatColumns:
+        return UPath.stat_many(
+            [p.__wrapped__ if isinstance(p, ProxyUPath) else p for p in paths],
+            max_concurrency=max_concurrency,
+            missing_ok=missing_ok,
+        )
+
+    def stat_children(self, *, recursive: bool = False) -> UPathStatColumns:
+        return self.__wrapped__.stat_children(recursive=recursive)
+
+    @classmethod
+    def listing_cache(
+        cls,
+        enabled: bool = True,
+        *,
+        maxsize: int | None = None,
+        ttl: float | None = None,
+        negative_ttl: float | None = None,
+    ) -> AbstractContextManager[ListingCache | None]:
+        return UPath.listing_cache(
+            enabled, maxsize=maxsize, ttl=ttl, negative_ttl=negative_ttl
+        )
+
+    @classmethod
+    def optimistic_writes(cls, enabled: bool = True) -> AbstractContextManager[None]:
+        return UPath.optimistic_writes(enabled)
+
     def as_uri(self) -> str:
         return self.__wrapped__.as_uri()
 
@@ -444,7 +581,7 @@ class ProxyUPath:
         return self.__wrapped__.hardlink_to(target)
 
     def match(self, pattern: str, *, case_sensitive: bool | None = None) -> bool:
-        return self.__wrapped__.match(pattern)
+        return self.__wrapped__.match(pattern, case_sensitive=case_sensitive)
 
     @property
     def protocol(self) -> str:
@@ -469,8 +606,60 @@ class ProxyUPath:
     def _url(self) -> SplitResult:
         return self.__wrapped__._url
 
-    def read_bytes(self) -> bytes:
-        return self.__wrapped__.read_bytes()
+    def read_bytes(
+        self,
+        *,
+        range_size: int | None = None,
+        max_concurrency: int = 8,
+    ) -> bytes:
+        if range_size is None:
+            return self.__wrapped__.read_bytes()
+        return self.__wrapped__.read_bytes(
+            range_size=range_size, max_concurrency=max_concurrency
+        )
+
+    def read_into(
+        self,
+        buffer: Buffer,
+        *,
+        range_size: int = 2**23,
+        max_concurrency: int = 8,
+    ) -> int:
+        return self.__wrapped__.read_into(
+            buffer, range_size=range_size, max_concurrency=max_concurrency
+        )
+
+    def open_buffer(
+        self,
+        *,
+        range_size: int = 2**23,
+        max_concurrency: int = 8,
+    ) -> memoryview:
+        return self.__wrapped__.open_buffer(
+            range_size=range_size, max_concurrency=max_concurrency
+        )
+
+    def read_ranges(
+        self,
+        ranges: Sequence[tuple[int, int]],
+        *,
+        max_gap: int = 2**16,
+        max_concurrency: int = 8,
+    ) -> list[memoryview]:
+        return self.__wrapped__.read_ranges(
+            ranges, max_gap=max_gap, max_concurrency=max_concurrency
+        )
+
+    def download_to(
+        self,
+        local_path: str | os.PathLike[str],
+        *,
+        range_size: int = 2**23,
+        max_concurrency: int = 8,
+    ) -> None:
+        return self.__wrapped__.download_to(
+            local_path, range_size=range_size, max_concurrency=max_concurrency
+        )
 
     def read_text(
         self,
@@ -520,9 +709,12 @@ class ProxyUPath:
         )
 
     def _copy_from(
-        self, source: ReadablePath | Self, follow_symlinks: bool = True
+        self,
+        source: ReadablePath | Self,
+        follow_symlinks: bool = True,
+        **kwargs: Any,
     ) -> None:
-        self.__wrapped__._copy_from(source, follow_symlinks=follow_symlinks)  # type: ignore  # noqa: E501
+        self.__wrapped__._copy_from(source, follow_symlinks=follow_symlinks, **kwargs)  # type: ignore  # noqa: E501
 
     @property
     def anchor(self) -> str:
@@ -10,6 +10,7 @@ from typing import overload
 from upath import UnsupportedOperation
 from upath._chain import DEFAULT_CHAIN_PARSER
 from upath._flavour import upath_strip_protocol
+from upath._optimistic import is_optimistic
 from upath.core import UPath
 from upath.types import JoinablePathLike
 from upath.types import SupportsPathLike
@@ -46,6 +47,8 @@ __all__ = [
 class CloudPath(UPath):
     __slots__ = ()
 
+    _walk_recursive_listing = True
+
     @classmethod
     def _transform_init_args(
         cls,
@@ -96,10 +99,18 @@ class CloudPath(UPath):
             return parts[:1]
         return parts
 
+    def _check_key_like(self) -> None:
+        # fast-path: a path not starting with a separator has a bucket
+        path = self._chain.active_path
+        if path and not path.startswith(self.parser.sep):
+            return
+        if not self.drive and len(self.parts) > 1:
+            raise ValueError("non key-like path provided (bucket/container missing)")
+
     def mkdir(
         self, mode: int = 0o777, parents: bool = False, exist_ok: bool = False
     ) -> None:
-        if not parents and not exist_ok and self.exists():
+        if not parents and not exist_ok and not is_optimistic() and self.exists():
             raise FileExistsError(self.path)
         super().mkdir(mode=mode, parents=parents, exist_ok=exist_ok)
 
@@ -107,6 +118,8 @@ class CloudPath(UPath):
 class GCSPath(CloudPath):
     __slots__ = ()
 
+    _touch_conditional_create = True
+
     def __init__(
         self,
         *args: JoinablePathLike,
@@ -117,8 +130,7 @@ class GCSPath(CloudPath):
         super().__init__(
             *args, protocol=protocol, chain_parser=chain_parser, **storage_options
         )
-        if not self.drive and len(self.parts) > 1:
-            raise ValueError("non key-like path provided (bucket/container missing)")
+        self._check_key_like()
 
     def mkdir(
         self, mode: int = 0o777, parents: bool = False, exist_ok: bool = False
@@ -128,6 +140,7 @@ class GCSPath(CloudPath):
         except TypeError as err:
             if "unexpected keyword argument 'create_parents'" in str(err):
                 self.fs.mkdir(self.path)
+                self._invalidate_listing_caches()
 
     def exists(self, *, follow_symlinks: bool = True) -> bool:
         # required for gcsfs<2025.5.0, see: https://github.com/fsspec/gcsfs/pull/676
@@ -140,6 +153,8 @@ class GCSPath(CloudPath):
 class S3Path(CloudPath):
     __slots__ = ()
 
+    _touch_conditional_create = True
+
     def __init__(
         self,
         *args: JoinablePathLike,
@@ -150,8 +165,7 @@ class S3Path(CloudPath):
         super().__init__(
             *args, protocol=protocol, chain_parser=chain_parser, **storage_options
         )
-        if not self.drive and len(self.parts) > 1:
-            raise ValueError("non key-like path provided (bucket/container missing)")
+        self._check_key_like()
 
     @overload
     def copy(self, target: _WT, **kwargs: Any) -> _WT: ...
@@ -191,8 +205,7 @@ class AzurePath(CloudPath):
         super().__init__(
             *args, protocol=protocol, chain_parser=chain_parser, **storage_options
         )
-        if not self.drive and len(self.parts) > 1:
-            raise ValueError("non key-like path provided (bucket/container missing)")
+        self._check_key_like()
 
 
 class HfPath(CloudPath):
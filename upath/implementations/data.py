@@ -20,8 +20,13 @@ if TYPE_CHECKING:
     else:
         from typing_extensions import Self
         from typing_extensions import Unpack
+    if sys.version_info >= (3, 12):
+        from collections.abc import Buffer
+    else:
+        from typing_extensions import Buffer
 
     from upath._chain import FSSpecChainParser
+    from upath._stat import UPathStatColumns
     from upath.types.storage_options import DataStorageOptions
 
 __all__ = ["DataPath"]
@@ -112,6 +117,9 @@ class DataPath(UPath):
     def iterdir(self) -> Iterator[Self]:
         raise NotADirectoryError
 
+    def stat_children(self, *, recursive: bool = False) -> UPathStatColumns:
+        raise NotADirectoryError
+
     def glob(
         self, pattern, *, case_sensitive=None, recurse_symlinks=False
     ) -> Iterator[Self]:
@@ -124,3 +132,25 @@ class DataPath(UPath):
 
     def unlink(self, missing_ok: bool = False) -> None:
         raise UnsupportedOperation
+
+    def read_into(
+        self,
+        buffer: Buffer,
+        *,
+        range_size: int = 2**23,
+        max_concurrency: int = 8,
+    ) -> int:
+        view = memoryview(buffer).cast("B")
+        data = self.open_buffer()
+        num_bytes = min(data.nbytes, view.nbytes)
+        view[:num_bytes] = data[:num_bytes]
+        return num_bytes
+
+    def open_buffer(
+        self,
+        *,
+        range_size: int = 2**23,
+        max_concurrency: int = 8,
+    ) -> memoryview:
+        # the data is decoded from the uri, there is nothing to fetch
+        return memoryview(self.fs.cat_file(self.path))
@@ -13,6 +13,12 @@ if TYPE_CHECKING:
         from typing import Unpack
     else:
         from typing_extensions import Unpack
+    if sys.version_info >= (3, 12):
+        from collections.abc import Buffer
+    else:
+        from typing_extensions import Buffer
+
+    from fsspec.implementations.memory import MemoryFile
 
     from upath._chain import FSSpecChainParser
     from upath.types.storage_options import MemoryStorageOptions
@@ -23,6 +29,9 @@ __all__ = ["MemoryPath"]
 class MemoryPath(UPath):
     __slots__ = ()
 
+    _touch_conditional_create = True
+    _rmdir_single_request = True
+
     if TYPE_CHECKING:
 
         def __init__(
@@ -48,3 +57,35 @@ class MemoryPath(UPath):
         if s.startswith("memory:///"):
             s = s.replace("memory:///", "memory://", 1)
         return s
+
+    def _memory_file(self) -> MemoryFile:
+        path = self.fs._strip_protocol(self.path)
+        try:
+            return self.fs.store[path]
+        except KeyError:
+            if path in self.fs.pseudo_dirs:
+                raise IsADirectoryError(str(self)) from None
+            raise FileNotFoundError(str(self)) from None
+
+    def read_into(
+        self,
+        buffer: Buffer,
+        *,
+        range_size: int = 2**23,
+        max_concurrency: int = 8,
+    ) -> int:
+        view = memoryview(buffer).cast("B")
+        with self._memory_file().getbuffer() as data:
+            num_bytes = min(data.nbytes, view.nbytes)
+            view[:num_bytes] = data[:num_bytes]
+        return num_bytes
+
+    def open_buffer(
+        self,
+        *,
+        range_size: int = 2**23,
+        max_concurrency: int = 8,
+    ) -> memoryview:
+        # a view of the stored data: appending to the file in place
+        # raises BufferError until the view is released
+        return self._memory_file().getbuffer().toreadonly()
@@ -74,6 +74,8 @@ class SMBPath(UPath):
                 raise FileExistsError(str(self))
             if not self.is_dir():
                 raise FileExistsError(str(self))
+        finally:
+            self._invalidate_listing_caches()
 
     def rename(
         self,
@@ -1,3 +1,4 @@
+import asyncio
 import os
 import pickle
 import stat
@@ -17,6 +18,7 @@ from upath import UnsupportedOperation
 from upath import UPath
 from upath._protocol import get_upath_protocol
 from upath._stat import UPathStatResult
+from upath._stat import UPathStatType
 from upath.tests.utils import posixify
 from upath.types import StatResultType
 
@@ -426,6 +428,31 @@ class ReadablePathTests:
         files_slash = list(self.path.joinpath("folder1/").iterdir())
         assert files_noslash == files_slash
 
+    def test_iterdir_info(self):
+        children = {p.name: p for p in self.path.iterdir()}
+        assert children["file1.txt"].info.exists() is True
+        assert children["file1.txt"].info.is_file() is True
+        assert children["file1.txt"].info.is_dir() is False
+        assert children["folder1"].info.exists() is True
+        assert children["folder1"].info.is_file() is False
+        assert children["folder1"].info.is_dir() is True
+
+    def test_scandir(self):
+        with self.path.scandir() as it:
+            entries = {entry.name: entry for entry in it}
+        assert set(entries) == {p.name for p in self.path.iterdir()}
+
+        file1 = entries["file1.txt"]
+        assert file1.is_file() is True
+        assert file1.is_dir() is False
+        assert file1.path == str(self.path.joinpath("file1.txt"))
+        size = self.path.joinpath("file1.txt").stat().st_size
+        assert file1.stat().st_size == size
+
+        folder1 = entries["folder1"]
+        assert folder1.is_file() is False
+        assert folder1.is_dir() is True
+
     def test_lstat(self):
         with pytest.warns(UserWarning, match=r"[A-Za-z]+.stat"):
             st = self.path.lstat()
@@ -464,6 +491,129 @@ class ReadablePathTests:
         mock = self.path.joinpath("file2.txt")
         assert mock.read_bytes() == b"hello world"
 
+    def test_async_read(self):
+        async def run(p):
+            return await p.aread_bytes(), await p.aexists(), await p.astat()
+
+        p = self.path.joinpath("file2.txt")
+        data, exists, st = asyncio.run(run(p))
+        assert data == b"hello world"
+        assert exists is True
+        assert st.st_size == p.stat().st_size
+
+    def test_read_bytes_ranged(self):
+        p = self.path_file
+        expected = p.read_bytes()
+        assert p.read_bytes(range_size=3, max_concurrency=2) == expected
+        assert p.read_bytes(range_size=2**20) == expected
+
+    def test_read_ranges(self):
+        p = self.path_file
+        data = p.read_bytes()
+        ranges = [(3, 5), (0, 2), (1, 4), (-3, -1), (5, 5), (8, 2**20)]
+        views = p.read_ranges(ranges, max_gap=1)
+        assert all(isinstance(view, memoryview) for view in views)
+        assert [bytes(view) for view in views] == [
+            data[3:5],
+            data[0:2],
+            data[1:4],
+            data[-3:-1],
+            b"",
+            data[8:],
+        ]
+
+    def test_read_into(self):
+        p = self.path_file
+        data = p.read_bytes()
+        buffer = bytearray(len(data) + 4)
+        assert p.read_into(buffer, range_size=3) == len(data)
+        assert buffer == data + bytes(4)
+        small = bytearray(3)
+        assert p.read_into(small) == 3
+        assert small == data[:3]
+
+    def test_open_buffer(self):
+        p = self.path_file
+        view = p.open_buffer(range_size=3)
+        assert isinstance(view, memoryview)
+        assert view.readonly
+        assert view == p.read_bytes()
+
+    def test_download_to(self, tmp_path):
+        p = self.path_file
+        local_path = tmp_path.joinpath("downloaded.txt")
+        p.download_to(local_path, range_size=3, max_concurrency=2)
+        assert local_path.read_bytes() == p.read_bytes()
+
+    def test_read_many(self):
+        paths = [
+            self.path.joinpath("file1.txt"),
+            self.path.joinpath("file2.txt"),
+            self.path.joinpath("file1.txt"),
+        ]
+        assert UPath.read_many(paths) == [p.read_bytes() for p in paths]
+
+        missing = self.path.joinpath("missing.txt")
+        results = UPath.read_many([paths[0], missing], return_exceptions=True)
+        assert results[0] == paths[0].read_bytes()
+        assert isinstance(results[1], FileNotFoundError)
+        with pytest.raises(FileNotFoundError):
+            UPath.read_many([paths[0], missing])
+
+    def test_stat_many(self):
+        paths = [
+            self.path.joinpath("file1.txt"),
+            self.path.joinpath("folder1"),
+            self.path.joinpath("missing.txt"),
+        ]
+        columns = UPath.stat_many(paths, missing_ok=True)
+        stats = [p.stat() for p in paths[:2]]
+        assert columns.names == [p.path for p in paths]
+        assert columns.sizes[0] == stats[0].st_size
+        assert list(columns.mtimes[:2]) == [s.st_mtime for s in stats]
+        assert list(columns.types) == [
+            UPathStatType.FILE,
+            UPathStatType.DIRECTORY,
+            UPathStatType.MISSING,
+        ]
+        with pytest.raises(FileNotFoundError):
+            UPath.stat_many(paths)
+
+    def test_stat_children(self):
+        def normalize(names):
+            return sorted(name.rstrip("/") for name in names)
+
+        columns = self.path.stat_children()
+        children = list(self.path.iterdir())
+        assert normalize(columns.names) == normalize(p.path for p in children)
+        sizes = dict(zip((n.rstrip("/") for n in columns.names), columns.sizes))
+        file1 = self.path.joinpath("file1.txt")
+        assert sizes[file1.path] == file1.stat().st_size
+
+        columns = self.path.stat_children(recursive=True)
+        files = [p for p in self.path.rglob("*") if p.is_file()]
+        assert normalize(columns.names) == normalize(p.path for p in files)
+        assert set(columns.types) == {UPathStatType.FILE}
+
+    def test_aiterdir(self):
+        async def run(p):
+            return [child async for child in p.aiterdir()]
+
+        assert set(asyncio.run(run(self.path))) == set(self.path.iterdir())
+
+    def test_aglob(self):
+        async def run(p):
+            return [match async for match in p.aglob("*.txt")]
+
+        assert set(asyncio.run(run(self.path))) == set(self.path.glob("*.txt"))
+
+    def test_aglob_case_sensitive(self):
+        async def run(p):
+            return [m async for m in p.aglob("FILE1.TXT", case_sensitive=False)]
+
+        expected = set(self.path.glob("FILE1.TXT", case_sensitive=False))
+        assert set(asyncio.run(run(self.path))) == expected
+
     def test_read_text(self):
         upath = self.path.joinpath("file1.txt")
         assert upath.read_text() == "hello world"
@@ -520,6 +670,19 @@ class ReadablePathTests:
                 if other.is_relative_to(path) and other != path:
                     pytest.fail(f"In bottom-up walk, {path} should come after {other}")
 
+    def test_walk_top_down_pruning(self):
+        def _raise(x):
+            raise x
+
+        folder1 = self.path.joinpath("folder1")
+        visited = []
+        for dirpath, dirnames, _ in self.path.walk(on_error=_raise):
+            visited.append(dirpath)
+            if "folder1" in dirnames:
+                dirnames.remove("folder1")
+        assert visited[0] == self.path
+        assert not any(p.is_relative_to(folder1) for p in visited)
+
     def test_samefile(self):
         f1 = self.path.joinpath("file1.txt")
         f2 = self.path.joinpath("file2.txt")
@@ -711,6 +874,10 @@ class NonWritablePathTests(_CommonWritablePathTests):
         with pytest.raises(UnsupportedOperation):
             self.path.unlink()
 
+    def test_unlink_many(self):
+        with pytest.raises(UnsupportedOperation):
+            UPath.unlink_many([self.path])
+
     def test_write_bytes(self):
         with pytest.raises(UnsupportedOperation):
             self.path_file.write_bytes(b"abc")
@@ -814,6 +981,43 @@ class WritablePathTests(_CommonWritablePathTests):
         path.write_text(s)
         assert path.read_text() == s
 
+    def test_async_write_unlink(self):
+        async def run(p):
+            assert await p.awrite_bytes(b"hello_async") == 11
+            assert await p.aread_bytes() == b"hello_async"
+            await p.aunlink()
+            assert not await p.aexists()
+            with pytest.raises(FileNotFoundError):
+                await p.aunlink()
+            await p.aunlink(missing_ok=True)
+
+        asyncio.run(run(self.path.joinpath("test_async_write.txt")))
+
+    def test_unlink_many(self):
+        paths = [self.path.joinpath(f"test_unlink_many_{i}.txt") for i in range(3)]
+        for p in paths:
+            p.write_bytes(b"x")
+        missing = self.path.joinpath("test_unlink_many_missing.txt")
+
+        results = UPath.unlink_many([*paths[:2], missing], return_exceptions=True)
+        assert results[:2] == [None, None]
+        assert isinstance(results[2], FileNotFoundError)
+        assert not paths[0].exists()
+        assert not paths[1].exists()
+        with pytest.raises(FileNotFoundError):
+            UPath.unlink_many([missing])
+        assert UPath.unlink_many([paths[2], missing], missing_ok=True) == [None, None]
+        assert not paths[2].exists()
+
+    def test_acopy(self):
+        async def run(src, dst):
+            return await src.acopy(dst)
+
+        src = self.path.joinpath("file1.txt")
+        dst = self.path.joinpath("file1_acopy.txt")
+        assert asyncio.run(run(src, dst)) == dst
+        assert dst.read_bytes() == src.read_bytes()
+
     def test_write_text_encoding(self):
         fn = "test_write_text_enc.txt"
         s = "hello_world"
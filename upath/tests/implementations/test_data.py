@@ -1,3 +1,4 @@
+import asyncio
 import stat
 
 import pytest
@@ -198,6 +199,18 @@ class TestUPathDataPath(
         with pytest.raises(UnsupportedOperation):
             super().test_iterdir_trailing_slash()
 
+    @overrides_base
+    def test_iterdir_info(self):
+        # DataPath does not have directories
+        with pytest.raises(NotADirectoryError):
+            super().test_iterdir_info()
+
+    @overrides_base
+    def test_scandir(self):
+        # DataPath does not have directories
+        with pytest.raises(NotADirectoryError):
+            super().test_scandir()
+
     @overrides_base
     def test_read_bytes(self):
         assert self.path.read_bytes() == b"hello world"
@@ -206,6 +219,40 @@ class TestUPathDataPath(
     def test_read_text(self):
         assert self.path.read_text() == "hello world"
 
+    @overrides_base
+    def test_async_read(self):
+        # DataPath does not support joins, so we read self.path
+        async def run(p):
+            return await p.aread_bytes(), await p.aexists(), await p.astat()
+
+        data, exists, st = asyncio.run(run(self.path))
+        assert data == b"hello world"
+        assert exists is True
+        assert st.st_size == 11
+
+    @overrides_base
+    def test_read_many(self):
+        # DataPath does not support joins, so we read self.path
+        assert UPath.read_many([self.path, str(self.path)]) == [b"hello world"] * 2
+
+    @overrides_base
+    def test_stat_many(self):
+        # DataPath does not support joins, so we stat self.path
+        columns = UPath.stat_many([self.path, str(self.path)])
+        assert list(columns.sizes) == [11, 11]
+
+    @overrides_base
+    def test_stat_children(self):
+        # DataPath does not have directories
+        with pytest.raises(NotADirectoryError):
+            self.path.stat_children()
+
+    @overrides_base
+    def test_aiterdir(self):
+        # DataPath does not have directories
+        with pytest.raises(NotADirectoryError):
+            super().test_aiterdir()
+
     @overrides_base
     def test_walk(self):
         # DataPath does not have directories
@@ -216,6 +263,11 @@ class TestUPathDataPath(
         # DataPath does not have directories
         assert list(self.path.walk(top_down=False)) == []
 
+    @overrides_base
+    def test_walk_top_down_pruning(self):
+        # DataPath does not have directories
+        assert list(self.path.walk()) == []
+
     @overrides_base
     def test_samefile(self):
         # DataPath doesn't have joins, so only identical paths are samefile
@@ -2,6 +2,7 @@ import pytest  # noqa: F401
 from fsspec import get_filesystem_class
 
 from upath import UPath
+from upath._stat import UPathStatType
 from upath.implementations.http import HTTPPath
 
 from ..cases import JoinablePathTests
@@ -88,6 +89,43 @@ class TestUPathHttp(
         assert p1.info.is_dir() is True
         assert p1.info.is_symlink() is False
 
+    @overrides_base
+    def test_stat_many(self):
+        # HTTPPath folders are files too
+        paths = [
+            self.path.joinpath("file1.txt"),
+            self.path.joinpath("folder1"),
+            self.path.joinpath("missing.txt"),
+        ]
+        columns = UPath.stat_many(paths, missing_ok=True)
+        assert columns.sizes[0] == paths[0].stat().st_size
+        assert list(columns.types) == [
+            UPathStatType.FILE,
+            UPathStatType.FILE,
+            UPathStatType.MISSING,
+        ]
+
+    @overrides_base
+    def test_stat_children(self):
+        # the directory listings of the test server don't report sizes
+        columns = self.path.stat_children()
+        names = sorted(name.rstrip("/") for name in columns.names)
+        assert names == sorted(p.path for p in self.path.iterdir())
+
+    @overrides_base
+    def test_read_ranges(self):
+        # the test server ignores range requests and always sends the whole
+        # file, which can't be told apart from ranges reaching past the end
+        p = self.path.joinpath("file1.txt")
+        data = p.read_bytes()
+        views = p.read_ranges([(3, 5), (0, 2), (1, 4), (-3, -1)], max_gap=1)
+        assert [bytes(view) for view in views] == [
+            data[3:5],
+            data[0:2],
+            data[1:4],
+            data[-3:-1],
+        ]
+
 
 @pytest.mark.parametrize(
     "args,parts",
@@ -60,3 +60,65 @@ class TestRayIOFSSpecLocal(TestFSSpecLocal):
 )
 def test_local_paths_are_pathlike(protocol, path):
     assert isinstance(UPath(path, protocol=protocol), os.PathLike)
+
+
+@pytest.mark.parametrize("protocol", [None, "file"])
+def test_local_copy_uses_kernel_copy(tmp_path, mocker, protocol):
+    from upath import _copy
+
+    src = UPath(tmp_path.joinpath("src"), protocol=protocol)
+    src.joinpath("sub").mkdir(parents=True)
+    src.joinpath("a.bin").write_bytes(os.urandom(1024))
+    src.joinpath("sub", "b.bin").write_bytes(b"b")
+    spy = mocker.spy(_copy, "copy_local_file")
+
+    dst = src.copy(tmp_path.joinpath("dst"))
+
+    assert spy.call_count == 2
+    assert dst.joinpath("a.bin").read_bytes() == src.joinpath("a.bin").read_bytes()
+    assert dst.joinpath("sub", "b.bin").read_bytes() == b"b"
+
+
+def test_copy_local_file_falls_back_to_buffered_copy(tmp_path, monkeypatch):
+    import errno
+
+    from upath import _copy
+
+    def unsupported(source_fd, target_fd):
+        raise OSError(errno.EXDEV, "cross-device link")
+
+    monkeypatch.setattr(_copy, "_KERNEL_COPIES", [unsupported, unsupported])
+    src = tmp_path.joinpath("src.bin")
+    src.write_bytes(os.urandom(2**20 + 1))
+    _copy.copy_local_file(str(src), str(tmp_path.joinpath("dst.bin")))
+    assert tmp_path.joinpath("dst.bin").read_bytes() == src.read_bytes()
+
+
+def test_copy_local_file_raises_other_errors(tmp_path, monkeypatch):
+    import errno
+
+    from upath import _copy
+
+    def no_space(source_fd, target_fd):
+        raise OSError(errno.ENOSPC, "no space left on device")
+
+    monkeypatch.setattr(_copy, "_KERNEL_COPIES", [no_space])
+    src = tmp_path.joinpath("src.bin")
+    src.write_bytes(b"abc")
+    with pytest.raises(OSError) as exc_info:
+        _copy.copy_local_file(str(src), str(tmp_path.joinpath("dst.bin")))
+    assert exc_info.value.errno == errno.ENOSPC
+    assert exc_info.value.filename == str(src)
+
+
+def test_local_open_buffer_is_mmap_backed(tmp_path):
+    import mmap
+
+    p = UPath(tmp_path.joinpath("data.bin"))
+    p.write_bytes(b"hello world")
+    view = p.open_buffer()
+    assert isinstance(view.obj, mmap.mmap)
+    assert view == b"hello world"
+    view.release()
+    p.with_name("empty.bin").touch()
+    assert p.with_name("empty.bin").open_buffer() == b""
@@ -101,6 +101,51 @@ class TestUPathS3(BaseTests, metaclass=OverrideMeta):
         (file,) = files
         assert file == p.joinpath("file.txt")
 
+    @extends_base
+    def test_rglob_streams_listing_pages(self, mocker):
+        expected = {
+            name.removeprefix(self.path.path).strip("/")
+            for name in self.path.fs.find(self.path.path, withdirs=True)
+        }
+        mocker.patch("upath._glob.PAGE_SIZE", 2)
+        iterdir = mocker.spy(type(self.path.fs), "_iterdir")
+        result = {str(p.relative_to(self.path)) for p in self.path.rglob("*")}
+        assert result == expected
+        assert iterdir.call_count == 1
+        assert iterdir.call_args.kwargs["delimiter"] == ""
+
+    @extends_base
+    def test_glob_pushes_down_literal_prefixes(self, mocker):
+        iterdir = mocker.spy(type(self.path.fs), "_iterdir")
+        result = sorted(p.name for p in self.path.glob("file[12]*"))
+        assert result == ["file1.txt", "file2.txt"]
+        prefixes = sorted(c.kwargs["prefix"] for c in iterdir.call_args_list)
+        assert [prefix.rpartition("/")[2] for prefix in prefixes] == ["file1", "file2"]
+
+    @extends_base
+    def test_optimistic_touch_uses_conditional_create(self, mocker):
+        pth = self.path.joinpath("optimistic.txt")
+        call_s3 = mocker.spy(type(self.path.fs), "_call_s3")
+        with UPath.optimistic_writes():
+            pth.touch(exist_ok=False)
+            with pytest.raises(FileExistsError):
+                pth.touch(exist_ok=False)
+        methods = [c.args[1] for c in call_s3.call_args_list]
+        assert methods == ["put_object"] * 2
+        assert pth.exists()
+
+    @extends_base
+    def test_optimistic_rmdir_probes_directory(self, mocker):
+        # s3fs.rmdir can't remove prefixes, they vanish with their last key
+        rmdir = mocker.spy(self.path.fs, "rmdir")
+        with UPath.optimistic_writes():
+            with pytest.raises(OSError, match="not empty"):
+                self.path.joinpath("folder1").rmdir(recursive=False)
+            with pytest.raises(NotADirectoryError):
+                self.path.joinpath("missing").rmdir(recursive=False)
+        rmdir.assert_not_called()
+        assert self.path.joinpath("folder1").exists()
+
     @extends_base
     @pytest.mark.xfail(reason="fsspec/universal_pathlib#144")
     def test_rglob_with_double_fwd_slash(self, s3_with_double_fwd_slash_files):
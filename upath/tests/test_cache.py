@@ -0,0 +1,209 @@
+import threading
+
+import pytest
+
+from upath import UPath
+from upath._cache import DEFAULT_LISTING_CACHE
+from upath._cache import ListingCache
+from upath._cache import get_listing_cache
+
+from .utils import CountingMemoryFileSystem
+
+
+@pytest.fixture
+def fs():
+    return CountingMemoryFileSystem()
+
+
+@pytest.fixture
+def base(fs, mocker):
+    base = UPath("memory:///listing_cache")
+    mocker.patch.object(type(base), "fs", fs)
+    base.joinpath("a.txt").write_bytes(b"a")
+    base.joinpath("sub", "b.txt").write_bytes(b"b")
+    fs.calls.clear()
+    fs.counts.clear()
+    yield base
+    DEFAULT_LISTING_CACHE.clear()
+
+
+def test_listing_cache_disabled_by_default(base, fs):
+    assert get_listing_cache() is None
+    assert base.joinpath("a.txt").exists()
+    assert base.joinpath("a.txt").exists()
+    assert len(fs.calls) == 2
+
+
+def test_listing_cache_serves_children_from_listing(base, fs):
+    with UPath.listing_cache() as cache:
+        assert sorted(p.name for p in base.iterdir()) == ["a.txt", "sub"]
+        assert base.joinpath("a.txt").is_file()
+        assert base.joinpath("sub").is_dir()
+        assert base.joinpath("a.txt").stat().st_size == 1
+        assert sorted(p.name for p in base.iterdir()) == ["a.txt", "sub"]
+    assert fs.calls == [("ls", "/listing_cache")]
+    assert cache.cache_info().hits == 4
+
+
+def test_listing_cache_caches_info(base, fs):
+    pth = base.joinpath("sub", "b.txt")
+    with UPath.listing_cache():
+        assert pth.exists()
+        assert pth.is_file()
+        assert not pth.is_dir()
+        assert not base.joinpath("missing").exists()
+    assert fs.calls.count(("info", "/listing_cache/sub/b.txt")) == 1
+
+
+@pytest.mark.parametrize(
+    "write",
+    [
+        lambda p: p.joinpath("new.txt").touch(),
+        lambda p: p.joinpath("new.txt").write_bytes(b"new"),
+        lambda p: p.joinpath("new.txt").write_text("new"),
+        lambda p: p.joinpath("new", "c.txt").write_bytes(b"c"),
+        lambda p: p.joinpath("new").mkdir(),
+        lambda p: p.joinpath("a.txt").rename(p.joinpath("new.txt")),
+        lambda p: p.joinpath("a.txt").copy(p.joinpath("new.txt")),
+    ],
+)
+def test_listing_cache_invalidated_by_writes(base, write):
+    with UPath.listing_cache():
+        assert not base.joinpath("new.txt").exists()
+        names = {p.name for p in base.iterdir()}
+        write(base)
+        assert {p.name for p in base.iterdir()} != names
+
+
+@pytest.mark.parametrize("mode", ["wb", "w", "ab"])
+def test_listing_cache_invalidated_when_written_file_is_closed(base, mode):
+    pth = base.joinpath("new.txt")
+    with UPath.listing_cache():
+        with pth.open(mode) as f:
+            f.write(b"ne" if "b" in mode else "ne")
+            f.flush()
+            list(base.iterdir())
+            f.write(b"w" if "b" in mode else "w")
+        assert pth.name in {p.name for p in base.iterdir()}
+        assert pth.stat().st_size == 3
+
+
+def test_listing_cache_invalidated_by_removal(base):
+    with UPath.listing_cache():
+        assert base.joinpath("a.txt").exists()
+        assert base.joinpath("sub", "b.txt").exists()
+        base.joinpath("a.txt").unlink()
+        base.joinpath("sub").rmdir()
+        assert not base.joinpath("a.txt").exists()
+        assert not base.joinpath("sub", "b.txt").exists()
+        assert not base.joinpath("sub").exists()
+
+
+def test_listing_cache_invalidated_outside_context(base):
+    with UPath.listing_cache():
+        assert base.joinpath("a.txt").exists()
+    base.joinpath("a.txt").unlink()
+    with UPath.listing_cache():
+        assert not base.joinpath("a.txt").exists()
+
+
+def test_listing_cache_opt_out(base, fs):
+    with UPath.listing_cache():
+        with UPath.listing_cache(enabled=False) as cache:
+            assert cache is None
+            base.joinpath("a.txt").exists()
+            base.joinpath("a.txt").exists()
+        assert get_listing_cache() is DEFAULT_LISTING_CACHE
+    assert len(fs.calls) == 2
+
+
+def test_listing_cache_is_context_local(base):
+    result = []
+    with UPath.listing_cache():
+        t = threading.Thread(target=lambda: result.append(get_listing_cache()))
+        t.start()
+        t.join()
+    assert result == [None]
+
+
+def test_listing_cache_ttl(base, fs, mocker):
+    now = [0.0]
+    mocker.patch("upath._cache.monotonic", lambda: now[0])
+    with UPath.listing_cache(ttl=10) as cache:
+        assert cache is not DEFAULT_LISTING_CACHE
+        base.joinpath("a.txt").exists()
+        now[0] = 5.0
+        base.joinpath("a.txt").exists()
+        now[0] = 11.0
+        base.joinpath("a.txt").exists()
+    assert len(fs.calls) == 2
+
+
+def test_listing_cache_is_bounded(fs):
+    cache = ListingCache(maxsize=2)
+    for name in ["a", "b", "c"]:
+        cache.put_info(fs, f"/{name}", {"name": f"/{name}", "type": "file"})
+    assert cache.get_info(fs, "/a") is None
+    assert cache.get_info(fs, "/c") is not None
+    assert cache.cache_info() == (1, 1, 2, 2)
+    cache.clear()
+    assert cache.cache_info() == (0, 0, 2, 0)
+
+
+def test_negative_lookups_disabled_by_default(base, fs):
+    pth = base.joinpath("marker")
+    with UPath.listing_cache() as cache:
+        assert cache.negative_ttl is None
+        assert not pth.exists()
+        assert not pth.exists()
+    assert fs.calls.count(("info", "/listing_cache/marker")) == 2
+
+
+def test_negative_lookups_cache_failed_lookups(base, fs, mocker):
+    now = [0.0]
+    mocker.patch("upath._cache.monotonic", lambda: now[0])
+    pth = base.joinpath("marker")
+    with UPath.listing_cache(negative_ttl=1) as cache:
+        assert not pth.exists()
+        assert not pth.is_file()
+        assert not pth.is_dir()
+        with pytest.raises(FileNotFoundError):
+            pth.stat()
+        now[0] = 2.0
+        assert not pth.exists()
+    assert fs.calls == [("info", "/listing_cache/marker")] * 2
+    assert cache.cache_info().hits == 3
+
+
+def test_negative_lookups_from_parent_listing(base, fs, mocker):
+    now = [0.0]
+    mocker.patch("upath._cache.monotonic", lambda: now[0])
+    with UPath.listing_cache(negative_ttl=1):
+        list(base.iterdir())
+        assert not base.joinpath("marker").exists()
+        now[0] = 2.0
+        assert base.joinpath("a.txt").exists()
+        assert not base.joinpath("marker").exists()
+    assert fs.calls == [
+        ("ls", "/listing_cache"),
+        ("info", "/listing_cache/marker"),
+    ]
+
+
+@pytest.mark.parametrize(
+    "write",
+    [
+        lambda p: p.touch(),
+        lambda p: p.write_bytes(b"x"),
+        lambda p: p.joinpath("c.txt").write_bytes(b"c"),
+        lambda p: p.mkdir(),
+        lambda p: p.parent.joinpath("a.txt").copy(p),
+    ],
+)
+def test_negative_lookups_invalidated_by_writes(base, write):
+    pth = base.joinpath("marker")
+    with UPath.listing_cache(negative_ttl=60):
+        list(base.iterdir())
+        assert not pth.exists()
+        write(pth)
+        assert pth.exists()
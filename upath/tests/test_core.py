@@ -1,8 +1,12 @@
+import asyncio
 import os
 import pathlib
 import pickle
 import sys
 import warnings
+from contextlib import nullcontext
+from io import BytesIO
+from types import SimpleNamespace
 from urllib.parse import SplitResult
 
 import pathlib_abc
@@ -17,6 +21,7 @@ from upath.types import ReadablePath
 from upath.types import WritablePath
 
 from .cases import BaseTests
+from .utils import CountingMemoryFileSystem
 from .utils import OverrideMeta
 from .utils import only_on_windows
 from .utils import overrides_base
@@ -527,6 +532,19 @@ def test_constructor_compatible_protocol_uri(uri, protocol):
     assert p.protocol == protocol
 
 
+@pytest.mark.parametrize("uri", ["s3://bucket/key", "memory:///a/b"])
+def test_constructor_detects_protocol_once(uri, mocker):
+    import upath._chain
+    import upath.core
+
+    detect = [
+        mocker.spy(upath.core, "get_upath_protocol"),
+        mocker.spy(upath._chain, "get_upath_protocol"),
+    ]
+    UPath(uri)
+    assert sum(spy.call_count for spy in detect) == 1
+
+
 # Protocol to sample URI mapping
 _PROTOCOL_URIS = {
     "s3": "s3://bucket/folder",
@@ -574,3 +592,409 @@ def test_subclass_constructor_incompatible_protocol_uri(uri, protocol):
     cls = get_upath_class(protocol)
     with pytest.raises(TypeError, match=r".*incompatible with"):
         cls(uri)
+
+
+def test_iterdir_info_is_cached_from_listing(clear_fsspec_memory_cache, mocker):
+    base = UPath("memory:///iterdir-info")
+    base.joinpath("file.txt").write_text("hello")
+    base.joinpath("folder", "file.txt").write_text("world")
+
+    fs = base.fs
+    spies = [mocker.spy(fs, name) for name in ("info", "exists", "isdir", "isfile")]
+    children = {p.name: p for p in base.iterdir()}
+    for spy in spies:
+        spy.reset_mock()
+
+    assert children["file.txt"].info.is_file()
+    assert not children["file.txt"].info.is_dir()
+    assert children["folder"].info.is_dir()
+    assert children["folder"].info.exists()
+    assert children["folder"].info is children["folder"].info
+    assert all(spy.call_count == 0 for spy in spies)
+
+
+def test_info_is_not_cached_outside_iterdir(clear_fsspec_memory_cache):
+    p = UPath("memory:///info-uncached/file.txt")
+    assert not p.info.exists()
+    p.write_text("hello")
+    assert p.info.exists()
+    assert p.info.is_file()
+
+
+def test_iterdir_info_is_dropped_on_write(clear_fsspec_memory_cache):
+    base = UPath("memory:///iterdir-info-write")
+    base.joinpath("file.txt").write_text("hello")
+    (child,) = base.iterdir()
+    assert child.info.exists()
+    child.unlink()
+    assert not child.info.exists()
+
+
+def test_info_refresh(clear_fsspec_memory_cache, mocker):
+    p = UPath("memory:///info-refresh/file.txt")
+    info = p.info
+    assert info.exists() is False
+
+    p.write_text("hello")
+    info.refresh()
+    spy = mocker.spy(p.fs, "exists")
+    assert info.exists() is True
+    assert info.is_file() is True
+    assert spy.call_count == 0
+
+    p.unlink()
+    assert info.exists() is True
+    info.refresh()
+    assert info.exists() is False
+    assert info.is_file() is False
+
+
+def test_scandir_no_per_entry_requests(clear_fsspec_memory_cache, mocker):
+    base = UPath("memory:///scandir")
+    base.joinpath("file.txt").write_text("hello")
+    base.joinpath("folder", "file.txt").write_text("world")
+
+    fs = base.fs
+    with base.scandir() as it:
+        spies = [mocker.spy(fs, name) for name in ("info", "isdir", "isfile", "ls")]
+        entries = {entry.name: entry for entry in it}
+        assert entries["file.txt"].is_file()
+        assert entries["file.txt"].stat().st_size == 5
+        assert entries["folder"].is_dir()
+        assert entries["folder"].upath == base.joinpath("folder")
+    assert all(spy.call_count == 0 for spy in spies)
+
+
+def _counting_memory_path(path):
+    p = UPath(path, protocol="memory")
+    p._fs_cached = CountingMemoryFileSystem()
+    return p
+
+
+@pytest.mark.parametrize("list_first,expected_requests", [(True, 1), (False, 2)])
+def test_iterdir_request_count(monkeypatch, list_first, expected_requests):
+    monkeypatch.setattr(UPath, "_iterdir_list_first", list_first)
+    base = _counting_memory_path("/tree")
+    for i in range(10):
+        base.joinpath(f"dir{i}", "file.txt").write_bytes(b"x")
+    dirs = list(base.iterdir())
+    fs = base.fs
+    fs.counts.clear()
+
+    for d in dirs:
+        assert [c.name for c in d.iterdir()] == ["file.txt"]
+    assert fs.requests == expected_requests * len(dirs)
+
+
+def test_iterdir_list_first_errors():
+    base = _counting_memory_path("/tree")
+    base.joinpath("file.txt").write_bytes(b"x")
+    base.joinpath("empty").mkdir()
+
+    with pytest.raises(NotADirectoryError):
+        list(base.joinpath("file.txt").iterdir())
+    with pytest.raises(NotADirectoryError):
+        list(base.joinpath("missing").iterdir())
+    assert list(base.joinpath("empty").iterdir()) == []
+
+
+def test_walk_recursive_listing(monkeypatch):
+    base = _counting_memory_path("/tree")
+    base.joinpath("file.txt").write_bytes(b"x")
+    base.joinpath("a", "b", "file.txt").write_bytes(b"x")
+    base.joinpath("c", "file.txt").write_bytes(b"x")
+    base.joinpath("empty").mkdir()
+
+    fs = base.fs
+    for top_down in (True, False):
+        monkeypatch.setattr(UPath, "_walk_recursive_listing", False)
+        expected = [
+            (str(p), sorted(d), sorted(f)) for p, d, f in base.walk(top_down=top_down)
+        ]
+        monkeypatch.setattr(UPath, "_walk_recursive_listing", True)
+        fs.counts.clear()
+        result = [
+            (str(p), sorted(d), sorted(f)) for p, d, f in base.walk(top_down=top_down)
+        ]
+        assert fs.counts["find"] == 1
+        assert fs.counts["ls"] == 0
+        assert sorted(result) == sorted(expected)
+
+
+@pytest.mark.parametrize("name", ["file.txt", "missing"])
+def test_walk_recursive_listing_on_error(monkeypatch, name):
+    monkeypatch.setattr(UPath, "_walk_recursive_listing", True)
+    base = _counting_memory_path("/tree")
+    base.joinpath("file.txt").write_bytes(b"x")
+
+    errors = []
+    assert list(base.joinpath(name).walk(on_error=errors.append)) == []
+    assert len(errors) == 1
+    assert isinstance(errors[0], NotADirectoryError)
+
+
+@pytest.mark.parametrize(
+    "urlpath",
+    [
+        "memory:///a/b",
+        "memory:///a/b/",
+        "memory:///",
+        "s3://bucket",
+        "s3://bucket/",
+        "s3://bucket/a/b",
+        "gs://bucket/a",
+        "az://container/a/b/",
+        "file:///tmp/a",
+        "http://example.com/a/",
+        "http://example.com",
+        "zip://a/b::memory:///archive.zip",
+    ],
+)
+@pytest.mark.parametrize("segment", ["c", "c/d.txt", "c/", "..", "c:d"])
+def test_with_segments_lexical_join(urlpath, segment):
+    p = UPath(urlpath, anon=True)
+    child = p / segment
+    expected = type(p)(
+        p.__vfspath__(), segment, protocol=p.protocol, **p.storage_options
+    )
+    assert type(child) is type(expected)
+    assert str(child) == str(expected)
+    assert child.path == expected.path
+    assert child.parts == expected.parts
+    assert child.storage_options == expected.storage_options
+    assert child._chain.to_list() == expected._chain.to_list()
+
+
+def test_with_segments_lexical_join_skips_constructor(mocker):
+    p = UPath("memory:///a/b")
+    spy = mocker.spy(UPath, "__init__")
+    child = p.joinpath("c")
+    assert spy.call_count == 0
+    assert child.path == "/a/b/c"
+    assert child.fs is p.fs
+
+
+def test_with_segments_lexical_join_user_subclass(mocker, upath_registry_snapshot):
+    class MyPath(UPath):
+        pass
+
+    register_implementation("memory", MyPath, clobber=True)
+    p = MyPath("memory:///a/b")
+    spy = mocker.spy(MyPath, "__init__")
+    child = p.joinpath("c")
+    assert spy.call_count == 1
+    assert type(child) is MyPath
+
+
+def test_derived_attributes_are_cached(mocker):
+    p = UPath("memory:///a/b/c.txt")
+    spy = mocker.spy(p._chain_parser, "chain")
+    assert str(p) == str(p) == "memory://a/b/c.txt"
+    assert spy.call_count == 1
+    assert p.parts is p.parts
+    assert p.parent is p.parent
+    assert p.name == p.name == "c.txt"
+    assert hash(p) == hash(UPath("memory:///a/b/c.txt"))
+
+
+def test_derived_attributes_invalidated_on_mutation():
+    p = UPath("memory:///a/b/c.txt")
+    assert p.parts == ("/", "a", "b", "c.txt")
+    assert p.name == "c.txt"
+    hash(p)
+
+    p._chain = p._chain.replace(path="/a/d.txt")
+    assert str(p) == "memory://a/d.txt"
+    assert p.parts == ("/", "a", "d.txt")
+    assert p.name == "d.txt"
+    assert p.parent.path == "/a"
+    assert hash(p) == hash(UPath("memory:///a/d.txt"))
+
+    p._relative_base = "/a"
+    assert str(p) == "d.txt"
+    assert p.parts == ("d.txt",)
+
+
+@pytest.mark.parametrize(
+    "strings,protocol",
+    [
+        (["memory:///a/b", "memory:///a/c/", "memory://d"], None),
+        (["/a/b", "a/c"], "memory"),
+        (["s3://bucket/a.txt", "s3://bucket/b/", "s3://other"], None),
+        (["bucket/a.txt", "bucket2/b.txt"], "s3"),
+        (["gs://bucket/a.txt", "gcs://bucket/b.txt"], None),
+        (["http://example.com/a", "https://example.com/b"], None),
+        (["example.com/a", "example.com/b"], "http"),
+        (["memory:///a", "s3://bucket/b", "zip://a::memory:///b.zip"], None),
+    ],
+)
+def test_from_strings(strings, protocol):
+    storage_options = {"anon": True} if protocol == "s3" else {}
+    paths = UPath.from_strings(strings, protocol=protocol, **storage_options)
+    expected = [UPath(s, protocol=protocol, **storage_options) for s in strings]
+    assert len(paths) == len(expected)
+    for p, e in zip(paths, expected):
+        assert type(p) is type(e)
+        assert str(p) == str(e)
+        assert p.path == e.path
+        assert p.parts == e.parts
+        assert p.storage_options == e.storage_options
+        assert p._chain.to_list() == e._chain.to_list()
+
+
+def test_from_strings_skips_constructor(mocker):
+    paths = UPath.from_strings(["memory:///a", "memory:///b", "memory:///c"])
+    spy = mocker.spy(UPath, "__init__")
+    paths = UPath.from_strings(["memory:///a", "memory:///b", "memory:///c"])
+    assert spy.call_count == 1
+    assert [p.path for p in paths] == ["/a", "/b", "/c"]
+
+
+def test_from_strings_columnar():
+    strings = ["s3://bucket/a.txt", "s3://bucket/b.txt", "memory:///c.txt"]
+    paths = UPath.from_strings(strings, columnar=True, anon=True)
+    assert len(paths) == 3
+    assert all(isinstance(item, str) for item in paths._items[:2])
+    assert paths[0] == UPath("s3://bucket/a.txt", anon=True)
+    assert paths[-1] == UPath("memory:///c.txt", anon=True)
+    assert list(paths[1:]) == list(paths)[1:]
+    assert list(paths) == UPath.from_strings(strings, anon=True)
+
+
+def test_from_strings_empty():
+    assert UPath.from_strings([]) == []
+    assert len(UPath.from_strings([], columnar=True)) == 0
+
+
+def test_iter_read_many():
+    a = UPath("memory:///read_many/a.txt")
+    b = UPath("memory:///read_many/b.txt")
+    a.write_bytes(b"a")
+    b.write_bytes(b"b")
+    assert dict(UPath.iter_read_many([a, str(b)])) == {a: b"a", b: b"b"}
+    with pytest.raises(ValueError):
+        UPath.read_many([a], max_concurrency=0)
+
+
+def test_read_many_max_concurrency():
+    from fsspec.asyn import AsyncFileSystem
+
+    from upath._bulk import cat_concurrently
+
+    class SlowAsyncFileSystem(AsyncFileSystem):
+        protocol = "slowasync"
+        in_flight = max_in_flight = 0
+
+        async def _cat_file(self, path, start=None, end=None, **kwargs):
+            cls = type(self)
+            cls.in_flight += 1
+            cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+            await asyncio.sleep(0.01)
+            cls.in_flight -= 1
+            return path.encode()
+
+    fs = SlowAsyncFileSystem(skip_instance_cache=True)
+    items = [(fs, f"file{i}") for i in range(20)]
+    results = dict(cat_concurrently(items, max_concurrency=4))
+    assert results == {i: f"file{i}".encode() for i in range(20)}
+    assert 1 < SlowAsyncFileSystem.max_in_flight <= 4
+
+
+def test_unlink_many_batches_per_filesystem(mocker):
+    paths = [UPath(f"memory:///unlink_many/file{i}.txt") for i in range(5)]
+    for p in paths:
+        p.write_bytes(b"x")
+    spy = mocker.spy(type(paths[0].fs), "rm")
+    assert UPath.unlink_many(paths, batch_size=2, check_exists=False) == [None] * 5
+    assert [len(call.args[1]) for call in spy.call_args_list] == [2, 2, 1]
+    assert not any(p.exists() for p in paths)
+
+
+def test_unlink_many_reports_failed_batch_per_path():
+    paths = [UPath(f"memory:///unlink_many/file{i}.txt") for i in range(3)]
+    for p in paths[::2]:
+        p.write_bytes(b"x")
+    results = UPath.unlink_many(paths, check_exists=False, return_exceptions=True)
+    assert results[0] is None
+    assert isinstance(results[1], FileNotFoundError)
+    assert not paths[0].exists() and not paths[2].exists()
+
+
+def test_copy_same_filesystem_copies_server_side(mocker):
+    from fsspec.callbacks import Callback
+
+    src = UPath("memory:///copy_engine/src")
+    for name in ["a.txt", "b.txt", "sub/c.txt"]:
+        src.joinpath(name).write_bytes(name.encode())
+    dst = UPath("memory:///copy_engine/dst")
+    spy = mocker.spy(type(src.fs), "cp_file")
+    callback = Callback()
+
+    src.copy(dst, callback=callback)
+
+    assert spy.call_count == 3
+    assert (callback.size, callback.value) == (3, 3)
+    for name in ["a.txt", "b.txt", "sub/c.txt"]:
+        assert dst.joinpath(name).read_bytes() == name.encode()
+
+
+def test_copy_local_to_remote_uploads(tmp_path, mocker):
+    src = UPath(tmp_path).joinpath("src")
+    src.mkdir()
+    src.joinpath("a.txt").write_bytes(b"a")
+    dst = UPath("memory:///copy_engine/uploaded")
+    spy = mocker.spy(type(dst.fs), "put_file")
+
+    src.copy(dst)
+
+    assert spy.call_count == 1
+    assert dst.joinpath("a.txt").read_bytes() == b"a"
+
+
+def test_read_bytes_ranged_fetches_ranges(mocker):
+    p = UPath("memory:///ranged/data.bin")
+    data = os.urandom(1000)
+    p.write_bytes(data)
+    spy = mocker.spy(type(p.fs), "cat_file")
+    assert p.read_bytes(range_size=300) == data
+    ranges = sorted((c.kwargs["start"], c.kwargs["end"]) for c in spy.call_args_list)
+    assert ranges == [(0, 300), (300, 600), (600, 900), (900, 1000)]
+
+
+def test_read_ranges_coalesces_nearby_ranges(mocker):
+    p = UPath("memory:///ranged/columns.bin")
+    data = bytes(range(256)) * 4
+    p.write_bytes(data)
+    spy = mocker.spy(type(p.fs), "cat_file")
+    views = p.read_ranges([(500, 510), (0, 10), (20, 30), (1000, 1024)], max_gap=10)
+    expected = [data[500:510], data[:10], data[20:30], data[1000:]]
+    assert [bytes(v) for v in views] == expected
+    blocks = sorted((c.kwargs["start"], c.kwargs["end"]) for c in spy.call_args_list)
+    assert blocks == [(0, 30), (500, 510), (1000, 1024)]
+    assert all(v.readonly for v in views)
+
+
+def test_open_buffer_memory_is_zero_copy():
+    p = UPath("memory:///buffers/data.bin")
+    p.write_bytes(b"hello world")
+    view = p.open_buffer()
+    assert view == b"hello world"
+    # the view exports the stored buffer, so it can't be resized meanwhile
+    with pytest.raises(BufferError):
+        p.fs.store[p.path].truncate(0)
+    view.release()
+    p.fs.store[p.path].truncate(0)
+
+
+@pytest.mark.parametrize("readinto", [True, False])
+def test_read_into_unknown_size(mocker, readinto):
+    p = UPath("memory:///buffers/unknown-size.bin")
+    p.write_bytes(b"hello world")
+    mocker.patch.object(type(p.fs), "size", return_value=None)
+    if not readinto:
+        # a file object without readinto()
+        f = SimpleNamespace(read=BytesIO(b"hello world").read)
+        mocker.patch.object(type(p), "open", return_value=nullcontext(f))
+    buffer = bytearray(8)
+    assert p.read_into(buffer) == 8
+    assert buffer == b"hello wo"
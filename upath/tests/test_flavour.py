@@ -0,0 +1,89 @@
+import pytest
+
+from upath._flavour import LocalFileSystemFlavour
+from upath._flavour import NetlocAnchoredFileSystemFlavour
+from upath._flavour import PosixLikeFileSystemFlavour
+from upath._flavour import WrappedFileSystemFlavour
+
+PATHS = {
+    "file": ["/", "/a", "/a/b/c.txt", "/a/b/", "file:///a/b", "a/b", ""],
+    "memory": ["/", "/a", "/a/b/c.txt", "/a/b/", "memory://a/b", "a/b", ""],
+    "s3": ["bucket", "bucket/", "bucket/a/b.txt", "s3://bucket/a/", "b/a:c"],
+    "gcs": ["bucket", "bucket/a/b.txt", "gs://bucket/a/b/", "gcs://bucket"],
+    "az": ["container/a/b", "az://container/a//b", "abfs://container/"],
+    "http": [
+        "http://example.com",
+        "http://example.com/",
+        "http://example.com/a/b.txt",
+        "http://example.com/a/b/",
+        "http://example.com//a?q=1",
+    ],
+    "sftp": ["/", "/a/b", "ssh://host/a/b", "sftp://host/"],
+    "zip": ["/", "a/b.txt", "zip://a/b"],
+}
+
+
+def _generic_flavour(flavour):
+    return WrappedFileSystemFlavour(
+        flavour._spec,
+        netloc_is_anchor=flavour.netloc_is_anchor,
+        supports_empty_parts=flavour.supports_empty_parts,
+        meaningful_trailing_slash=flavour.has_meaningful_trailing_slash,
+        root_marker_override=flavour.root_marker_override,
+    )
+
+
+@pytest.mark.parametrize(
+    "protocol,flavour_cls",
+    [
+        ("file", LocalFileSystemFlavour),
+        ("memory", PosixLikeFileSystemFlavour),
+        ("s3", NetlocAnchoredFileSystemFlavour),
+        ("http", NetlocAnchoredFileSystemFlavour),
+    ],
+)
+def test_from_protocol_returns_specialised_flavour(protocol, flavour_cls):
+    flavour = WrappedFileSystemFlavour.from_protocol(protocol)
+    assert type(flavour) is flavour_cls
+    assert WrappedFileSystemFlavour.from_protocol(protocol) is flavour
+
+
+@pytest.mark.parametrize(
+    "protocol,path",
+    [(protocol, path) for protocol, paths in PATHS.items() for path in paths],
+)
+def test_specialised_flavour_matches_generic_flavour(protocol, path):
+    flavour = WrappedFileSystemFlavour.from_protocol(protocol)
+    generic = _generic_flavour(flavour)
+    # run twice to check memoized results too
+    for _ in range(2):
+        assert flavour.strip_protocol(path) == generic.strip_protocol(path)
+        assert flavour.isabs(path) == generic.isabs(path)
+        assert flavour.split(path) == generic.split(path)
+        assert flavour.splitdrive(path) == generic.splitdrive(path)
+        assert flavour.splitroot(path) == generic.splitroot(path)
+        assert flavour.splitext(path) == generic.splitext(path)
+        assert flavour.normcase(path) == generic.normcase(path)
+        assert flavour.join(path) == generic.join(path)
+        assert flavour.join(path, "c", "d.txt") == generic.join(path, "c", "d.txt")
+
+
+def test_specialised_flavour_memo_is_bounded(monkeypatch):
+    monkeypatch.setattr(PosixLikeFileSystemFlavour, "_memo_maxsize", 8)
+    flavour = PosixLikeFileSystemFlavour(
+        WrappedFileSystemFlavour.from_protocol("memory")._spec
+    )
+    for i in range(20):
+        flavour.split(f"/a/{i}")
+    assert flavour._strip_protocol_str.cache_info().currsize <= 8
+    assert flavour._split_str.cache_info().currsize <= 8
+
+
+def test_local_flavour_resolves_relative_paths_against_cwd(tmp_path, monkeypatch):
+    flavour = WrappedFileSystemFlavour.from_protocol("file")
+    monkeypatch.chdir(tmp_path)
+    first = flavour.strip_protocol("foo")
+    monkeypatch.chdir(tmp_path.parent)
+    second = flavour.strip_protocol("foo")
+    assert first != second
+    assert second.endswith(f"{tmp_path.parent.name}/foo")
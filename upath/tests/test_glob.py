@@ -0,0 +1,194 @@
+import re
+from itertools import islice
+
+import pytest
+from fsspec.implementations.memory import MemoryFileSystem
+
+from upath import UPath
+from upath._glob import compile_pattern
+from upath._glob import expand_prefixes
+from upath._glob import translate
+
+FILES = [
+    "year=2023/month=01/part-0.parquet",
+    "year=2024/month=01/part-0.parquet",
+    "year=2024/month=01/part-1.parquet",
+    "year=2024/month=02/part-0.parquet",
+    "year=2024/month=02/_SUCCESS",
+    "year=2024/month=11/part-0.parquet",
+    "year=2024/README.md",
+]
+
+
+@pytest.mark.parametrize(
+    "segment,prefixes",
+    [
+        ("part-*.parquet", ["part-"]),
+        ("month=0*", ["month=0"]),
+        ("month=0[12]", ["month=01", "month=02"]),
+        ("[ab][xy]*", ["ax", "ay", "bx", "by"]),
+        ("m[0-2]?", ["m0", "m1", "m2"]),
+        ("m[!0]*", ["m"]),
+        ("m[0*", ["m"]),
+        ("*.txt", [""]),
+        ("literal", ["literal"]),
+    ],
+)
+def test_expand_prefixes(segment, prefixes):
+    assert expand_prefixes(segment) == prefixes
+
+
+@pytest.mark.parametrize(
+    "pattern,matches,non_matches",
+    [
+        ("*.txt", ["a.txt", ".txt"], ["a/b.txt", "a.txt/b"]),
+        ("**/*.txt", ["a.txt", "a/b.txt", "a/b/c.txt"], ["a/b.txt/c"]),
+        ("a/**", ["a/b", "a/b/c"], ["a", "b", "ab"]),
+        ("a/**/b", ["a/b", "a/x/b", "a/x/y/b"], ["a/xb", "b"]),
+        ("[!a]?", ["ba", "cc"], ["ab", "b/", "b"]),
+        ("*", ["a"], ["", "a/b"]),
+    ],
+)
+def test_translate(pattern, matches, non_matches):
+    regex = re.compile(translate(pattern, "/"))
+    assert all(regex.match(m) for m in matches)
+    assert not any(regex.match(m) for m in non_matches)
+
+
+def test_translate_match_parent():
+    regex = re.compile(translate("a/**", "/", match_parent=True))
+    assert regex.match("a")
+    assert regex.match("a/b/c")
+    assert not regex.match("ab")
+
+
+def test_compile_pattern_case_insensitive():
+    assert compile_pattern("**/*.TXT", "/", False)("a/B.txt")
+    assert not compile_pattern("**/*.TXT", "/", True)("a/B.txt")
+    assert compile_pattern("a/*", "/") is compile_pattern("a/*", "/")
+
+
+@pytest.fixture
+def local_tree(tmp_path):
+    for name in FILES:
+        tmp_path.joinpath(name).parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.joinpath(name).write_bytes(b"x")
+    return tmp_path
+
+
+@pytest.fixture
+def memory_tree():
+    base = UPath("memory:///glob_planner")
+    for name in FILES:
+        base.joinpath(name).write_bytes(b"x")
+    yield base
+    base.fs.rm(base.path, recursive=True)
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        "year=2024/month=0*/part-*.parquet",
+        "year=2024/month=0[12]/*",
+        "year=202?/month=01/part-0.parquet",
+        "*/README.md",
+        "year=2024/*",
+        "year=2024/*/",
+        "year=2024/month=1*/",
+        "year=2024/month=01",
+        "year=2024/missing/*",
+        "year=2024/README.md/*",
+        "year=[!2]*",
+        "**/*.parquet",
+        "**/month=0?/",
+        "**/README.md",
+        "year=2024/**/part-1.parquet",
+        "year=*/**/_SUCCESS",
+        "**/",
+    ],
+)
+def test_glob_matches_pathlib(local_tree, memory_tree, pattern):
+    expected = sorted(
+        p.relative_to(local_tree).as_posix() for p in local_tree.glob(pattern)
+    )
+    result = sorted(
+        p.relative_to(memory_tree).as_posix() for p in memory_tree.glob(pattern)
+    )
+    assert result == expected
+
+
+def test_glob_lists_each_directory_once(memory_tree, mocker):
+    ls = mocker.spy(memory_tree.fs, "ls")
+    pattern = "year=2024/month=0[12]/part-*.parquet"
+    matches = sorted(p.name for p in memory_tree.glob(pattern))
+    assert matches == ["part-0.parquet", "part-0.parquet", "part-1.parquet"]
+    assert sorted(c.args[0] for c in ls.call_args_list) == [
+        "/glob_planner/year=2024",
+        "/glob_planner/year=2024/month=01",
+        "/glob_planner/year=2024/month=02",
+    ]
+
+
+class RecursiveMemoryFileSystem(MemoryFileSystem):
+    protocol = "recursivememory"
+
+    def ls(self, path, detail=True, **kwargs):
+        # list nested entries like backends that ignore the delimiter
+        out = self.find(path, withdirs=True, detail=True)
+        return list(out.values()) if detail else list(out)
+
+
+def test_glob_skips_nested_entries(memory_tree, mocker):
+    expected = sorted(map(str, memory_tree.glob("*/*")))
+    fs = RecursiveMemoryFileSystem(skip_instance_cache=True)
+    mocker.patch.object(type(memory_tree), "fs", fs)
+    assert sorted(map(str, memory_tree.glob("*/*"))) == expected
+
+
+def test_rglob_stops_listing_when_closed(memory_tree, mocker):
+    ls = mocker.spy(memory_tree.fs, "ls")
+    assert len(list(memory_tree.rglob("*.parquet"))) == 5
+    num_listings = ls.call_count
+    ls.reset_mock()
+    matches = memory_tree.rglob("*.parquet")
+    assert len(list(islice(matches, 1))) == 1
+    matches.close()
+    assert 0 < ls.call_count < num_listings
+
+
+@pytest.mark.parametrize(
+    "pattern,expected",
+    [
+        (
+            "YEAR=2024/month=0[12]/PART-*.parquet",
+            [
+                "year=2024/month=01/part-0.parquet",
+                "year=2024/month=01/part-1.parquet",
+                "year=2024/month=02/part-0.parquet",
+            ],
+        ),
+        ("year=2024/MONTH=01", ["year=2024/month=01"]),
+        ("**/readme.MD", ["year=2024/README.md"]),
+        ("*/*/_success", ["year=2024/month=02/_SUCCESS"]),
+    ],
+)
+def test_glob_case_insensitive(memory_tree, pattern, expected):
+    result = sorted(
+        p.relative_to(memory_tree).as_posix()
+        for p in memory_tree.glob(pattern, case_sensitive=False)
+    )
+    assert result == expected
+    assert list(memory_tree.glob(pattern, case_sensitive=True)) == []
+
+
+def test_rglob_case_insensitive(memory_tree):
+    matches = memory_tree.rglob("PART-0.*", case_sensitive=False)
+    assert len(list(matches)) == 4
+
+
+def test_full_match_case_sensitive():
+    pth = UPath("memory:///a/B/c.PY")
+    assert pth.full_match("/a/*/*.py", case_sensitive=False)
+    assert not pth.full_match("/a/*/*.py", case_sensitive=True)
+    assert not pth.full_match("/a/*/*.py")
+    assert pth.match("/A/b/*", case_sensitive=False)
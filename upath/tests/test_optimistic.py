@@ -0,0 +1,126 @@
+import pytest
+
+from upath import UPath
+from upath._optimistic import is_optimistic
+
+from .utils import CountingMemoryFileSystem
+
+
+@pytest.fixture
+def fs():
+    return CountingMemoryFileSystem()
+
+
+def make_tree(fs, mocker):
+    base = UPath("memory:///optimistic")
+    mocker.patch.object(type(base), "fs", fs)
+    base.joinpath("a.txt").write_bytes(b"a")
+    base.joinpath("sub").mkdir(parents=True)
+    base.joinpath("sub", "b.txt").write_bytes(b"b")
+    base.joinpath("empty").mkdir()
+    fs.calls.clear()
+    return base
+
+
+@pytest.fixture
+def base(fs, mocker):
+    return make_tree(fs, mocker)
+
+
+def test_optimistic_writes_disabled_by_default():
+    assert not is_optimistic()
+    with UPath.optimistic_writes():
+        assert is_optimistic()
+        with UPath.optimistic_writes(enabled=False):
+            assert not is_optimistic()
+    assert not is_optimistic()
+
+
+@pytest.mark.parametrize(
+    "op",
+    [
+        lambda p: p.joinpath("new.txt").touch(),
+        lambda p: p.joinpath("new.txt").touch(exist_ok=False),
+        lambda p: p.joinpath("a.txt").unlink(),
+        lambda p: p.joinpath("new", "dir").mkdir(parents=True),
+        lambda p: p.joinpath("empty").rmdir(recursive=False),
+    ],
+)
+def test_optimistic_writes_issue_single_request(fs, mocker, op):
+    op(make_tree(fs, mocker))
+    assert len(fs.calls) > 1
+    fs.store.clear()
+    fs.pseudo_dirs[:] = [""]
+    with UPath.optimistic_writes():
+        op(make_tree(fs, mocker))
+    assert len(fs.calls) == 1
+
+
+def test_optimistic_unlink_directory_probes_on_error(fs, mocker):
+    base = make_tree(fs, mocker)
+    with UPath.optimistic_writes():
+        with pytest.raises(IsADirectoryError):
+            base.joinpath("sub").unlink(missing_ok=True)
+    assert [name for name, _ in fs.calls] == ["rm_file", "isdir"]
+    assert base.joinpath("sub", "b.txt").exists()
+
+
+def test_optimistic_touch(base):
+    with UPath.optimistic_writes():
+        base.joinpath("new.txt").touch(exist_ok=False)
+        base.joinpath("a.txt").touch()
+        with pytest.raises(FileExistsError):
+            base.joinpath("a.txt").touch(exist_ok=False)
+    assert base.joinpath("new.txt").read_bytes() == b""
+    assert base.joinpath("a.txt").read_bytes() == b"a"
+
+
+def test_optimistic_touch_updates_existing_file(base, fs, mocker):
+    touch = mocker.spy(fs, "touch")
+    with UPath.optimistic_writes():
+        base.joinpath("a.txt").touch()
+    touch.assert_called_once_with("/optimistic/a.txt", truncate=False)
+    assert base.joinpath("a.txt").read_bytes() == b"a"
+
+
+def test_optimistic_unlink(base):
+    with UPath.optimistic_writes():
+        base.joinpath("a.txt").unlink()
+        with pytest.raises(FileNotFoundError):
+            base.joinpath("a.txt").unlink()
+        base.joinpath("a.txt").unlink(missing_ok=True)
+    assert not base.joinpath("a.txt").exists()
+
+
+def test_optimistic_mkdir(base):
+    with UPath.optimistic_writes():
+        with pytest.raises(FileExistsError):
+            base.joinpath("empty").mkdir()
+        with pytest.raises(FileExistsError):
+            base.joinpath("empty").mkdir(parents=True)
+        with pytest.raises(FileExistsError):
+            base.joinpath("a.txt").mkdir(exist_ok=True)
+        base.joinpath("empty").mkdir(exist_ok=True)
+        base.joinpath("new", "dir").mkdir(parents=True)
+    assert base.joinpath("new", "dir").is_dir()
+
+
+def test_optimistic_rmdir(base):
+    with UPath.optimistic_writes():
+        with pytest.raises(OSError, match="not empty"):
+            base.joinpath("sub").rmdir(recursive=False)
+        with pytest.raises(NotADirectoryError):
+            base.joinpath("missing").rmdir(recursive=False)
+        base.joinpath("empty").rmdir(recursive=False)
+        base.joinpath("sub").rmdir()
+    assert not base.joinpath("empty").exists()
+    assert not base.joinpath("sub").exists()
+
+
+def test_optimistic_writes_invalidate_listing_cache(base):
+    with UPath.listing_cache(), UPath.optimistic_writes():
+        assert not base.joinpath("new.txt").exists()
+        base.joinpath("new.txt").touch()
+        assert base.joinpath("new.txt").exists()
+        base.joinpath("new.txt").unlink()
+        assert not base.joinpath("new.txt").exists()
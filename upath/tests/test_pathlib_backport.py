@@ -117,18 +117,8 @@ def test_signature_match_pathlike(pth):
                 else nullcontext()
             ),
         ),
-        (
-            "file",
-            pytest.warns(
-                UserWarning, match=r".*match\(\): case_sensitive is currently ignored"
-            ),
-        ),
-        (
-            "memory",
-            pytest.warns(
-                UserWarning, match=r".*match\(\): case_sensitive is currently ignored"
-            ),
-        ),
+        ("file", nullcontext()),
+        ("memory", nullcontext()),
     ],
     indirect=["pth"],
 )
@@ -155,18 +145,8 @@ def test_signature_exists_follow_symlinks(pth):
                 else nullcontext()
             ),
         ),
-        (
-            "file",
-            pytest.warns(
-                UserWarning, match=r".*glob\(\): case_sensitive is currently ignored"
-            ),
-        ),
-        (
-            "memory",
-            pytest.warns(
-                UserWarning, match=r".*glob\(\): case_sensitive is currently ignored"
-            ),
-        ),
+        ("file", nullcontext()),
+        ("memory", nullcontext()),
     ],
     indirect=["pth"],
 )
@@ -189,20 +169,8 @@ def test_signature_glob_case_sensitive(pth, ctx):
                 else nullcontext()
             ),
         ),
-        (
-            "file",
-            pytest.warns(
-                UserWarning,
-                match=r".*(glob|rglob)\(\): case_sensitive is currently ignored",
-            ),
-        ),
-        (
-            "memory",
-            pytest.warns(
-                UserWarning,
-                match=r".*(glob|rglob)\(\): case_sensitive is currently ignored",
-            ),
-        ),
+        ("file", nullcontext()),
+        ("memory", nullcontext()),
     ],
     indirect=["pth"],
 )
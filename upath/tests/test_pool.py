@@ -0,0 +1,126 @@
+import io
+import threading
+
+import pytest
+from fsspec.implementations.memory import MemoryFileSystem
+
+from upath import UPath
+from upath._pool import DEFAULT_FILESYSTEM_POOL
+from upath._pool import FileSystemPool
+
+
+class UncachedFileSystem(MemoryFileSystem):
+    """a filesystem that doesn't use fsspec's instance cache"""
+
+    cachable = False
+
+
+class InstanceCacheSkippingFileSystem(MemoryFileSystem):
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault("skip_instance_cache", True)
+        super().__init__(*args, **kwargs)
+
+
+@pytest.fixture
+def pool():
+    return FileSystemPool(maxsize=2)
+
+
+def test_pool_reuses_instances(pool):
+    fs_cls = InstanceCacheSkippingFileSystem
+    fs0 = pool.get(fs_cls, {"skip_instance_cache": True})
+    fs1 = pool.get(fs_cls, {"skip_instance_cache": True})
+    assert fs0 is fs1
+    assert pool.cache_info() == (1, 1, 2, 1)
+
+
+def test_pool_keys_on_storage_options(pool):
+    fs_cls = InstanceCacheSkippingFileSystem
+    fs0 = pool.get(fs_cls, {"skip_instance_cache": True, "a": 1})
+    fs1 = pool.get(fs_cls, {"skip_instance_cache": True, "a": 2})
+    assert fs0 is not fs1
+    assert pool.get(fs_cls, {"a": 1, "skip_instance_cache": True}) is fs0
+
+
+def test_pool_is_bounded(pool):
+    fs_cls = InstanceCacheSkippingFileSystem
+    fs0 = pool.get(fs_cls, {"skip_instance_cache": True, "a": 0})
+    for i in range(1, 3):
+        pool.get(fs_cls, {"skip_instance_cache": True, "a": i})
+    assert pool.cache_info().currsize == 2
+    assert pool.get(fs_cls, {"skip_instance_cache": True, "a": 0}) is not fs0
+
+
+def test_pool_clear(pool):
+    fs_cls = InstanceCacheSkippingFileSystem
+    fs0 = pool.get(fs_cls, {"skip_instance_cache": True})
+    pool.clear()
+    assert pool.cache_info() == (0, 0, 2, 0)
+    assert pool.get(fs_cls, {"skip_instance_cache": True}) is not fs0
+
+
+def test_pool_bypass_uncachable(pool):
+    assert pool.get(UncachedFileSystem, {}) is not pool.get(UncachedFileSystem, {})
+    assert pool.cache_info().currsize == 0
+
+
+def test_pool_bypass_non_plain_storage_options(pool):
+    fs_cls = InstanceCacheSkippingFileSystem
+    so = {"skip_instance_cache": True, "fo": io.BytesIO()}
+    assert pool.get(fs_cls, so) is not pool.get(fs_cls, so)
+    assert pool.cache_info().currsize == 0
+
+
+def test_pool_per_thread(pool):
+    fs_cls = InstanceCacheSkippingFileSystem
+    fs0 = pool.get(fs_cls, {"skip_instance_cache": True})
+    result = []
+    t = threading.Thread(
+        target=lambda: result.append(pool.get(fs_cls, {"skip_instance_cache": True}))
+    )
+    t.start()
+    t.join()
+    assert result[0] is not fs0
+
+
+def test_upath_uses_default_pool():
+    DEFAULT_FILESYSTEM_POOL.clear()
+    p0 = UPath("memory:///a/b.txt", skip_instance_cache=True)
+    p1 = UPath("memory:///c/d.txt", skip_instance_cache=True)
+    assert p0.fs is p1.fs
+    assert DEFAULT_FILESYSTEM_POOL.cache_info().hits == 1
+
+
+def test_pool_per_event_loop(pool):
+    import asyncio
+
+    from fsspec.implementations.http import HTTPFileSystem
+
+    async def get():
+        loop = asyncio.get_running_loop()
+        fs0 = pool.get(HTTPFileSystem, {}, loop=loop)
+        fs1 = pool.get(HTTPFileSystem, {}, loop=loop)
+        assert fs0 is fs1
+        assert fs0.asynchronous
+        return fs0
+
+    assert asyncio.run(get()) is not asyncio.run(get())
+
+
+def test_pool_evicts_instances_of_closed_event_loops(pool):
+    import asyncio
+
+    from fsspec.implementations.http import HTTPFileSystem
+
+    sync_fs = pool.get(InstanceCacheSkippingFileSystem, {"skip_instance_cache": True})
+
+    async def get():
+        fs = pool.get(HTTPFileSystem, {}, loop=asyncio.get_running_loop())
+        await fs.set_session()
+        return fs
+
+    fss = [asyncio.run(get()) for _ in range(3)]
+    assert pool.cache_info().currsize == 1
+    assert all(fs._session.connector.closed for fs in fss)
+    fs = pool.get(InstanceCacheSkippingFileSystem, {"skip_instance_cache": True})
+    assert fs is sync_fs
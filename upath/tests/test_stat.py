@@ -128,3 +128,85 @@ def test_bad_timestamp():
     ):
         s = UPathStatResult([0] * 10, {"ctime": "bad"})
         _ = s.st_ctime
+
+
+def test_stat_columns_from_infos():
+    from upath._stat import UPathStatColumns
+    from upath._stat import UPathStatType
+
+    dt = datetime(1970, 1, 1, 0, 0, 10, tzinfo=timezone.utc)
+    infos = [
+        {"name": "b/a", "size": 1, "type": "file", "LastModified": dt, "ETag": '"x"'},
+        {"name": "b/c", "size": None, "type": "directory"},
+        {"name": "b/d", "size": 3, "type": "other", "mtime": 20},
+        None,
+    ]
+    columns = UPathStatColumns.from_infos(
+        infos, ["b/a", "b/c", "b/d", "b/e"], batch_size=3
+    )
+    assert columns.names == ["b/a", "b/c", "b/d", "b/e"]
+    assert list(columns.sizes) == [1, 0, 3, 0]
+    assert list(columns.mtimes) == [10.0, 0.0, 20.0, 0.0]
+    assert list(columns.types) == [
+        UPathStatType.FILE,
+        UPathStatType.DIRECTORY,
+        UPathStatType.OTHER,
+        UPathStatType.MISSING,
+    ]
+    assert columns.etags == ['"x"', None, None, None]
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        [10, 10.0, None],
+        ["1970-01-01T00:00:10Z", "1970-01-01T00:00:10+00:00", None],
+        [datetime(1970, 1, 1, 0, 0, 10, tzinfo=timezone.utc), None, None],
+        ["19700101000010", 10, None],
+    ],
+)
+def test_stat_columns_mtimes(values):
+    from upath._stat import UPathStatColumns
+    from upath._stat import UPathStatResult
+
+    infos = [{"name": str(i), "mtime": v} for i, v in enumerate(values)]
+    columns = UPathStatColumns.from_infos(infos)
+    expected = [
+        UPathStatResult.from_info(infos[i]).st_mtime if v is not None else 0.0
+        for i, v in enumerate(values)
+    ]
+    assert list(columns.mtimes) == expected
+
+
+def test_stat_columns_as_numpy():
+    np = pytest.importorskip("numpy")
+    from upath._stat import UPathStatColumns
+    from upath._stat import UPathStatType
+
+    infos = [{"name": "a", "size": 2**40, "type": "file", "mtime": 1.5}]
+    arrays = UPathStatColumns.from_infos(infos).as_numpy()
+    assert arrays["names"] == ["a"]
+    assert arrays["sizes"].dtype == np.int64
+    assert arrays["sizes"].tolist() == [2**40]
+    assert arrays["mtimes"].tolist() == [1.5]
+    assert arrays["types"].tolist() == [UPathStatType.FILE]
+
+
+def test_stat_many_concurrent_info(mocker):
+    from upath._stat import UPathStatType
+
+    paths = [upath.UPath(f"memory:///stat_many/file{i}.txt") for i in range(3)]
+    for pth in paths:
+        pth.write_bytes(b"abc")
+    info = mocker.spy(type(paths[0].fs), "info")
+    missing = "memory:///stat_many/missing"
+    columns = upath.UPath.stat_many([*paths, missing], missing_ok=True)
+    assert info.call_count == 4
+    assert list(columns.sizes) == [3, 3, 3, 0]
+    assert columns.types[-1] == UPathStatType.MISSING
+    with upath.UPath.listing_cache():
+        list(paths[0].parent.iterdir())
+        info.reset_mock()
+        upath.UPath.stat_many(paths)
+    assert info.call_count == 0
+    paths[0].parent.rmdir()
@@ -1,8 +1,11 @@
 import operator
 import sys
+from collections import Counter
 from contextlib import contextmanager
+from functools import wraps
 
 import pytest
+from fsspec.implementations.memory import MemoryFileSystem
 from fsspec.utils import get_package_version_without_import
 from packaging.version import Version
 
@@ -142,3 +145,64 @@ class OverrideMeta(type):
                 )
 
         return super().__new__(mcs, name, bases, namespace)
+
+
+class CountingMemoryFileSystem(MemoryFileSystem):
+    """An isolated in-memory filesystem counting calls to its primitives
+
+    Only top-level calls are counted, so i.e. `isdir()` calling `info()`
+    internally counts as a single request. The (method, path) of each
+    counted call is recorded in `calls`.
+    """
+
+    protocol = ("memory",)
+    cachable = False
+    store: dict = {}
+    pseudo_dirs: list = [""]
+
+    COUNTED = (
+        "ls",
+        "info",
+        "exists",
+        "isdir",
+        "isfile",
+        "find",
+        "walk",
+        "glob",
+        "touch",
+        "mkdir",
+        "pipe_file",
+        "rm",
+        "rm_file",
+        "rmdir",
+    )
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.store = {}
+        self.pseudo_dirs = [""]
+        self.counts = Counter()
+        self.calls = []
+        self._depth = 0
+
+    def __getattribute__(self, name):
+        attr = super().__getattribute__(name)
+        if name not in CountingMemoryFileSystem.COUNTED:
+            return attr
+
+        @wraps(attr)
+        def counted(*args, **kwargs):
+            if self._depth == 0:
+                self.counts[name] += 1
+                self.calls.append((name, args[0] if args else kwargs.get("path")))
+            self._depth += 1
+            try:
+                return attr(*args, **kwargs)
+            finally:
+                self._depth -= 1
+
+        return counted
+
+    @property
+    def requests(self) -> int:
+        return sum(self.counts.values())